@@ -1,12 +1,39 @@
+import argparse
+import collections
+import concurrent.futures
+import copy
+import functools
+import glob
+import hashlib
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
 import numpy as np
 import scipy.interpolate
 import scipy.ndimage
+import scipy.sparse
 import skimage.util
 
+# Numba is optional, the numba backend falls back to the default backend if it is not installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Imageio is optional, it is only used by the command line converter to read and write image files other than npy
+try:
+    import imageio
+except ImportError:
+    imageio = None
+
 
 class ImageTransform:
     def __init__(self, center, initialRadius, finalRadius, initialAngle, finalAngle, cartesianImageSize,
-                 polarImageSize):
+                 polarImageSize, radialScale='linear'):
         """Polar and Cartesian Transform Metadata
 
         ImageTransform contains polar and cartesian transform metadata for the conversion between the two domains.
@@ -50,7 +77,16 @@ class ImageTransform:
             Size of cartesian image
         polarImageSize : (2,) :class:`tuple` of :class:`int`
             Size of polar image
+        radialScale : {'linear', 'log'}, optional
+            Spacing of the radii of the rows of the polar image. If 'linear', the radii are evenly spaced from
+            :obj:`initialRadius` to :obj:`finalRadius`. If 'log', :math:`\\log(1 + r)` is evenly spaced instead, so
+            the rows are densest near the center and the spacing grows in proportion to :math:`1 + r`.
+
+            Default is 'linear'
         """
+        if radialScale not in ('linear', 'log'):
+            raise ValueError('Invalid radialScale %s, must be either \'linear\' or \'log\'' % radialScale)
+
         self.center = center
         self.initialRadius = initialRadius
         self.finalRadius = finalRadius
@@ -58,8 +94,17 @@ class ImageTransform:
         self.finalAngle = finalAngle
         self.cartesianImageSize = cartesianImageSize
         self.polarImageSize = polarImageSize
+        self.radialScale = radialScale
+
+        # Sparse interpolation matrices and cartesian masks for the settings, computed on first use
+        self._matrices = {}
+        self._masks = {}
 
-    def convertToPolarImage(self, image, order=3, border='constant', borderVal=0.0):
+        # Coordinate maps loaded with load, used by plans instead of calculating the coordinates
+        self._maps = {}
+
+    def convertToPolarImage(self, image, order=3, border='constant', borderVal=0.0, workers=None, maxMemory=None,
+                            precision='float64', out=None, backend=None):
         """Convert cartesian image to polar image.
 
         Using a cartesian image, this function creates a polar domain image where the first dimension is radius and
@@ -73,12 +118,16 @@ class ImageTransform:
 
         Parameters
         ----------
-        image : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+        image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
             Cartesian image to convert to polar domain
 
+            The image may also be given as spline coefficients from :func:`prefilterImage` to skip the prefiltering
+            step when converting the same image multiple times.
+
             .. note::
-                If an alpha band (4th channel of image is present, then it will be ignored during polar conversion. The
-                resulting polar image will contain four channels but the alpha channel will be all fully on.
+                Each channel of a multichannel image is converted. If an alpha band (4th channel of image) is
+                present, then it will be ignored during polar conversion. The resulting polar image will contain four
+                channels but the alpha channel will be all fully on.
         order : :class:`int` (0-5), optional
             The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
 
@@ -114,16 +163,39 @@ class ImageTransform:
             Value used for polar points outside the cartesian image boundaries if :obj:`border` = 'constant'.
 
             Default is 0.0
+        workers : :class:`int`, optional
+            Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+        maxMemory : :class:`int`, optional
+            Maximum number of bytes of temporary memory used for the conversion, see :func:`convertToPolarImage`.
+
+            If not specified, the entire image is converted at once.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :func:`convertToPolarImage`.
+
+            Default is 'float64'
+        out : (N, M) or (N, M, C) :class:`numpy.ndarray`, optional
+            Array to store the polar image in, such as a :class:`numpy.memmap`, see :func:`convertToPolarImage`.
+
+            If not specified, a new array is allocated.
+        backend : :class:`str`, optional
+            Interpolation backend used for the conversion, see :func:`convertToPolarImage`.
+
+            Default is :obj:`None`
 
         Returns
         -------
-        polarImage : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+        polarImage : (N, M) or (N, M, C) :class:`numpy.ndarray`
             Polar image where first dimension is radii and second dimension is angle
         """
-        image, ptSettings = convertToPolarImage(image, order=order, border=border, borderVal=borderVal, settings=self)
+        image, ptSettings = convertToPolarImage(image, order=order, border=border, borderVal=borderVal, settings=self,
+                                                workers=workers, maxMemory=maxMemory, precision=precision,
+                                                out=out, backend=backend)
         return image
 
-    def convertToCartesianImage(self, image, order=3, border='constant', borderVal=0.0):
+    def convertToCartesianImage(self, image, order=3, border='constant', borderVal=0.0, workers=None,
+                                maxMemory=None, precision='float64', out=None, backend=None, masked=False):
         """Convert polar image to cartesian image.
 
         Using a polar image, this function creates a cartesian image. This function is versatile because it can
@@ -132,12 +204,16 @@ class ImageTransform:
 
         Parameters
         ----------
-        image : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+        image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
             Polar image to convert to cartesian domain
 
+            The image may also be given as spline coefficients from :func:`prefilterImage` to skip the prefiltering
+            step when converting the same image multiple times.
+
             .. note::
-                If an alpha band (4th channel of image is present, then it will be ignored during cartesian conversion.
-                The resulting polar image will contain four channels but the alpha channel will be all fully on.
+                Each channel of a multichannel image is converted. If an alpha band (4th channel of image) is
+                present, then it will be ignored during cartesian conversion. The resulting cartesian image will contain
+                four channels but the alpha channel will be all fully on.
         order : :class:`int` (0-5), optional
             The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
 
@@ -173,10 +249,35 @@ class ImageTransform:
             Value used for polar points outside the cartesian image boundaries if :obj:`border` = 'constant'.
 
             Default is 0.0
+        workers : :class:`int`, optional
+            Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+        maxMemory : :class:`int`, optional
+            Maximum number of bytes of temporary memory used for the conversion, see :func:`convertToCartesianImage`.
+
+            If not specified, the entire image is converted at once.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :func:`convertToCartesianImage`.
+
+            Default is 'float64'
+        out : (N, M) or (N, M, C) :class:`numpy.ndarray`, optional
+            Array to store the cartesian image in, such as a :class:`numpy.memmap`, see :func:`convertToCartesianImage`.
+
+            If not specified, a new array is allocated.
+        backend : :class:`str`, optional
+            Interpolation backend used for the conversion, see :func:`convertToCartesianImage`.
+
+            Default is :obj:`None`
+        masked : :class:`bool`, optional
+            If :obj:`True`, only the cartesian pixels inside the polar image are interpolated, see
+            :func:`convertToCartesianImage`.
+
+            Default is :obj:`False`
 
         Returns
         -------
-        cartesianImage : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+        cartesianImage : (N, M) or (N, M, C) :class:`numpy.ndarray`
             Cartesian image
 
         See Also
@@ -184,9 +285,216 @@ class ImageTransform:
         :meth:`convertToCartesianImage`
         """
         image, ptSettings = convertToCartesianImage(image, order=order, border=border, borderVal=borderVal,
-                                                    settings=self)
+                                                    settings=self, workers=workers, maxMemory=maxMemory,
+                                                    precision=precision, out=out, backend=backend, masked=masked)
         return image
 
+    def convertToPolarStack(self, images, order=3, border='constant', borderVal=0.0, batchSize=None, workers=None,
+                            precision='float64', out=None, backend=None):
+        """Convert stack of cartesian images to polar images.
+
+        The coordinate map is computed once and shared between all images in the stack, such as the frames of a video.
+        See :meth:`convertToPolarImage` for more details on the arguments.
+
+        Parameters
+        ----------
+        images : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+            Stack of cartesian images to convert to polar domain, where the first dimension is the frame
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Polar points outside the cartesian image boundaries are filled according to the given mode.
+
+            Default is 'constant'
+        borderVal : same datatype as :obj:`images`, optional
+            Value used for polar points outside the cartesian image boundaries if :obj:`border` = 'constant'.
+
+            Default is 0.0
+        batchSize : :class:`int`, optional
+            Number of frames converted at once, see :meth:`TransformPlan.executeStack`.
+
+            If not specified, all frames are converted at once, or one at a time for a :class:`numpy.memmap` stack.
+        workers : :class:`int`, optional
+            Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :func:`convertToPolarImage`.
+
+            Default is 'float64'
+        out : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`, optional
+            Array to store the polar images in, such as a :class:`numpy.memmap`, see :func:`convertToPolarStack`.
+
+            If not specified, a new array is allocated.
+        backend : :class:`str`, optional
+            Interpolation backend used for the conversion, see :func:`convertToPolarImage`.
+
+            Default is :obj:`None`
+
+        Returns
+        -------
+        polarImages : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+            Stack of polar images where second dimension is radii and third dimension is angle
+        """
+        images, ptSettings = convertToPolarStack(images, order=order, border=border, borderVal=borderVal,
+                                                 settings=self, batchSize=batchSize, workers=workers,
+                                                 precision=precision, out=out, backend=backend)
+        return images
+
+    def convertToCartesianStack(self, images, order=3, border='constant', borderVal=0.0, batchSize=None,
+                                workers=None, precision='float64', out=None, backend=None, masked=False):
+        """Convert stack of polar images to cartesian images.
+
+        The coordinate map is computed once and shared between all images in the stack, such as the frames of a video.
+        See :meth:`convertToCartesianImage` for more details on the arguments.
+
+        Parameters
+        ----------
+        images : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+            Stack of polar images to convert to cartesian domain, where the first dimension is the frame
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Cartesian points outside the polar image boundaries are filled according to the given mode.
+
+            Default is 'constant'
+        borderVal : same datatype as :obj:`images`, optional
+            Value used for cartesian points outside the polar image boundaries if :obj:`border` = 'constant'.
+
+            Default is 0.0
+        batchSize : :class:`int`, optional
+            Number of frames converted at once, see :meth:`TransformPlan.executeStack`.
+
+            If not specified, all frames are converted at once, or one at a time for a :class:`numpy.memmap` stack.
+        workers : :class:`int`, optional
+            Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :func:`convertToCartesianImage`.
+
+            Default is 'float64'
+        out : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`, optional
+            Array to store the cartesian images in, such as a :class:`numpy.memmap`, see
+            :func:`convertToCartesianStack`.
+
+            If not specified, a new array is allocated.
+        backend : :class:`str`, optional
+            Interpolation backend used for the conversion, see :func:`convertToCartesianImage`.
+
+            Default is :obj:`None`
+        masked : :class:`bool`, optional
+            If :obj:`True`, only the cartesian pixels inside the polar image are interpolated, see
+            :func:`convertToCartesianImage`.
+
+            Default is :obj:`False`
+
+        Returns
+        -------
+        cartesianImages : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+            Stack of cartesian images
+        """
+        images, ptSettings = convertToCartesianStack(images, order=order, border=border, borderVal=borderVal,
+                                                     settings=self, batchSize=batchSize, workers=workers,
+                                                     precision=precision, out=out, backend=backend,
+                                                     masked=masked)
+        return images
+
+    def convertToPolarStream(self, frames, order=3, border='constant', borderVal=0.0, queueSize=2, workers=None,
+                             precision='float64'):
+        """Convert stream of cartesian images to polar images.
+
+        Frames are read from :obj:`frames` and converted in the background while the previous polar frames are being
+        used, see :meth:`TransformPlan.executeStream`. This is useful for frames that are decoded or acquired one at a
+        time, such as a video or live acquisition. See :meth:`convertToPolarImage` for more details on the arguments.
+
+        .. note::
+            The polar frames are stored in output buffers that are reused. Each polar frame is only valid until the next
+            frame is requested, so copy it if it needs to be kept.
+
+        Parameters
+        ----------
+        frames : iterable of (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Cartesian images to convert to polar domain
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Polar points outside the cartesian image boundaries are filled according to the given mode.
+
+            Default is 'constant'
+        borderVal : same datatype as :obj:`frames`, optional
+            Value used for polar points outside the cartesian image boundaries if :obj:`border` = 'constant'.
+
+            Default is 0.0
+        queueSize : :class:`int`, optional
+            Maximum number of frames waiting between each stage, see :meth:`TransformPlan.executeStream`.
+
+            Default is 2
+        workers : :class:`int`, optional
+            Number of threads used for the conversion of each frame, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :func:`convertToPolarImage`.
+
+            Default is 'float64'
+
+        Returns
+        -------
+        polarFrames : generator of (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Polar images in the same order as :obj:`frames`, where first dimension is radii and second dimension is
+            angle
+        """
+        plan = self.createPolarPlan(order=order, border=border, borderVal=borderVal, precision=precision)
+        return plan.executeStream(frames, queueSize=queueSize, workers=workers)
+
+    def convertToCartesianStream(self, frames, order=3, border='constant', borderVal=0.0, queueSize=2, workers=None,
+                                 precision='float64'):
+        """Convert stream of polar images to cartesian images.
+
+        Frames are read from :obj:`frames` and converted in the background while the previous cartesian frames are
+        being used, see :meth:`TransformPlan.executeStream`. See :meth:`convertToCartesianImage` for more details on the
+        arguments.
+
+        .. note::
+            The cartesian frames are stored in output buffers that are reused. Each cartesian frame is only valid until
+            the next frame is requested, so copy it if it needs to be kept.
+
+        Parameters
+        ----------
+        frames : iterable of (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Polar images to convert to cartesian domain
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Cartesian points outside the polar image boundaries are filled according to the given mode.
+
+            Default is 'constant'
+        borderVal : same datatype as :obj:`frames`, optional
+            Value used for cartesian points outside the polar image boundaries if :obj:`border` = 'constant'.
+
+            Default is 0.0
+        queueSize : :class:`int`, optional
+            Maximum number of frames waiting between each stage, see :meth:`TransformPlan.executeStream`.
+
+            Default is 2
+        workers : :class:`int`, optional
+            Number of threads used for the conversion of each frame, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :func:`convertToCartesianImage`.
+
+            Default is 'float64'
+
+        Returns
+        -------
+        cartesianFrames : generator of (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Cartesian images in the same order as :obj:`frames`
+        """
+        plan = self.createCartesianPlan(order=order, border=border, borderVal=borderVal, precision=precision)
+        return plan.executeStream(frames, queueSize=queueSize, workers=workers)
+
     def getPolarPointsImage(self, points):
         """Convert list of cartesian points from image to polar image points based on transform metadata
 
@@ -242,144 +550,2695 @@ class ImageTransform:
         """
         return getCartesianPointsImage(points, self)
 
-    def __repr__(self):
-        return 'ImageTransform(center=%s, initialRadius=%i, finalRadius=%i, initialAngle=%f, finalAngle=%f, ' \
-               'cartesianImageSize=%s, polarImageSize=%s)' % (
-                   self.center, self.initialRadius, self.finalRadius, self.initialAngle, self.finalAngle,
-                   self.cartesianImageSize, self.polarImageSize)
+    def createPolarPlan(self, order=3, border='constant', borderVal=0.0, dtype=None, precision='float64',
+                        backend=None):
+        """Create a reusable plan for converting cartesian images to polar images
 
-    def __str__(self):
-        return self.__repr__()
+        The plan computes the coordinate map once from the transform metadata so that repeated conversions, such as
+        the frames of a video, only need to perform the interpolation.
 
+        Parameters
+        ----------
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. See :meth:`convertToPolarImage` for more details.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Polar points outside the cartesian image boundaries are filled according to the given mode.
+            See :meth:`convertToPolarImage` for more details.
+        borderVal : same datatype as :obj:`image`, optional
+            Value used for polar points outside the cartesian image boundaries if :obj:`border` = 'constant'.
+        dtype : :class:`numpy.dtype`, optional
+            Datatype of the polar image. If not specified, the polar image has the same datatype as the input image.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see :meth:`convertToPolarImage`.
+        backend : :class:`str`, optional
+            Interpolation backend used by the plan, see :func:`convertToPolarImage`.
 
-def getCartesianPoints(rTheta, center):
-    """Convert list of polar points to cartesian points
+        Returns
+        -------
+        plan : :class:`TransformPlan`
+            Plan for converting cartesian images to polar images
 
-    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+        See Also
+        --------
+        :class:`TransformPlan`, :meth:`createCartesianPlan`
+        """
+        return TransformPlan(self, 'polar', order=order, border=border, borderVal=borderVal, dtype=dtype,
+                             precision=precision, backend=backend)
 
-    Parameters
-    ----------
-    rTheta : (N, 2) or (2,) :class:`numpy.ndarray`
-        List of cartesian points to convert to polar domain
+    def createCartesianPlan(self, order=3, border='constant', borderVal=0.0, dtype=None, precision='float64',
+                            backend=None, masked=False):
+        """Create a reusable plan for converting polar images to cartesian images
 
-        First column is r and second column is theta
-    center : (2,) :class:`numpy.ndarray`
-        Center to use for conversion to cartesian domain of polar points
+        The plan computes the coordinate map once from the transform metadata so that repeated conversions, such as
+        the frames of a video, only need to perform the interpolation.
 
-        Format of center is (x, y)
+        Parameters
+        ----------
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. See :meth:`convertToCartesianImage` for more details.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Cartesian points outside the polar image boundaries are filled according to the given mode.
+            See :meth:`convertToCartesianImage` for more details.
+        borderVal : same datatype as :obj:`image`, optional
+            Value used for cartesian points outside the polar image boundaries if :obj:`border` = 'constant'.
+        dtype : :class:`numpy.dtype`, optional
+            Datatype of the cartesian image. If not specified, the cartesian image has the same datatype as the input
+            image.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients, see
+            :meth:`convertToCartesianImage`.
+        backend : :class:`str`, optional
+            Interpolation backend used by the plan, see :func:`convertToCartesianImage`.
+        masked : :class:`bool`, optional
+            If :obj:`True`, only the cartesian pixels inside the polar image are interpolated, see
+            :func:`convertToCartesianImage`.
 
-    Returns
-    -------
-    cartesianPoints : (N, 2) :class:`numpy.ndarray`
-        Corresponding cartesian points from cartesian :obj:`rTheta`
+        Returns
+        -------
+        plan : :class:`TransformPlan`
+            Plan for converting polar images to cartesian images
 
-        First column is x and second column is y
+        See Also
+        --------
+        :class:`TransformPlan`, :meth:`createPolarPlan`
+        """
+        return TransformPlan(self, 'cartesian', order=order, border=border, borderVal=borderVal, dtype=dtype,
+                             precision=precision, backend=backend, masked=masked)
 
-    See Also
-    --------
-    :meth:`getCartesianPoints2`
-    """
-    if rTheta.ndim == 2:
-        x = rTheta[:, 0] * np.cos(rTheta[:, 1]) + center[0]
-        y = rTheta[:, 0] * np.sin(rTheta[:, 1]) + center[1]
-    else:
-        x = rTheta[0] * np.cos(rTheta[1]) + center[0]
-        y = rTheta[0] * np.sin(rTheta[1]) + center[1]
+    def getCartesianMask(self):
+        """Mask of the cartesian pixels that lie inside the polar image
 
-    return np.array([x, y]).T
+        Cartesian pixels outside :obj:`finalRadius`, inside :obj:`initialRadius` or outside the range of angles are
+        filled with :obj:`borderVal` by the 'constant' border rather than interpolated from the polar image. The edge
+        pixels of the polar image are extended by 3 pixels for the 'constant' border, so the mask includes the
+        cartesian pixels within 3 polar pixels of the polar image as well.
 
+        The mask is computed once and cached, so calling this again with the same settings returns the same array. The
+        array is read-only. See :func:`convertToCartesianImage` for converting only the pixels inside the mask.
 
-def getCartesianPoints2(r, theta, center):
-    """Convert list of polar points to cartesian points
+        Returns
+        -------
+        mask : (N, M) :class:`numpy.ndarray` of :class:`bool`
+            :obj:`True` for each pixel of the cartesian image that is inside the polar image
+        """
+        return _getSettingsMask(self, 'float64')
 
-    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+    def getPolarMatrix(self, order=1, border='constant', precision='float64'):
+        """Sparse matrix that converts cartesian images to polar images
 
-    Parameters
-    ----------
-    r : (N,) :class:`numpy.ndarray`
-        List of polar r points to convert to cartesian domain
-    theta : (N,) :class:`numpy.ndarray`
-        List of polar theta points to convert to cartesian domain
-    center : (2,) :class:`numpy.ndarray`
-        Center to use for conversion to cartesian domain of polar points
+        For nearest neighbor and bilinear interpolation, the conversion is a linear operator with at most 4 nonzero
+        weights for each polar pixel. The matrix is computed once and cached, so calling this again with the same
+        settings and arguments returns the same matrix. See :meth:`TransformPlan.getMatrix` for more details.
 
-        Format of center is (x, y)
+        Parameters
+        ----------
+        order : {0, 1}, optional
+            The order of the interpolation, 0 for nearest neighbor and 1 for bilinear.
 
-    Returns
-    -------
-    x : (N,) :class:`numpy.ndarray`
-        Corresponding x points from polar :obj:`r` and :obj:`theta`
-    y : (N,) :class:`numpy.ndarray`
-        Corresponding y points from polar :obj:`r` and :obj:`theta`
+            Default is 1
+        border : {'constant', 'nearest'}, optional
+            Polar points outside the cartesian image boundaries are filled according to the given mode.
+            See :meth:`convertToPolarImage` for more details.
 
-    See Also
-    --------
-    :meth:`getCartesianPoints`
-    """
-    x = r * np.cos(theta) + center[0]
-    y = r * np.sin(theta) + center[1]
+            Default is 'constant'
+        precision : {'float64', 'float32'}, optional
+            Floating point datatype of the weights of the matrix.
 
-    return x, y
+            Default is 'float64'
 
+        Returns
+        -------
+        matrix : :class:`scipy.sparse.csr_matrix`
+            Matrix with one row for each pixel of the polar image and one column for each pixel of the cartesian image
 
-def getPolarPoints(xy, center):
-    """Convert list of cartesian points to polar points
-    
-    The returned points are not rounded to the nearest point. User must do that by hand if desired.
-    
-    Parameters
-    ----------
-    xy : (N, 2) or (2,) :class:`numpy.ndarray`
-        List of cartesian points to convert to polar domain
+        See Also
+        --------
+        :meth:`getCartesianMatrix`, :meth:`TransformPlan.executeMatrix`
+        """
+        return _getSettingsMatrix(self, 'polar', order, border, precision)
 
-        First column is x and second column is y
-    center : (2,) :class:`numpy.ndarray`
-        Center to use for conversion to polar domain of cartesian points
-        
-        Format of center is (x, y)
+    def getCartesianMatrix(self, order=1, border='constant', precision='float64'):
+        """Sparse matrix that converts polar images to cartesian images
 
-    Returns
-    -------
-    polarPoints : (N, 2) :class:`numpy.ndarray`
-        Corresponding polar points from cartesian :obj:`xy`
-        
-        First column is r and second column is theta
-        
-    See Also
-    --------
-    :meth:`getPolarPoints2`
-    """
-    if xy.ndim == 2:
-        cX, cY = xy[:, 0] - center[0], xy[:, 1] - center[1]
-    else:
-        cX, cY = xy[0] - center[0], xy[1] - center[1]
+        See :meth:`getPolarMatrix` for more details.
 
-    r = np.sqrt(cX ** 2 + cY ** 2)
-    theta = np.arctan2(cY, cX)
+        Parameters
+        ----------
+        order : {0, 1}, optional
+            The order of the interpolation, 0 for nearest neighbor and 1 for bilinear.
 
-    # Make range of theta 0 -> 2pi instead of -pi -> pi
-    # According to StackOverflow, this is the fastest method:
-    # https://stackoverflow.com/questions/37358016/numpy-converting-range-of-angles-from-pi-pi-to-0-2pi
-    theta = np.where(theta < 0, theta + 2 * np.pi, theta)
+            Default is 1
+        border : {'constant', 'nearest'}, optional
+            Cartesian points outside the polar image boundaries are filled according to the given mode.
+            See :meth:`convertToCartesianImage` for more details.
 
-    return np.array([r, theta]).T
+            Default is 'constant'
+        precision : {'float64', 'float32'}, optional
+            Floating point datatype of the weights of the matrix.
 
+            Default is 'float64'
 
-def getPolarPoints2(x, y, center):
-    """Convert list of cartesian points to polar points
+        Returns
+        -------
+        matrix : :class:`scipy.sparse.csr_matrix`
+            Matrix with one row for each pixel of the cartesian image and one column for each pixel of the polar image
 
-    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+        See Also
+        --------
+        :meth:`getPolarMatrix`, :meth:`TransformPlan.executeMatrix`
+        """
+        return _getSettingsMatrix(self, 'cartesian', order, border, precision)
 
-    Parameters
-    ----------
-    x : (N,) :class:`numpy.ndarray`
-        List of cartesian x points to convert to polar domain
-    y : (N,) :class:`numpy.ndarray`
-        List of cartesian y points to convert to polar domain
-    center : (2,) :class:`numpy.ndarray`
-        Center to use for conversion to polar domain of cartesian points
+    def save(self, path, precision='float64'):
+        """Save the settings and coordinate maps to a directory
 
-        Format of center is (x, y)
+        The polar and cartesian coordinate maps are computed and stored as uncompressed ``.npy`` files next to a
+        ``transform.json`` file with the settings, so that :meth:`load` can memory-map them. Worker processes that load
+        the same directory share the maps through the page cache rather than each computing them.
+
+        The directory is created if it does not exist and any previously saved transform in it is replaced. Each file
+        is written to a temporary file first and then moved into place, and ``transform.json`` is written last.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            Directory to save the transform to
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate maps. The maps are only used by conversions with the same
+            precision, see :func:`convertToPolarImage`.
+
+            Default is 'float64'
+
+        See Also
+        --------
+        :meth:`load`
+        """
+        dtype = _getPrecisionDtype(precision)
+        os.makedirs(path, exist_ok=True)
+
+        maps = {}
+        for direction, getCoordinates in (('polar', _getPolarImageCoordinates),
+                                          ('cartesian', _getCartesianImageCoordinates)):
+            coordinates = getCoordinates(self, dtype=dtype)
+            name = '%sCoordinates.npy' % direction
+            maps[direction] = {'file': name, 'shape': list(coordinates.shape), 'dtype': dtype.name}
+
+            temporaryFile = os.path.join(path, '%s.%i.tmp' % (name, os.getpid()))
+            with open(temporaryFile, 'wb') as file:
+                np.save(file, coordinates)
+
+            os.replace(temporaryFile, os.path.join(path, name))
+
+        settings = _getSettingsDict(self)
+        metadata = {'format': _transformFormat, 'hash': _getSettingsHash(settings, maps), 'settings': settings,
+                    'maps': maps}
+
+        temporaryFile = os.path.join(path, 'transform.json.%i.tmp' % os.getpid())
+        with open(temporaryFile, 'w') as file:
+            json.dump(metadata, file, indent=1, sort_keys=True)
+
+        os.replace(temporaryFile, os.path.join(path, 'transform.json'))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load settings and coordinate maps saved with :meth:`save`
+
+        Plans created from the loaded settings, including the plans of :meth:`convertToPolarImage` and
+        :meth:`convertToCartesianImage`, use the saved coordinate maps instead of calculating them. Maps that do not
+        need to be offset for the padding of the interpolation, which is the case for an order of 0 or 1 with the
+        'constant' or 'nearest' border, are used without copying them.
+
+        The file format version and a hash of the settings and maps are checked, so directories saved by another
+        version of the file format, or where the files do not match each other, are rejected.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            Directory the transform was saved to
+        mmap : :class:`bool`, optional
+            If :obj:`True`, the coordinate maps are memory-mapped read-only rather than read into memory, so loading
+            takes almost no time and the pages are only read when the maps are used.
+
+            Default is :obj:`True`
+
+        Returns
+        -------
+        settings : :class:`ImageTransform`
+            Loaded settings
+
+        Raises
+        ------
+        ValueError
+            If the saved transform has another file format version, or its hash or maps do not match the settings
+
+        See Also
+        --------
+        :meth:`save`
+        """
+        with open(os.path.join(path, 'transform.json'), 'r') as file:
+            metadata = json.load(file)
+
+        if metadata.get('format') != _transformFormat:
+            raise ValueError('Transform in %s has file format %s but expected format %s, save it again' %
+                             (path, metadata.get('format'), _transformFormat))
+
+        settings, maps = metadata['settings'], metadata['maps']
+        if metadata.get('hash') != _getSettingsHash(settings, maps):
+            raise ValueError('Transform in %s does not match its hash, save it again' % path)
+
+        transform = cls(np.array(settings['center']), settings['initialRadius'], settings['finalRadius'],
+                        settings['initialAngle'], settings['finalAngle'], tuple(settings['cartesianImageSize']),
+                        tuple(settings['polarImageSize']), settings['radialScale'])
+
+        for direction, info in maps.items():
+            coordinates = np.load(os.path.join(path, info['file']), mmap_mode='r' if mmap else None)
+
+            # Maps are shared with every plan of the settings, so prevent them from being modified
+            coordinates.flags.writeable = False
+
+            if list(coordinates.shape) != info['shape'] or coordinates.dtype != np.dtype(info['dtype']):
+                raise ValueError('Coordinate map %s in %s has shape %s and datatype %s but expected shape %s and '
+                                 'datatype %s, save it again' % (info['file'], path, coordinates.shape,
+                                                                 coordinates.dtype, tuple(info['shape']),
+                                                                 info['dtype']))
+
+            transform._maps[_getMapKey(transform, direction, coordinates.dtype)] = coordinates
+
+        return transform
+
+    def __repr__(self):
+        return 'ImageTransform(center=%s, initialRadius=%i, finalRadius=%i, initialAngle=%f, finalAngle=%f, ' \
+               'cartesianImageSize=%s, polarImageSize=%s, radialScale=%s)' % (
+                   self.center, self.initialRadius, self.finalRadius, self.initialAngle, self.finalAngle,
+                   self.cartesianImageSize, self.polarImageSize, self.radialScale)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class TransformPlan:
+    def __init__(self, settings, direction='polar', order=3, border='constant', borderVal=0.0, dtype=None,
+                 precision='float64', backend=None, masked=False):
+        """Precomputed plan for converting images between the polar and cartesian domain
+
+        TransformPlan computes the coordinate map for the given transform metadata once and keeps it along with an
+        output buffer. Converting an image with :meth:`execute` then only performs the interpolation, which is useful
+        when many images, such as the frames of a video, share the same transform.
+
+        Polar plans only read the bounding box of the annular sector given by the radii and angles of the settings,
+        plus the margin needed for interpolation. When only part of the image is converted, such as a narrow range of
+        radii and angles, the rest of the image is neither padded nor prefiltered. For an order greater than 1, the
+        spline coefficients of the bounding box differ from those of the entire image by less than the precision of
+        float64, see :func:`_convertTiled`. Images with another size than the plan was created for are converted
+        without cropping.
+
+        .. note::
+            The plan takes a copy of :obj:`settings` when it is created. Changes made to :obj:`settings` afterwards
+            are not reflected in the plan, so a new plan must be created instead.
+
+        Parameters
+        ----------
+        settings : :class:`ImageTransform`
+            Contains metadata for conversion between polar and cartesian image.
+        direction : {'polar', 'cartesian'}, optional
+            Domain that images are converted to. If 'polar', cartesian images are converted to polar images, otherwise
+            polar images are converted to cartesian images.
+
+            Default is 'polar'
+        order : :class:`int` (0-5), optional
+            The order of the spline interpolation, default is 3. See :func:`convertToPolarImage` for more details.
+        border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+            Points outside the source image boundaries are filled according to the given mode. See
+            :func:`convertToPolarImage` for more details.
+
+            Default is 'constant'
+        borderVal : same datatype as :obj:`image`, optional
+            Value used for points outside the source image boundaries if :obj:`border` = 'constant'.
+
+            Default is 0.0
+        dtype : :class:`numpy.dtype`, optional
+            Datatype of the output image. If not specified, the output image has the same datatype as the input image.
+        precision : {'float64', 'float32'}, optional
+            Floating point precision of the coordinate map and spline coefficients. See :func:`convertToPolarImage`
+            for more details.
+
+            Default is 'float64'
+        backend : :class:`str`, optional
+            Name of the interpolation backend used to convert images, see :func:`convertToPolarImage` for the
+            available backends.
+
+            Default is :obj:`None`, which selects a backend based on the order, border and datatype of each image
+        masked : :class:`bool`, optional
+            If :obj:`True`, only the pixels of the cartesian image inside the polar image are interpolated and the
+            remaining pixels are filled with :obj:`borderVal`, see :meth:`ImageTransform.getCartesianMask`. Only
+            available for the 'cartesian' direction.
+
+            Default is :obj:`False`
+
+        See Also
+        --------
+        :meth:`ImageTransform.createPolarPlan`, :meth:`ImageTransform.createCartesianPlan`
+        """
+        if direction not in ('polar', 'cartesian'):
+            raise ValueError('Invalid direction %s, must be either \'polar\' or \'cartesian\'' % direction)
+
+        if masked and direction != 'cartesian':
+            raise ValueError('Masked conversion is only available for the \'cartesian\' direction')
+
+        _getPrecisionDtype(precision)
+        _checkBackend(backend)
+
+        self.settings = _copySettings(settings)
+        self.direction = direction
+        self.order = order
+        self.border = border
+        self.borderVal = borderVal
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.precision = precision
+        self.backend = backend
+        self.masked = masked
+
+        # Size of the images that are converted by the plan (input) and the size of the resulting images (output)
+        if direction == 'polar':
+            self.inputSize = tuple(self.settings.cartesianImageSize)
+            self.outputSize = tuple(self.settings.polarImageSize)
+        else:
+            self.inputSize = tuple(self.settings.polarImageSize)
+            self.outputSize = tuple(self.settings.cartesianImageSize)
+
+        # Coordinate map, computed on first use since backends that calculate the coordinates as they go never need it
+        self._coordinates = None
+
+        # Output buffer that is reused between calls to execute, allocated on first use
+        self._output = None
+
+        # Source indices and weights for nearest neighbor and bilinear interpolation, computed on first use
+        self._gatherTable = None
+
+        # Fixed point bilinear weights for each integer datatype, computed on first use
+        self._fixedPointWeights = {}
+
+        # Sparse interpolation matrix of the cropped input image, computed on first use
+        self._matrix = None
+
+        # Range of rows and columns of the padded input image that is read, or None if the entire image is read
+        self._cropBounds = self._getCropBounds()
+
+        # Plan without cropping for images that do not have the input size, created on first use
+        self._uncroppedPlan = None
+
+        # Output pixels that are interpolated, which is shared with the settings so that every masked plan for the
+        # settings uses the same mask
+        self._mask = _getSettingsMask(settings, precision) if masked else None
+        self._maskCount = int(np.count_nonzero(self._mask)) if masked else None
+
+    @property
+    def nbytes(self):
+        """Number of bytes used by the coordinate map, interpolation tables, matrix, mask and output buffer"""
+        nbytes = 0 if self._coordinates is None else self._coordinates.nbytes
+
+        if self._mask is not None:
+            nbytes += self._mask.nbytes
+
+        if self._output is not None:
+            nbytes += self._output.nbytes
+
+        if self._gatherTable is not None:
+            nbytes += sum(array.nbytes for array in self._gatherTable if isinstance(array, np.ndarray))
+
+        nbytes += sum(weights.nbytes for weights in self._fixedPointWeights.values())
+
+        if self._matrix is not None:
+            nbytes += self._matrix.data.nbytes + self._matrix.indices.nbytes + self._matrix.indptr.nbytes
+
+        if self._uncroppedPlan is not None:
+            nbytes += self._uncroppedPlan.nbytes
+
+        return nbytes
+
+    def execute(self, image, out=None, workers=None):
+        """Convert image using the precomputed coordinate map
+
+        Parameters
+        ----------
+        image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
+            Image to convert, either cartesian or polar depending on the direction of the plan
+
+            The image may also be given as spline coefficients from :func:`prefilterImage` to skip the prefiltering
+            step. The coefficients must be created with the same order and border as the plan.
+
+            .. note::
+                Each channel of a multichannel image is converted. If an alpha band (4th channel of image is present,
+                then it will be ignored during conversion. The resulting image will contain four channels but the alpha
+                channel will be all fully on.
+        out : :class:`numpy.ndarray`, optional
+            Array to store the converted image in. Must have the output size of the plan and the same number of
+            channels as the converted image.
+
+            If not specified, the converted image is stored in an output buffer owned by the plan. This buffer is
+            reused and overwritten by subsequent calls, so copy the result if it needs to be kept.
+        workers : :class:`int`, optional
+            Number of threads used for the conversion, see :func:`setNumWorkers`. The result is the same for any
+            number of workers.
+
+            If not specified, the module default is used.
+
+        Returns
+        -------
+        image : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Converted image
+        """
+        # The crop bounds only apply to images with the input size of the plan
+        if self._cropBounds is not None and tuple(image.shape[:2]) != self.inputSize:
+            return self._getUncroppedPlan().execute(image, out=out, workers=workers)
+
+        # Determines whether there are multiple bands or channels in image by checking for 3rd dimension
+        isMultiChannel = image.ndim == 3
+        workers = _resolveWorkers(workers)
+
+        outputShape, outputDtype = self._getOutputShape(image), self._getOutputDtype(image)
+
+        if out is None:
+            # Reuse the output buffer of the plan if it matches the shape and datatype
+            if self._output is None or self._output.shape != outputShape or self._output.dtype != outputDtype:
+                self._output = np.empty(outputShape, dtype=outputDtype)
+
+            out = self._output
+        elif out.shape != outputShape:
+            raise ValueError('Output array has shape %s but expected shape %s' % (out.shape, outputShape))
+
+        # Retrieve the image, storing the result directly in the output array
+        self._interpolate(self._prefilter(image, workers), out, workers)
+
+        # If there are 4 bands, then assume the 4th band is alpha
+        # We do not want to interpolate the transparency so we just make it all fully opaque
+        if isMultiChannel and image.shape[2] == 4:
+            imin, imax = skimage.util.dtype_limits(out, False)
+            out[:, :, 3] = imax
+
+        return out
+
+    def executeStack(self, images, out=None, batchSize=None, workers=None):
+        """Convert stack of images, such as the frames of a video, using the precomputed coordinate map
+
+        The frames of each batch are converted together as if they were the channels of one image, so the padding,
+        prefiltering and interpolation tables are shared between frames.
+
+        Parameters
+        ----------
+        images : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+            Stack of images to convert, where the first dimension is the frame
+
+            .. note::
+                If an alpha band (4th channel of image is present, then it will be ignored during conversion. The
+                resulting images will contain four channels but the alpha channel will be all fully on.
+        out : :class:`numpy.ndarray`, optional
+            Array to store the converted images in. Must have the same number of frames as :obj:`images` and the
+            output size of the plan. This may be a :class:`numpy.memmap`, each batch is written to it as soon as it is
+            converted.
+
+            If not specified, a new array is allocated.
+        batchSize : :class:`int`, optional
+            Number of frames converted at once. Temporary memory used during conversion is proportional to the batch
+            size, so this can be set to limit the memory used for large stacks.
+
+            If not specified, all frames are converted at once. For a :class:`numpy.memmap` stack, the frames are
+            converted one at a time instead so that only one frame of the stack is read into memory at a time.
+        workers : :class:`int`, optional
+            Number of threads used for the conversion, see :func:`setNumWorkers`. The frames and channels of each
+            batch are split between the workers. The result is the same for any number of workers.
+
+            If not specified, the module default is used.
+
+        Returns
+        -------
+        images : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+            Stack of converted images
+        """
+        images = np.asanyarray(images)
+
+        # The crop bounds only apply to images with the input size of the plan
+        if self._cropBounds is not None and images.shape[1:3] != self.inputSize:
+            return self._getUncroppedPlan().executeStack(images, out=out, batchSize=batchSize, workers=workers)
+
+        workers = _resolveWorkers(workers)
+        frameShape = images.shape[1:]
+
+        outputShape = (images.shape[0],) + self.outputSize + frameShape[2:3]
+        outputDtype = images.dtype if self.dtype is None else self.dtype
+
+        if out is None:
+            out = np.empty(outputShape, dtype=outputDtype)
+        elif out.shape != outputShape:
+            raise ValueError('Output array has shape %s but expected shape %s' % (out.shape, outputShape))
+
+        if batchSize is None:
+            batchSize = 1 if isinstance(images, np.memmap) else max(images.shape[0], 1)
+
+        for start in range(0, images.shape[0], batchSize):
+            batch = images[start:start + batchSize]
+
+            # Move the frames into the channel dimension so that the batch is converted like one multichannel image
+            frames = np.moveaxis(batch, 0, 2).reshape(frameShape[:2] + (-1,))
+            result = np.empty(self.outputSize + frames.shape[2:], dtype=outputDtype)
+            self._interpolate(self._prefilter(frames, workers), result, workers)
+
+            out[start:start + batch.shape[0]] = np.moveaxis(result.reshape(self.outputSize + batch.shape[:1] +
+                                                                           frameShape[2:]), 2, 0)
+
+        # If there are 4 bands, then assume the 4th band is alpha
+        # We do not want to interpolate the transparency so we just make it all fully opaque
+        if len(frameShape) == 3 and frameShape[2] == 4:
+            imin, imax = skimage.util.dtype_limits(out, False)
+            out[..., 3] = imax
+
+        return out
+
+    def executeStream(self, frames, queueSize=2, workers=None):
+        """Convert stream of images in the background using the precomputed coordinate map
+
+        The conversion is split into three stages that run at the same time. A reader thread takes frames from
+        :obj:`frames`, so any decoding done by the iterable happens in the background. A converter thread converts the
+        frames into output buffers. The caller consumes the converted frames from the returned generator.
+
+        The stages are connected by queues that hold at most :obj:`queueSize` frames. When the caller falls behind,
+        the queues fill up and the earlier stages wait, so no more than a few frames are ever held in memory. The
+        converted frames are yielded in the same order as :obj:`frames`.
+
+        .. note::
+            The converted frames are stored in a pool of :obj:`queueSize` + 2 output buffers that are reused. Each
+            converted frame is only valid until the next frame is requested from the generator, so copy it if it needs
+            to be kept.
+
+        Any exception raised while reading or converting a frame is raised by the generator after the frames before
+        it have been yielded. Closing the generator early stops the background threads once they finish the frame
+        they are working on.
+
+        Parameters
+        ----------
+        frames : iterable of (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Images to convert, either cartesian or polar depending on the direction of the plan. Spline coefficients
+            from :func:`prefilterImage` may also be given.
+        queueSize : :class:`int`, optional
+            Maximum number of frames waiting between each stage, default is 2. Larger queues smooth out variations in
+            the time taken by each stage at the cost of more memory.
+        workers : :class:`int`, optional
+            Number of threads used for the conversion of each frame, see :func:`setNumWorkers`.
+
+            If not specified, the module default is used.
+
+        Returns
+        -------
+        images : generator of (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Converted images in the same order as :obj:`frames`
+        """
+        if queueSize < 1:
+            raise ValueError('Queue size must be at least 1')
+
+        return _FrameStream(self, frames, queueSize, _resolveWorkers(workers)).results()
+
+    def getMatrix(self):
+        """Sparse matrix of the conversion for nearest neighbor and bilinear interpolation
+
+        Each row of the matrix contains the interpolation weights of one output pixel, and each column is one pixel of
+        the input image, both in row-major order. Converting an image is then a sparse matrix product of the matrix
+        with the flattened image, and all channels or frames of a batch are converted with one product by placing them
+        in the columns of the image. The transpose of the matrix is the adjoint of the conversion.
+
+        The matrix is computed on first use and kept with the plan.
+
+        .. note::
+            The matrix is a linear operator, so output points outside the input image are zero rather than
+            :obj:`borderVal`. The result is the same as :meth:`execute` up to floating point rounding, before the
+            values are rounded for integer images.
+
+        Returns
+        -------
+        matrix : :class:`scipy.sparse.csr_matrix`
+            Matrix with one row for each pixel of the output image and one column for each pixel of the input image
+
+        Raises
+        ------
+        ValueError
+            If the order of the plan is greater than 1, or the border is not 'constant' or 'nearest'
+        """
+        matrix = self._getMatrix()
+        if self._cropBounds is None and self._mask is None:
+            return matrix
+
+        indices, indptr = matrix.indices, matrix.indptr
+
+        # Map the columns from the pixels of the cropped image to the pixels of the input image. The mapping keeps the
+        # row-major order, so the column indices of each row stay sorted.
+        if self._cropBounds is not None:
+            (top, bottom), (left, right) = self._cropBounds
+            rows, columns = np.divmod(indices, right - left)
+            indices = (rows + top) * self.inputSize[1] + columns + left
+
+        # Add empty rows for the output pixels outside the mask
+        if self._mask is not None:
+            counts = np.zeros(self._mask.size, dtype=indptr.dtype)
+            counts[self._mask.ravel()] = np.diff(indptr)
+            indptr = np.concatenate(([0], np.cumsum(counts)))
+
+        return scipy.sparse.csr_matrix((matrix.data, indices, indptr), shape=(self.outputSize[0] * self.outputSize[1],
+                                                                              self.inputSize[0] * self.inputSize[1]))
+
+    def executeMatrix(self, image, adjoint=False):
+        """Convert image using the sparse matrix of the plan
+
+        See :meth:`getMatrix` for more details.
+
+        Parameters
+        ----------
+        image : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Image to convert, where the last dimension holds any number of channels or frames that are converted with
+            one sparse matrix product
+        adjoint : :class:`bool`, optional
+            If :obj:`True`, apply the adjoint of the conversion instead, which maps images of the output size of the
+            plan to images of the input size. This is the transpose of the matrix.
+
+            Default is :obj:`False`
+
+        Returns
+        -------
+        image : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Converted image, the values are not rounded or cast to the datatype of :obj:`image`
+        """
+        image = np.asarray(image)
+        matrix = self._getMatrix()
+        inputSize, outputSize = (self.outputSize, self.inputSize) if adjoint else (self.inputSize, self.outputSize)
+
+        if image.shape[:2] != inputSize:
+            raise ValueError('Image has size %s but expected size %s' % (image.shape[:2], inputSize))
+
+        # The matrix of the plan only covers the cropped input image and the output pixels inside the mask. The order
+        # is at most 1, so the image is not padded and the crop bounds are in the input image.
+        if self._cropBounds is None:
+            columns, columnShape = (slice(None), slice(None)), self.inputSize
+        else:
+            columns = (slice(*self._cropBounds[0]), slice(*self._cropBounds[1]))
+            columnShape = tuple(stop - start for start, stop in self._cropBounds)
+
+        if self._mask is None:
+            rows, rowShape = (slice(None), slice(None)), self.outputSize
+        else:
+            rows, rowShape = self._mask, (matrix.shape[0],)
+
+        if adjoint:
+            matrix, rows, rowShape, columns = matrix.T, columns, columnShape, rows
+
+        values = matrix @ image[columns].reshape((matrix.shape[1], -1))
+        if rowShape == outputSize:
+            return values.reshape(outputSize + image.shape[2:])
+
+        # Output pixels outside the crop or mask have no weights
+        result = np.zeros(outputSize + image.shape[2:], dtype=values.dtype)
+        result[rows] = values.reshape(rowShape + image.shape[2:])
+
+        return result
+
+    def _interpolate(self, coefficients, out, workers=1):
+        # Interpolate every channel of the padded and prefiltered image with the backend of the plan
+        # For masked plans, only the pixels inside the mask are interpolated and the rest are filled with the border
+        # value
+        if self._mask is not None:
+            # The number of points is counted from the mask, the coordinate map may have been released by the backend
+            values = np.empty((self._maskCount,) + out.shape[2:], dtype=out.dtype)
+            self._interpolatePoints(coefficients, values, workers)
+
+            out[self._mask] = values
+            out[~self._mask] = _castInterpolated(np.full(1, self.borderVal, dtype=np.float64),
+                                                 np.empty(1, dtype=out.dtype))[0]
+        else:
+            self._interpolatePoints(coefficients, out, workers)
+
+    def _interpolatePoints(self, coefficients, out, workers=1):
+        # Interpolate the points of the coordinate map into out with the backend of the plan
+        # The auto backend benchmarks the supported backends the first time an image of this shape and datatype is
+        # converted and uses the fastest one from then on
+        if self.backend == 'auto':
+            tuningKey = _getTuningKey(self, coefficients, out)
+            name = _getTunedBackend(tuningKey)
+
+            if name is None or name not in _backends or not _backends[name].isSupported(self, coefficients, out):
+                name = self._tuneBackend(coefficients, out, workers)
+                _setTunedBackend(tuningKey, name)
+                return
+        else:
+            name = self.backend
+
+        if name is None or not _backends[name].isSupported(self, coefficients, out):
+            name = _getDefaultBackend(self, coefficients, out)
+
+        _backends[name].interpolate(self, coefficients, out, workers)
+
+    def _tuneBackend(self, coefficients, out, workers=1):
+        # Time each supported backend and return the name of the fastest one, leaving its result in out
+        # Each backend is run twice and the second run is timed, so that tables computed on first use and compiling
+        # kernels are not included
+        timings = {}
+        for name, backend in _backends.items():
+            if backend.isSupported(self, coefficients, out):
+                for _ in range(2):
+                    start = time.perf_counter()
+                    backend.interpolate(self, coefficients, out, workers)
+                    timings[name] = time.perf_counter() - start
+
+        name = min(timings, key=timings.get)
+        self._releaseTables(name)
+
+        # Backends may round the result differently, so the result of the selected backend is the one that is kept
+        _backends[name].interpolate(self, coefficients, out, workers)
+
+        return name
+
+    def _releaseTables(self, name):
+        # Release the tables that are only used by other backends than the given one, they are recomputed if needed
+        if name != 'matrix':
+            self._matrix = None
+
+        if name != 'gather':
+            self._fixedPointWeights = {}
+
+        if name not in ('numpy', 'gather', 'matrix'):
+            self._gatherTable = None
+
+        if name != 'scipy':
+            self._coordinates = None
+
+    def _getOutputShape(self, image):
+        return self.outputSize + tuple(image.shape[2:3])
+
+    def _getCropBounds(self):
+        # Range of rows and columns of the padded input image that is read to convert polar images
+        # For a fixed angle, the cartesian coordinates of a point are monotonic in the radius, so the bounding box of
+        # the annular sector is the bounding box of the first and last row of the polar image
+        if self.direction != 'polar' or 0 in self.outputSize:
+            return None
+
+        padding = _getSplinePadding(self.order, self.border)
+        paddedSize = tuple(np.add(self.inputSize, 2 * padding))
+        coordinates = _getPolarImageCoordinates(self.settings, slice(0, None, max(self.outputSize[0] - 1, 1)))
+        coordinates += padding
+
+        bounds = [_getTileBounds(coordinates[axis], paddedSize[axis], _getTileMargin(self.order), self.border)
+                  for axis in (0, 1)]
+
+        return None if bounds == [(0, size) for size in paddedSize] else bounds
+
+    def _getCoefficientSize(self):
+        # Size of the padded and prefiltered image that is interpolated, which is the crop if the plan has one
+        if self._cropBounds is not None:
+            return tuple(int(stop - start) for start, stop in self._cropBounds)
+
+        return tuple(np.add(self.inputSize, 2 * _getSplinePadding(self.order, self.border)))
+
+    def _getUncroppedPlan(self):
+        # Plan with the same options that reads the entire image, created on first use
+        if self._uncroppedPlan is None:
+            plan = TransformPlan(self.settings, self.direction, order=self.order, border=self.border,
+                                 borderVal=self.borderVal, dtype=self.dtype, precision=self.precision,
+                                 backend=self.backend, masked=self.masked)
+            plan._cropBounds = None
+            self._uncroppedPlan = plan
+
+        return self._uncroppedPlan
+
+    def _prefilter(self, image, workers=1):
+        # Pad and prefilter the image unless spline coefficients are given, only reading the crop of the plan
+        if isinstance(image, SplineCoefficients):
+            if image.order != self.order or image.border != self.border or image.borderVal != self.borderVal:
+                raise ValueError('Spline coefficients were created with order=%i, border=%s, borderVal=%s but plan '
+                                 'uses order=%i, border=%s, borderVal=%s' % (image.order, image.border,
+                                                                             image.borderVal, self.order,
+                                                                             self.border, self.borderVal))
+
+            if self._cropBounds is None:
+                return image.coefficients
+
+            return image.coefficients[slice(*self._cropBounds[0]), slice(*self._cropBounds[1])]
+
+        if self._cropBounds is None:
+            return prefilterImage(image, order=self.order, border=self.border, borderVal=self.borderVal,
+                                  workers=workers, precision=self.precision).coefficients
+
+        # Same as padding and prefiltering the entire image and then cropping it, see _convertTiled
+        tile = _readTile(np.asanyarray(image), self._cropBounds[0], self._cropBounds[1],
+                         _getSplinePadding(self.order, self.border))
+
+        return _splineFilter(tile, self.order, self.border, workers, _getPrecisionDtype(self.precision))
+
+    def _canGather(self, coefficients):
+        # Gathering is used for nearest neighbor and bilinear interpolation with border modes that clamp to the image,
+        # as long as the image has the size the plan was created for
+        return self.order <= 1 and self.border in ('constant', 'nearest') and \
+            coefficients.shape[:2] == self._getCoefficientSize()
+
+    def _getCoordinates(self):
+        # Coordinate map of the output pixels in the padded input image, computed on first use
+        if self._coordinates is None:
+            dtype = _getPrecisionDtype(self.precision)
+            padding = _getSplinePadding(self.order, self.border)
+
+            # Maps loaded with ImageTransform.load are used as they are unless they need to be offset below
+            coordinates = self.settings._maps.get(_getMapKey(self.settings, self.direction, dtype))
+            if coordinates is not None:
+                if (padding or self._cropBounds is not None) and self._mask is None:
+                    coordinates = np.array(coordinates)
+            elif self.direction == 'polar':
+                coordinates = _getPolarImageCoordinates(self.settings, dtype=dtype)
+            else:
+                coordinates = _getCartesianImageCoordinates(self.settings, dtype=dtype)
+
+            # Only the coordinates of the pixels inside the mask are kept, in row-major order
+            if self._mask is not None:
+                coordinates = coordinates[:, self._mask]
+
+            # Images are padded before interpolation (see prefilterImage), so offset all of the desired coordinates by
+            # the padding now rather than each time the plan is executed. Only the crop of the padded image is
+            # interpolated, so the coordinates are relative to the crop.
+            if padding:
+                coordinates += padding
+
+            if self._cropBounds is not None:
+                coordinates[0] -= self._cropBounds[0][0]
+                coordinates[1] -= self._cropBounds[1][0]
+
+            self._coordinates = coordinates
+
+        return self._coordinates
+
+    def _getGatherTable(self):
+        # Source indices and weights for interpolating, computed on first use
+        if self._gatherTable is None:
+            self._gatherTable = _getGatherTable(self._getCoordinates(), self._getCoefficientSize(), self.order,
+                                                self.border, _getBorderMargin(self.order, self.border))
+
+        return self._gatherTable
+
+    def _getMatrix(self):
+        # Sparse interpolation matrix of the cropped input image, computed on first use
+        if self.order > 1 or self.border not in ('constant', 'nearest'):
+            raise ValueError('Interpolation matrix is only available for order 0 or 1 with the constant or nearest '
+                             'border, but plan uses order=%i, border=%s' % (self.order, self.border))
+
+        if self._matrix is None:
+            self._matrix = _getInterpolationMatrix(self._getGatherTable(), self._getCoefficientSize(),
+                                                   _getPrecisionDtype(self.precision))
+
+        return self._matrix
+
+    def _getFixedPointWeights(self, dtype, outputDtype):
+        # Fixed point weights for bilinear interpolation of integer images that are converted to the same datatype,
+        # computed on first use for each datatype
+        if self.order != 1 or dtype != outputDtype or dtype not in _fixedPointFormats:
+            return None
+
+        if dtype not in self._fixedPointWeights:
+            self._fixedPointWeights[dtype] = _getFixedPointWeights(self._getGatherTable()[1], dtype)
+
+        return self._fixedPointWeights[dtype]
+
+    def _getOutputDtype(self, image):
+        return image.dtype if self.dtype is None else self.dtype
+
+    def __repr__(self):
+        return 'TransformPlan(settings=%s, direction=%s, order=%i, border=%s, borderVal=%s, dtype=%s, precision=%s, ' \
+               'backend=%s, masked=%s)' % (self.settings, self.direction, self.order, self.border, self.borderVal,
+                                           self.dtype, self.precision, self.backend, self.masked)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class _FrameStream:
+    """Background stages for :meth:`TransformPlan.executeStream`
+
+    The reader and converter threads pass messages through bounded queues. Each message is a tuple of the kind of
+    message, which is 'frame', 'error' or 'end', and the frame or exception.
+    """
+
+    def __init__(self, plan, frames, queueSize, workers):
+        self.plan = plan
+        self.workers = workers
+
+        self._stopped = threading.Event()
+        self._inputQueue = queue.Queue(maxsize=queueSize)
+        self._outputQueue = queue.Queue(maxsize=queueSize)
+
+        # Pool of output buffers, allocated when first used. One buffer is converted into, queueSize buffers wait in
+        # the output queue and one buffer is held by the caller.
+        self._freeBuffers = queue.Queue()
+        for _ in range(queueSize + 2):
+            self._freeBuffers.put(np.empty(0))
+
+        # Threads are daemons so that a frame source that blocks forever does not keep the interpreter alive
+        self._threads = [threading.Thread(target=self._read, args=(frames,), daemon=True),
+                         threading.Thread(target=self._convert, daemon=True)]
+
+    def results(self):
+        # Generator of the converted frames, the buffer of the previous frame is returned to the pool when the next
+        # frame is requested
+        # The threads are started on the first request so that nothing runs in the background if the generator is never
+        # used. Once started, closing the generator stops the threads.
+        for thread in self._threads:
+            thread.start()
+
+        try:
+            while True:
+                kind, item = self._outputQueue.get()
+
+                if kind == 'end':
+                    return
+                elif kind == 'error':
+                    raise item
+
+                yield item
+
+                self._freeBuffers.put(item)
+        finally:
+            self._stopped.set()
+
+    def _put(self, queue_, message):
+        # Wait for room in the queue, giving up if the stream was closed. Returns whether the message was put
+        while not self._stopped.is_set():
+            try:
+                queue_.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _get(self, queue_):
+        # Wait for an item from the queue, giving up if the stream was closed. Returns None if closed
+        while not self._stopped.is_set():
+            try:
+                return queue_.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+        return None
+
+    def _read(self, frames):
+        try:
+            for frame in iter(frames):
+                if not isinstance(frame, SplineCoefficients):
+                    frame = np.asanyarray(frame)
+
+                if not self._put(self._inputQueue, ('frame', frame)):
+                    return
+        except Exception as e:
+            self._put(self._inputQueue, ('error', e))
+            return
+
+        self._put(self._inputQueue, ('end', None))
+
+    def _convert(self):
+        while True:
+            message = self._get(self._inputQueue)
+            if message is None:
+                return
+
+            kind, frame = message
+            if kind == 'frame':
+                buffer = self._get(self._freeBuffers)
+                if buffer is None:
+                    return
+
+                try:
+                    # Allocate the buffer on first use or if the frame has a different shape or datatype
+                    outputShape, outputDtype = self.plan._getOutputShape(frame), self.plan._getOutputDtype(frame)
+                    if buffer.shape != outputShape or buffer.dtype != outputDtype:
+                        buffer = np.empty(outputShape, dtype=outputDtype)
+
+                    message = ('frame', self.plan.execute(frame, out=buffer, workers=self.workers))
+                except Exception as e:
+                    message = ('error', e)
+
+            if not self._put(self._outputQueue, message) or message[0] != 'frame':
+                return
+
+
+class SplineCoefficients:
+    def __init__(self, coefficients, shape, dtype, order, border, borderVal, padding):
+        """Spline coefficients of an image for interpolation
+
+        For spline interpolation with an order greater than 1, the image must be prefiltered before interpolating. The
+        prefiltering is as costly as the interpolation itself for large images, so SplineCoefficients allows the
+        prefiltered image to be reused when the same image is converted multiple times, such as with different radii or
+        angles or when using the same image for a polar and cartesian conversion.
+
+        SplineCoefficients is created with :func:`prefilterImage` and can be passed in place of the image to
+        :func:`convertToPolarImage`, :func:`convertToCartesianImage` and :meth:`TransformPlan.execute`, which will skip
+        the prefiltering step.
+
+        The :attr:`shape`, :attr:`ndim` and :attr:`dtype` attributes are those of the original image, so the default
+        arguments of the conversion functions are the same as if the image was given.
+
+        Parameters
+        ----------
+        coefficients : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Spline coefficients of the padded image
+        shape : :class:`tuple` of :class:`int`
+            Shape of the original image
+        dtype : :class:`numpy.dtype`
+            Datatype of the original image, which is the datatype of the converted image
+        order : :class:`int` (0-5)
+            The order of the spline interpolation
+        border : {'constant', 'nearest', 'wrap', 'reflect'}
+            Border mode used for the prefiltering and interpolation
+        borderVal : same datatype as :obj:`image`
+            Value used for points outside the image boundaries if :obj:`border` = 'constant'
+        padding : :class:`int`
+            Number of pixels the image was padded by on each side of the first two dimensions
+        """
+        self.coefficients = coefficients
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.order = order
+        self.border = border
+        self.borderVal = borderVal
+        self.padding = padding
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the original image"""
+        return len(self.shape)
+
+    @property
+    def nbytes(self):
+        """Number of bytes used by the spline coefficients"""
+        return self.coefficients.nbytes
+
+    def __repr__(self):
+        return 'SplineCoefficients(shape=%s, dtype=%s, order=%i, border=%s, borderVal=%s, padding=%i)' % (
+            self.shape, self.dtype, self.order, self.border, self.borderVal, self.padding)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+def prefilterImage(image, order=3, border='constant', borderVal=0.0, workers=None, precision='float64'):
+    """Compute spline coefficients of an image for reuse between conversions
+
+    The image is padded and prefiltered the same way :func:`convertToPolarImage` and :func:`convertToCartesianImage`
+    do internally. The resulting coefficients can be passed in place of the image to the conversion functions to skip
+    this step, which is beneficial when converting the same image multiple times.
+
+    For multiple channels, all channels are prefiltered at once. The prefilter is only applied for an order greater
+    than 1, otherwise the coefficients are the image itself and no copy is made.
+
+    Parameters
+    ----------
+    image : (N, M) or (N, M, C) :class:`numpy.ndarray`
+        Image to prefilter
+    order : :class:`int` (0-5), optional
+        The order of the spline interpolation, default is 3. The order has to be in the range 0-5. Must be the same
+        order used for the conversion.
+    border : {'constant', 'nearest', 'wrap', 'reflect'}, optional
+        Border mode used for the conversion, default is 'constant'. See :func:`convertToPolarImage` for more details.
+    borderVal : same datatype as :obj:`image`, optional
+        Value used for points outside the image boundaries if :obj:`border` = 'constant'.
+
+        Default is 0.0
+    workers : :class:`int`, optional
+        Number of threads used to prefilter the image, see :func:`setNumWorkers`.
+
+        If not specified, the module default is used.
+    precision : {'float64', 'float32'}, optional
+        Floating point datatype of the spline coefficients when the image is prefiltered. See
+        :func:`convertToPolarImage` for more details.
+
+        Default is 'float64'
+
+    Returns
+    -------
+    coefficients : :class:`SplineCoefficients`
+        Spline coefficients of the image
+
+    See Also
+    --------
+    :class:`SplineCoefficients`
+    """
+    image = np.asanyarray(image)
+    shape, dtype = image.shape, image.dtype
+    padding = _getSplinePadding(order, border)
+    floatDtype = _getPrecisionDtype(precision)
+
+    # If border is set to constant, then pad the image by the edges by 3 pixels.
+    # If one tries to convert back to cartesian without the borders padded then the border of the cartesian image will
+    # be corrupted because it will average the pixels with the border value
+    # For nearest border, scipy pads the image before prefiltering because the prefilter does not have an exact
+    # boundary condition for it. This is done here instead so that the padding is done only once.
+    # The image is padded directly into the array of spline coefficients, which is then prefiltered in place, so there
+    # is no separate padded copy of the image. This is skipped if the image cannot be stored exactly in the datatype of
+    # the coefficients, since each line is prefiltered in float64 from the original values.
+    if padding:
+        if np.can_cast(image.dtype, floatDtype):
+            image = _padEdges(image, padding, floatDtype)
+            coefficients = _splineFilter(image, order, border, _resolveWorkers(workers), floatDtype, out=image)
+        else:
+            image = _padEdges(image, padding, image.dtype)
+            coefficients = _splineFilter(image, order, border, _resolveWorkers(workers), floatDtype)
+    else:
+        coefficients = _splineFilter(image, order, border, _resolveWorkers(workers), floatDtype)
+
+    return SplineCoefficients(coefficients, shape, dtype, order, border, borderVal, padding)
+
+
+def _padEdges(image, padding, dtype):
+    # Pad the first two dimensions of the image by repeating the edge pixels, same as np.pad with the 'edge' mode
+    # The padded image is allocated with the given datatype and filled in one pass rather than copying the image first
+    height, width = image.shape[:2]
+    padded = np.empty((height + 2 * padding, width + 2 * padding) + image.shape[2:], dtype=dtype)
+
+    padded[padding:padding + height, padding:padding + width] = image
+    padded[:padding, padding:padding + width] = image[:1]
+    padded[padding + height:, padding:padding + width] = image[-1:]
+    padded[:, :padding] = padded[:, padding:padding + 1]
+    padded[:, padding + width:] = padded[:, padding + width - 1:padding + width]
+
+    return padded
+
+
+def _splineFilter(image, order, border, workers=1, dtype=np.float64, out=None):
+    # Prefilter along the two image dimensions only, which prefilters all channels at once
+    # The prefilter is only applied for an order greater than 1, otherwise the image is returned as is
+    if order <= 1:
+        return image
+
+    # The filter is applied to each line independently, so the columns are split between the workers when filtering
+    # along the rows and vice versa. This gives the same result for any number of workers.
+    # Each line is filtered in float64 regardless of the datatype of the coefficients. The output may be the image
+    # itself, in which case it is filtered in place.
+    coefficients = np.empty(image.shape, dtype=dtype) if out is None else out
+
+    def filterColumns(start, stop):
+        scipy.ndimage.spline_filter1d(image[:, start:stop], order, axis=0, output=coefficients[:, start:stop],
+                                      mode=border)
+
+    def filterRows(start, stop):
+        scipy.ndimage.spline_filter1d(coefficients[start:stop], order, axis=1, output=coefficients[start:stop],
+                                      mode=border)
+
+    _runParallel(filterColumns, _splitRange(image.shape[1], workers), workers)
+    _runParallel(filterRows, _splitRange(image.shape[0], workers), workers)
+
+    return coefficients
+
+
+def _mapCoordinates(coefficients, coordinates, out, order, border, borderVal, workers=1, limits=None):
+    """Interpolate each channel of a prefiltered image at the coordinates using map_coordinates
+
+    Unlike the gather, matrix and numba backends, this is not a single pass over all channels. map_coordinates only
+    interpolates along the image axes, so it is called once for each channel and writes into the strided view of that
+    channel of :obj:`out`. The coordinates are shared between the channels and all channels are stored in the same
+    output array, so no temporary arrays are allocated per channel.
+
+    Each point is interpolated independently, so the work is split between the workers by channel and by chunks of
+    output rows. map_coordinates releases the GIL so the chunks run in parallel.
+
+    Parameters
+    ----------
+    coefficients : (N, M) or (N, M, C) :class:`numpy.ndarray`
+        Padded and prefiltered image, see :func:`prefilterImage`
+    coordinates : (2, ...) :class:`numpy.ndarray`
+        Row and column of the image to interpolate for each output point
+    out : (...) or (..., C) :class:`numpy.ndarray`
+        Array to store the interpolated points in
+    order, border, borderVal
+        Interpolation options, see :func:`convertToPolarImage`
+    workers : :class:`int`, optional
+        Number of threads that the channels and chunks are split between
+    limits : :class:`list` of (2,) :class:`tuple`, optional
+        Range of coordinates along each axis that are interpolated. If given, the edge pixels are extended up to the
+        limits and points beyond them are filled with the border value, see :func:`_getBorderMargin`
+    """
+    mode = border if limits is None else 'nearest'
+    fillValue = _castInterpolated(np.full(1, borderVal, dtype=np.float64), np.empty(1, dtype=out.dtype))
+
+    def interpolateChunk(channel, start, stop):
+        if channel is None:
+            source, output = coefficients, out
+        else:
+            source, output = coefficients[:, :, channel], out[..., channel]
+
+        scipy.ndimage.map_coordinates(source, coordinates[:, start:stop], output=output[start:stop], mode=mode,
+                                      cval=borderVal, order=order, prefilter=False)
+
+        if limits is not None:
+            y, x = coordinates[0, start:stop], coordinates[1, start:stop]
+            outside = (y < limits[0][0]) | (y > limits[0][1]) | (x < limits[1][0]) | (x > limits[1][1])
+            output[start:stop][outside] = fillValue
+
+    channels = range(coefficients.shape[2]) if coefficients.ndim == 3 else [None]
+    rowChunks = _splitRange(coordinates.shape[1], max(workers // len(channels), 1))
+    _runParallel(interpolateChunk, [(channel,) + chunk for channel in channels for chunk in rowChunks], workers)
+
+
+def _getGatherTable(coordinates, shape, order, border, margin=0):
+    """Precompute source indices and weights for nearest neighbor or bilinear interpolation
+
+    The table only depends on the coordinates and image size, so it is computed once and then used to interpolate any
+    number of channels with :func:`_gatherInterpolate`. The result is the same as :func:`scipy.ndimage.map_coordinates`
+    with the 'constant' and 'nearest' border modes.
+
+    Parameters
+    ----------
+    coordinates : (2, ...) :class:`numpy.ndarray`
+        Coordinates to interpolate at, first item is the row and second item is the column
+    shape : (2,) :class:`tuple` of :class:`int`
+        Size of the image that is interpolated
+    order : {0, 1}
+        The order of the interpolation, 0 for nearest neighbor and 1 for bilinear
+    border : {'constant', 'nearest'}
+        Border mode for points outside the image boundaries
+    margin : :class:`int`, optional
+        Number of pixels outside the image that are extended from the edge pixels for the 'constant' border, points
+        beyond this are filled with the border value. See :func:`_getBorderMargin`.
+
+    Returns
+    -------
+    table : :class:`tuple`
+        Flat index of the top-left source pixel of each point, fractional row and column offsets of each point (order 1
+        only), flat indices of the points outside the image (border 'constant' only) and the flat index offset to the
+        next row and column
+    """
+    height, width = shape
+    y, x = coordinates[0].ravel(), coordinates[1].ravel()
+
+    # For constant border, points outside the image and margin are filled with the border value. Note that no
+    # interpolation is done beyond the edge of the image, same as map_coordinates
+    if border == 'constant':
+        outside = np.flatnonzero((y < -margin) | (y > height - 1 + margin) | (x < -margin) | (x > width - 1 + margin))
+    else:
+        outside = np.empty(0, dtype=np.intp)
+
+    # Clamping the points to the image is the same as extending the edge pixels for the nearest border
+    y, x = np.clip(y, 0, height - 1), np.clip(x, 0, width - 1)
+
+    # Offset in flat index to the next row and column, zero if the image is only one pixel in that dimension
+    rowStep, columnStep = (width if height > 1 else 0), (1 if width > 1 else 0)
+
+    if order == 0:
+        # Nearest neighbor rounds half up, same as map_coordinates
+        indices = np.floor(y + 0.5).astype(np.intp) * width + np.floor(x + 0.5).astype(np.intp)
+
+        return indices, None, outside, rowStep, columnStep
+
+    # Top-left pixel of the 2x2 neighborhood, which is moved up or left at the last row or column so that the
+    # neighborhood is inside the image. The fractional offset is one in that case.
+    y0 = np.minimum(np.floor(y), max(height - 2, 0))
+    x0 = np.minimum(np.floor(x), max(width - 2, 0))
+    indices = y0.astype(np.intp) * width + x0.astype(np.intp)
+    fractions = np.stack((y - y0, x - x0))
+
+    return indices, fractions, outside, rowStep, columnStep
+
+
+def _gatherInterpolate(table, image, out, borderVal, chunkSize=2 ** 17, workers=1, weights=None):
+    """Interpolate all channels of an image using a table from :func:`_getGatherTable`
+
+    Each chunk of output points gathers the neighboring source pixels of all channels at once and sums them using the
+    bilinear weights. Chunks keep the temporary arrays small enough to stay in the cache. For nearest neighbor
+    interpolation, the source pixels are copied directly into the output.
+
+    Parameters
+    ----------
+    table : :class:`tuple`
+        Table of source indices and weights from :func:`_getGatherTable`
+    image : (N, M, C) :class:`numpy.ndarray`
+        Image to interpolate
+    out : (..., C) :class:`numpy.ndarray`
+        Array to store the interpolated points in, integer values are rounded and clipped the same as map_coordinates
+    borderVal : :class:`float`
+        Value used for points outside the image boundaries
+    chunkSize : :class:`int`, optional
+        Approximate number of values to interpolate at once
+    workers : :class:`int`, optional
+        Number of threads that the chunks are split between
+    weights : (4, P) :class:`numpy.ndarray`, optional
+        Fixed point bilinear weights from :func:`_getFixedPointWeights` for interpolating an integer image in integer
+        arithmetic. The image and output must have the datatype the weights were computed for.
+    """
+    indices, fractions, outside, rowStep, columnStep = table
+    channels = image.shape[-1]
+    source = image.reshape(-1, channels)
+
+    # Interpolate into a flat view of the output, or a temporary array if the output is not contiguous
+    result = out.reshape(-1, channels) if out.flags.c_contiguous else np.empty((indices.size, channels), out.dtype)
+
+    def interpolateChunk(start, stop):
+        index = indices[start:stop]
+
+        if fractions is None:
+            # Nearest neighbor is a single take of the source pixels, straight into the result if no cast is needed
+            if source.dtype == result.dtype:
+                np.take(source, index, axis=0, out=result[start:stop], mode='clip')
+            else:
+                _castInterpolated(np.take(source, index, axis=0), result[start:stop])
+        elif weights is not None:
+            _fixedPointBilinear(source, index, weights[:, start:stop], fractions[:, start:stop], rowStep, columnStep,
+                                result[start:stop])
+        else:
+            _castInterpolated(_bilinear(source, index, fractions[:, start:stop], rowStep, columnStep),
+                              result[start:stop])
+
+    # Each chunk writes to a separate part of the result, so the chunks can be interpolated in any order
+    step = max(chunkSize // channels, 1)
+    _runParallel(interpolateChunk, [(start, min(start + step, indices.size)) for start in range(0, indices.size, step)],
+                 workers)
+
+    # Fill the points outside the image with the border value
+    if outside.size:
+        result[outside] = _castInterpolated(np.full(channels, borderVal, dtype=np.float64),
+                                            np.empty(channels, dtype=out.dtype))
+
+    if not out.flags.c_contiguous:
+        out[...] = result.reshape(out.shape)
+
+
+def _getInterpolationMatrix(table, shape, dtype):
+    """Build sparse interpolation matrix from a table from :func:`_getGatherTable`
+
+    Parameters
+    ----------
+    table : :class:`tuple`
+        Table of source indices and weights from :func:`_getGatherTable`
+    shape : (2,) :class:`tuple` of :class:`int`
+        Size of the image that is interpolated
+    dtype : :class:`numpy.dtype`
+        Datatype of the weights
+
+    Returns
+    -------
+    matrix : :class:`scipy.sparse.csr_matrix`
+        Matrix with one row for each point of the table and one column for each pixel of the image
+    """
+    indices, fractions, outside, rowStep, columnStep = table
+
+    if fractions is None:
+        columns = indices[:, None]
+        weights = np.ones(columns.shape, dtype=dtype)
+    else:
+        # Weights of the top-left, top-right, bottom-left and bottom-right pixel of the 2x2 neighborhood of each point
+        fy, fx = fractions.astype(dtype, copy=False)
+        columns = np.stack((indices, indices + columnStep, indices + rowStep, indices + rowStep + columnStep), axis=1)
+        weights = np.stack(((1 - fy) * (1 - fx), (1 - fy) * fx, fy * (1 - fx), fy * fx), axis=1)
+
+    # Points outside the image have no weights. Zero weights are removed and weights for the same pixel, which occur
+    # for images that are one pixel in a dimension, are summed.
+    weights[outside] = 0
+    indptr = np.arange(0, weights.size + 1, weights.shape[1])
+    matrix = scipy.sparse.csr_matrix((weights.ravel(), columns.ravel(), indptr),
+                                     shape=(indices.size, shape[0] * shape[1]))
+    matrix.sum_duplicates()
+    matrix.eliminate_zeros()
+
+    return matrix
+
+
+def _getSettingsMatrix(settings, direction, order, border, precision):
+    # Retrieve the interpolation matrix for the settings, creating it if necessary
+    # The matrices are keyed by the settings too, so changing the settings in place does not return a stale matrix
+    cacheKey = _getCacheKey(direction, order, border, precision, settings.center, settings.initialRadius,
+                            settings.finalRadius, settings.initialAngle, settings.finalAngle,
+                            settings.cartesianImageSize, settings.polarImageSize, settings.radialScale)
+
+    if cacheKey not in settings._matrices:
+        plan = TransformPlan(settings, direction, order=order, border=border, precision=precision)
+        settings._matrices[cacheKey] = plan.getMatrix()
+
+    return settings._matrices[cacheKey]
+
+
+def _getSettingsMask(settings, precision):
+    # Retrieve the mask of the cartesian pixels inside the polar image for the settings, creating it if necessary
+    # The masks are keyed by the settings too, so changing the settings in place does not return a stale mask
+    cacheKey = _getCacheKey(precision, settings.center, settings.initialRadius, settings.finalRadius,
+                            settings.initialAngle, settings.finalAngle, settings.cartesianImageSize,
+                            settings.polarImageSize, settings.radialScale)
+
+    if cacheKey not in settings._masks:
+        # Points within 3 pixels of the polar image are interpolated from the edge pixels by the constant border, both
+        # without prefiltering (see _getBorderMargin) and with prefiltering (see _getSplinePadding). The mask uses the
+        # coordinates in the precision of the plan so that it matches the points the constant border fills exactly.
+        margin = 3
+        dtype = _getPrecisionDtype(precision)
+        coordinates = settings._maps.get(_getMapKey(settings, 'cartesian', dtype))
+        r, theta = _getCartesianImageCoordinates(settings, dtype=dtype) if coordinates is None else coordinates
+        mask = (r >= -margin) & (r <= settings.polarImageSize[0] - 1 + margin) & \
+               (theta >= -margin) & (theta <= settings.polarImageSize[1] - 1 + margin)
+
+        mask.flags.writeable = False
+        settings._masks[cacheKey] = mask
+
+    return settings._masks[cacheKey]
+
+
+# Version of the file format of ImageTransform.save. Increment it when the layout of the files or the calculation of the
+# coordinate maps changes, so that transforms saved before are rejected rather than used with stale maps.
+_transformFormat = 1
+
+
+def _getMapKey(settings, direction, dtype):
+    # Key of a coordinate map loaded with ImageTransform.load
+    # The maps are keyed by the settings too, so changing the settings in place does not use a stale map
+    return _getCacheKey(direction, np.dtype(dtype).name, settings.center, settings.initialRadius, settings.finalRadius,
+                        settings.initialAngle, settings.finalAngle, settings.cartesianImageSize,
+                        settings.polarImageSize, settings.radialScale)
+
+
+def _getSettingsDict(settings):
+    # Settings as plain Python values that can be stored as JSON
+    return {
+        'center': np.asarray(settings.center).tolist(),
+        'initialRadius': np.asarray(settings.initialRadius).item(),
+        'finalRadius': np.asarray(settings.finalRadius).item(),
+        'initialAngle': float(settings.initialAngle),
+        'finalAngle': float(settings.finalAngle),
+        'cartesianImageSize': [int(size) for size in settings.cartesianImageSize],
+        'polarImageSize': [int(size) for size in settings.polarImageSize],
+        'radialScale': settings.radialScale,
+    }
+
+
+def _getSettingsHash(settings, maps):
+    # Hash of the file format, settings and description of the maps of a saved transform
+    text = json.dumps({'format': _transformFormat, 'settings': settings, 'maps': maps}, sort_keys=True)
+
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _bilinear(source, index, fractions, rowStep, columnStep):
+    # Bilinear interpolation of the flattened source image at the points given by the flat index of the top-left pixel
+    # and the fractional offsets
+    # Interpolate along the columns for the top and bottom row and then interpolate between the rows
+    fy, fx = fractions[0, :, None], fractions[1, :, None]
+
+    top = source[index] * (1 - fx)
+    top += source[index + columnStep] * fx
+    bottom = source[index + rowStep] * (1 - fx)
+    bottom += source[index + rowStep + columnStep] * fx
+    top *= 1 - fy
+    bottom *= fy
+
+    return top + bottom
+
+
+# Number of fractional bits of the fixed point bilinear weights and the integer datatype used to sum the weighted
+# pixels for each datatype. The sum of the weighted pixels must fit in the datatype without overflowing.
+_fixedPointFormats = {np.dtype(np.uint8): (22, np.int32), np.dtype(np.uint16): (30, np.int64)}
+
+
+def _getFixedPointWeights(fractions, dtype):
+    """Compute fixed point bilinear weights for interpolating an integer image
+
+    Parameters
+    ----------
+    fractions : (2, P) :class:`numpy.ndarray`
+        Fractional row and column offsets of each point from :func:`_getGatherTable`
+    dtype : :class:`numpy.dtype`
+        Datatype of the image, must be one of the datatypes in :obj:`_fixedPointFormats`
+
+    Returns
+    -------
+    weights : (4, P) :class:`numpy.ndarray`
+        Weights of the top-left, top-right, bottom-left and bottom-right pixel of each point, scaled by 2 ** bits and
+        rounded to integers
+    """
+    bits, accumulatorDtype = _fixedPointFormats[dtype]
+    fy, fx = fractions
+
+    weights = np.stack(((1 - fy) * (1 - fx), (1 - fy) * fx, fy * (1 - fx), fy * fx))
+    weights *= 1 << bits
+
+    return np.rint(weights).astype(accumulatorDtype)
+
+
+def _fixedPointBilinear(source, index, weights, fractions, rowStep, columnStep, out):
+    # Bilinear interpolation of an integer image using fixed point weights, rounding half up like map_coordinates
+    bits, accumulatorDtype = _fixedPointFormats[source.dtype]
+
+    values = weights[0, :, None] * np.take(source, index, axis=0)
+    values += weights[1, :, None] * np.take(source, index + columnStep, axis=0)
+    values += weights[2, :, None] * np.take(source, index + rowStep, axis=0)
+    values += weights[3, :, None] * np.take(source, index + rowStep + columnStep, axis=0)
+
+    # Each weight is rounded by at most half a unit, so the sum differs from the exact value by at most two units
+    # times the largest pixel value. If the sum is within that of halfway between two integers, it could round
+    # differently than floating point, so those points are interpolated again in floating point.
+    half = 1 << (bits - 1)
+    ambiguous = np.abs((values & ((1 << bits) - 1)) - half) <= 2 * np.iinfo(source.dtype).max + 1
+
+    values += half
+    values >>= bits
+    out[...] = values
+
+    points = np.flatnonzero(ambiguous.any(axis=1))
+    if points.size:
+        out[points] = _castInterpolated(_bilinear(source, index[points], fractions[:, points], rowStep, columnStep),
+                                        np.empty((points.size, out.shape[1]), dtype=out.dtype))
+
+
+def _castInterpolated(values, out):
+    # Store interpolated values in output array, integers are rounded half away from zero and clipped to the range of
+    # the datatype, same as map_coordinates
+    if np.issubdtype(out.dtype, np.integer) and values.dtype.kind == 'f':
+        info = np.iinfo(out.dtype)
+        values = np.trunc(values + np.copysign(0.5, values))
+        np.clip(values, info.min, info.max, out=values)
+
+    out[...] = values
+
+    return out
+
+
+def _getSplinePadding(order, border):
+    # Number of pixels the image is padded on each side before prefiltering and interpolating
+    # For the constant border, the image is only padded when it is prefiltered, see _getBorderMargin
+    if border == 'constant' and order > 1:
+        return 3
+    elif border == 'nearest' and order > 1:
+        return 12
+    else:
+        return 0
+
+
+def _getBorderMargin(order, border):
+    # Number of pixels outside the image that are extended from the edge pixels rather than filled with the border value
+    # when the image is not padded. For the constant border without prefiltering, interpolating with the nearest border
+    # and filling the points beyond this margin gives the same result as padding the image by the edges, without
+    # copying the image.
+    return 3 if border == 'constant' and order <= 1 else 0
+
+
+def _getBorderLimits(shape, margin, offset=(0, 0)):
+    # Range of coordinates along each axis that are interpolated rather than filled with the border value, relative to
+    # an offset in the image
+    if not margin:
+        return None
+
+    return [(-margin - start, size - 1 + margin - start) for size, start in zip(shape[:2], offset)]
+
+
+# Largest magnitude pole of the spline prefilter for each order, which is how much the influence of a pixel on the
+# spline coefficients decays per pixel
+_splinePoles = {2: np.sqrt(8.0) - 3.0, 3: np.sqrt(3.0) - 2.0, 4: -0.361341225900220177092, 5: -0.430575347099973791851}
+
+
+# Tiles are not split any further once they are this size in each dimension
+_minTileSize = 32
+
+
+def _getPrecisionDtype(precision):
+    # Floating point datatype used for the coordinate map and spline coefficients
+    if precision not in ('float64', 'float32'):
+        raise ValueError('Invalid precision %s, must be either \'float64\' or \'float32\'' % precision)
+
+    return np.dtype(precision)
+
+
+def _getTileMargin(order):
+    # Number of pixels read around the bounding box of the points in a tile
+    # Interpolation uses the order + 1 pixels around each point
+    margin = order // 2 + 1
+
+    # For an order greater than 1, the spline coefficients depend on the entire image. The margin is extended until the
+    # influence of the pixels outside of it is below the precision of float64.
+    if order > 1:
+        margin += int(np.ceil(np.log(np.finfo(np.float64).eps) / np.log(abs(_splinePoles[order]))))
+
+    return margin
+
+
+def _getTileBounds(values, size, margin, border):
+    # Range of the padded image along one axis that is needed to interpolate the values
+    lo, hi = np.min(values), np.max(values)
+
+    # For border modes that reflect or wrap around, points outside the image may read from anywhere along the axis.
+    # Points outside the image for the constant and nearest border only depend on the edge of the image.
+    if border not in ('constant', 'nearest') and (lo < 0 or hi > size - 1):
+        return 0, size
+
+    lo, hi = np.clip([lo, hi], 0, size - 1)
+
+    return max(int(np.floor(lo)) - margin, 0), min(int(np.ceil(hi)) + margin + 1, size)
+
+
+def _readTile(source, rows, columns, padding):
+    # Read part of the padded source image, where the rows and columns are the range in the padded image
+    # Only the part of the source inside the range is read and then the edge pixels are extended for the part of the
+    # range that lies in the padding, which is the same as padding the entire image with the edges
+    rows = np.clip(np.arange(*rows) - padding, 0, source.shape[0] - 1)
+    columns = np.clip(np.arange(*columns) - padding, 0, source.shape[1] - 1)
+
+    tile = source[rows[0]:rows[-1] + 1, columns[0]:columns[-1] + 1]
+    if tile.shape[:2] != (rows.size, columns.size):
+        tile = tile[np.ix_(rows - rows[0], columns - columns[0])]
+
+    return tile
+
+
+def _convertTiled(image, settings, direction, order, border, borderVal, maxMemory, workers=1, precision='float64',
+                  out=None):
+    """Convert image in tiles so that the temporary memory used is bounded
+
+    The output image is split into tiles and each tile reads only the bounding box of the input image that it needs,
+    plus a margin for the spline interpolation. Tiles are split in half along their longest dimension until the memory
+    needed for the coordinates, input and spline coefficients of the tile fits in :obj:`maxMemory`, or until the tile is
+    32 x 32 pixels.
+
+    The result is the same as converting the entire image at once. For an order greater than 1, the spline coefficients
+    of the bounding box are not exactly the same as for the entire image, but the margin is wide enough that the
+    difference is below the precision of float64.
+
+    Parameters
+    ----------
+    image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
+        Image to convert
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+    direction : {'polar', 'cartesian'}
+        Domain that the image is converted to
+    order : :class:`int` (0-5)
+        The order of the spline interpolation
+    border : {'constant', 'nearest', 'wrap', 'reflect'}
+        Points outside the image boundaries are filled according to the given mode
+    borderVal : same datatype as :obj:`image`
+        Value used for points outside the image boundaries if :obj:`border` = 'constant'
+    maxMemory : :class:`int`
+        Maximum number of bytes of temporary memory used for each tile
+    workers : :class:`int`, optional
+        Number of threads used to convert each tile
+    precision : {'float64', 'float32'}, optional
+        Floating point precision of the coordinates and spline coefficients
+    out : (N, M) or (N, M, C) :class:`numpy.ndarray`, optional
+        Array to store the converted image in, a new array is allocated if not specified
+
+    Returns
+    -------
+    image : (N, M) or (N, M, C) :class:`numpy.ndarray`
+        Converted image
+    """
+    # For spline coefficients, the tiles are read from the padded and prefiltered image directly
+    if isinstance(image, SplineCoefficients):
+        if image.order != order or image.border != border or image.borderVal != borderVal:
+            raise ValueError('Spline coefficients were created with order=%i, border=%s, borderVal=%s but conversion '
+                             'uses order=%i, border=%s, borderVal=%s' % (image.order, image.border, image.borderVal,
+                                                                         order, border, borderVal))
+
+        source, shape, dtype, padding = image.coefficients, image.shape, image.dtype, image.padding
+        isFiltered = True
+    else:
+        image = np.asanyarray(image)
+        source, shape, dtype, padding = image, image.shape, image.dtype, _getSplinePadding(order, border)
+        isFiltered = False
+
+    if direction == 'polar':
+        outputSize, getCoordinates = tuple(settings.polarImageSize), _getPolarImageCoordinates
+    else:
+        outputSize, getCoordinates = tuple(settings.cartesianImageSize), _getCartesianImageCoordinates
+
+    outputShape = outputSize + tuple(shape[2:3])
+    if out is None:
+        out = np.empty(outputShape, dtype=dtype)
+    elif out.shape != outputShape:
+        raise ValueError('Output array has shape %s but expected shape %s' % (out.shape, outputShape))
+    paddedSize = (shape[0] + 2 * padding, shape[1] + 2 * padding)
+    margin = _getTileMargin(order)
+    floatDtype = _getPrecisionDtype(precision)
+
+    # Bytes used for each pixel of the tile in the output image (coordinates) and in the input image (copy of the input
+    # and the spline coefficients)
+    channels = shape[2] if len(shape) == 3 else 1
+    outputBytes = 2 * floatDtype.itemsize
+    inputBytes = channels * (np.dtype(dtype).itemsize + (floatDtype.itemsize if order > 1 else 0))
+
+    # Start with the entire image and split tiles until they fit
+    tiles = [((0, outputSize[0]), (0, outputSize[1]))] if 0 not in out.shape else []
+    while tiles:
+        rows, columns = tiles.pop()
+        height, width = rows[1] - rows[0], columns[1] - columns[0]
+
+        # Tile needs at least as much memory as its own size in the input image, so the coordinates are only calculated
+        # if that fits. Tiles are not split below the minimum size, since the margin would dominate the memory used.
+        coordinates, isSmallest = None, height <= _minTileSize and width <= _minTileSize
+        if isSmallest or height * width * (outputBytes + inputBytes) <= maxMemory:
+            coordinates = getCoordinates(settings, slice(*rows), slice(*columns), floatDtype)
+            coordinates += padding
+            bounds = [_getTileBounds(coordinates[axis], paddedSize[axis], margin, border) for axis in (0, 1)]
+
+            if not isSmallest and coordinates.nbytes + np.prod(np.diff(bounds)) * inputBytes > maxMemory:
+                coordinates = None
+
+        # Split the tile in half along its longest dimension if it does not fit
+        if coordinates is None:
+            if height >= width:
+                middle = rows[0] + height // 2
+                tiles += [((middle, rows[1]), columns), ((rows[0], middle), columns)]
+            else:
+                middle = columns[0] + width // 2
+                tiles += [(rows, (middle, columns[1])), (rows, (columns[0], middle))]
+
+            continue
+
+        # Read the bounding box of the tile from the input image and interpolate relative to the bounding box
+        tile = _readTile(source, bounds[0], bounds[1], 0 if isFiltered else padding)
+        coefficients = tile if isFiltered else _splineFilter(tile, order, border, workers, floatDtype)
+        coordinates[0] -= bounds[0][0]
+        coordinates[1] -= bounds[1][0]
+
+        limits = _getBorderLimits(paddedSize, _getBorderMargin(order, border), (bounds[0][0], bounds[1][0]))
+        _mapCoordinates(coefficients, coordinates, out[rows[0]:rows[1], columns[0]:columns[1]], order, border,
+                        borderVal, workers, limits)
+
+    # If there are 4 bands, then assume the 4th band is alpha
+    # We do not want to interpolate the transparency so we just make it all fully opaque
+    if len(shape) == 3 and shape[2] == 4:
+        imin, imax = skimage.util.dtype_limits(out, False)
+        out[:, :, 3] = imax
+
+    return out
+
+
+class InterpolationBackend:
+    """Base class for the interpolation backends that convert images
+
+    A backend interpolates the padded and prefiltered image of a conversion at the output pixels of a
+    :class:`TransformPlan`. The backend of a conversion is selected by name with the :obj:`backend` argument, see
+    :func:`convertToPolarImage` for the built-in backends.
+
+    Custom backends subclass this class, implement :meth:`interpolate` and optionally :meth:`isSupported`, and are
+    added with :func:`registerBackend`.
+    """
+
+    def isSupported(self, plan, coefficients, out):
+        """Whether the backend can interpolate the image for the plan
+
+        Conversions that are not supported by the selected backend use the default backend instead.
+
+        Parameters
+        ----------
+        plan : :class:`TransformPlan`
+            Plan that is executed
+        coefficients : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Padded and prefiltered image, see :func:`prefilterImage`
+        out : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Array to store the converted image in
+
+        Returns
+        -------
+        supported : :class:`bool`
+            :obj:`True` if the backend can interpolate the image
+        """
+        return True
+
+    def interpolate(self, plan, coefficients, out, workers=1):
+        """Interpolate the image at the output pixels of the plan
+
+        Parameters
+        ----------
+        plan : :class:`TransformPlan`
+            Plan that is executed
+        coefficients : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Padded and prefiltered image, see :func:`prefilterImage`
+        out : (N, M) or (N, M, C) :class:`numpy.ndarray`
+            Array to store the converted image in. Integer values are rounded half away from zero and clipped to the
+            range of the datatype, same as :func:`scipy.ndimage.map_coordinates`.
+        workers : :class:`int`, optional
+            Number of threads used for the interpolation
+        """
+        raise NotImplementedError
+
+
+class _ScipyBackend(InterpolationBackend):
+    def interpolate(self, plan, coefficients, out, workers=1):
+        # Use map_coordinates for each channel, see _mapCoordinates. The prefiltering was already done for all channels
+        # at once
+        # The crop of a plan only leaves out pixels that are not near any point, so limits relative to the crop give
+        # the same result as limits relative to the entire image
+        limits = _getBorderLimits(coefficients.shape, _getBorderMargin(plan.order, plan.border))
+        _mapCoordinates(coefficients, plan._getCoordinates(), out, plan.order, plan.border, plan.borderVal, workers,
+                        limits)
+
+
+class _GatherBackend(InterpolationBackend):
+    def __init__(self, fixedPoint):
+        self.fixedPoint = fixedPoint
+
+    def isSupported(self, plan, coefficients, out):
+        # With fixed point, bilinear interpolation is only supported for integer images that keep their datatype
+        if not plan._canGather(coefficients):
+            return False
+
+        return not self.fixedPoint or plan.order == 0 or \
+            (coefficients.dtype == out.dtype and coefficients.dtype in _fixedPointFormats)
+
+    def interpolate(self, plan, coefficients, out, workers=1):
+        # The source indices and weights are computed once and then all channels are interpolated together. Single
+        # channel images are interpolated as one channel.
+        if coefficients.ndim == 2:
+            coefficients, out = coefficients[:, :, None], out[..., None]
+
+        weights = plan._getFixedPointWeights(coefficients.dtype, out.dtype) if self.fixedPoint else None
+        _gatherInterpolate(plan._getGatherTable(), coefficients, out, plan.borderVal, workers=workers, weights=weights)
+
+
+class _MatrixBackend(InterpolationBackend):
+    def isSupported(self, plan, coefficients, out):
+        return plan._canGather(coefficients)
+
+    def interpolate(self, plan, coefficients, out, workers=1):
+        # All channels are converted with one sparse matrix product. The matrix has no weights for the points outside
+        # the image, so these are filled with the border value afterwards
+        values = plan._getMatrix() @ coefficients.reshape((coefficients.shape[0] * coefficients.shape[1], -1))
+        values[plan._getGatherTable()[2]] = plan.borderVal
+
+        _castInterpolated(values.reshape(out.shape), out)
+
+
+class _NumbaBackend(InterpolationBackend):
+    def isSupported(self, plan, coefficients, out):
+        # The kernels calculate the coordinates of every output pixel, so masked plans are not supported
+        return numba is not None and plan.order in (0, 1, 3) and plan.border in ('constant', 'nearest') and \
+            plan._mask is None
+
+    def interpolate(self, plan, coefficients, out, workers=1):
+        # Fused kernel that calculates the coordinates of each pixel as it is interpolated, so the coordinate map is
+        # never stored. Each row of the output image is converted by one of the worker threads, see _numbaInterpolate
+        # for the interpolation.
+        settings = plan.settings
+
+        # The kernels work on three dimensional arrays, so a single channel is given its own dimension
+        if coefficients.ndim == 2:
+            coefficients, out = coefficients[:, :, None], out[:, :, None]
+
+        # Integer values are rounded and clipped to the range of the datatype, same as map_coordinates
+        isInteger = np.issubdtype(out.dtype, np.integer)
+        lower, upper = (np.iinfo(out.dtype).min, np.iinfo(out.dtype).max) if isInteger else (0, 0)
+        options = (float(_getSplinePadding(plan.order, plan.border)), plan.order, plan.border == 'nearest',
+                   float(_getBorderMargin(plan.order, plan.border)), float(plan.borderVal), isInteger, float(lower),
+                   float(upper))
+
+        numba.set_num_threads(min(workers, numba.config.NUMBA_NUM_THREADS))
+
+        if plan.direction == 'polar':
+            radii = _getRadii(settings)
+            cosTheta, sinTheta = _getTrigTable(settings.initialAngle, settings.finalAngle, settings.polarImageSize[1])
+
+            top, left = (0, 0) if plan._cropBounds is None else (plan._cropBounds[0][0], plan._cropBounds[1][0])
+            _numbaPolarKernel(coefficients, out, radii, cosTheta, sinTheta, float(settings.center[0]),
+                              float(settings.center[1]), float(top), float(left), *options)
+        else:
+            initialRadius, scaleRadius = _getRadialScale(settings)
+            scaleAngle = settings.polarImageSize[1] / (settings.finalAngle - settings.initialAngle)
+
+            _numbaCartesianKernel(coefficients, out, float(settings.center[0]), float(settings.center[1]),
+                                  float(initialRadius), float(settings.initialAngle), float(scaleRadius),
+                                  float(scaleAngle), settings.radialScale == 'log', *options)
+
+
+# Interpolation backends by name, see registerBackend
+_backends = {
+    'scipy': _ScipyBackend(),
+    'numpy': _GatherBackend(fixedPoint=False),
+    'gather': _GatherBackend(fixedPoint=True),
+    'matrix': _MatrixBackend(),
+    'numba': _NumbaBackend(),
+}
+_builtinBackends = tuple(_backends)
+
+
+def registerBackend(name, backend):
+    """Add interpolation backend that can be selected by name
+
+    The backend can then be used by passing its name as the :obj:`backend` argument of the conversion functions and
+    plans. It is also one of the candidates that are benchmarked by the 'auto' backend.
+
+    Parameters
+    ----------
+    name : :class:`str`
+        Name of the backend. If a backend with this name was already added, it is replaced. The built-in backends and
+        'auto' cannot be replaced.
+    backend : :class:`InterpolationBackend`
+        Backend to add
+    """
+    if name in _builtinBackends or name == 'auto':
+        raise ValueError('Backend %s is built-in and cannot be replaced' % name)
+
+    if not isinstance(backend, InterpolationBackend):
+        raise ValueError('Backend must be an instance of InterpolationBackend')
+
+    _backends[name] = backend
+
+
+def _checkBackend(backend):
+    # Raise an error for unknown backend names, None selects the default backend
+    if backend is not None and backend != 'auto' and backend not in _backends:
+        raise ValueError('Invalid backend %s, must be one of %s' % (backend, ', '.join(['auto'] + list(_backends))))
+
+
+def _getDefaultBackend(plan, coefficients, out):
+    # Gathering is used for nearest neighbor and bilinear interpolation with border modes that clamp to the image, in
+    # fixed point for integer images where possible, and map_coordinates otherwise
+    for name in ('gather', 'numpy'):
+        if _backends[name].isSupported(plan, coefficients, out):
+            return name
+
+    return 'scipy'
+
+
+# File that the backends selected by the 'auto' backend are stored in, see setBackendCacheFile
+_backendCacheFile = os.environ.get('POLARTRANSFORM_BACKEND_CACHE',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'polarTransform', 'backends.json'))
+
+# Backends selected by the 'auto' backend for each tuning key, read from the cache file on first use
+_tunedBackends = None
+_tunedBackendsLock = threading.Lock()
+
+
+def setBackendCacheFile(path):
+    """Set file that the backends selected by the 'auto' backend are stored in
+
+    The first time the 'auto' backend converts an image of a given size, datatype, order and border, the supported
+    backends are benchmarked and the fastest one is stored in this JSON file. Later conversions, including those of
+    other processes, read the selection from the file instead of benchmarking again.
+
+    The default file is ``~/.cache/polarTransform/backends.json`` unless the ``POLARTRANSFORM_BACKEND_CACHE``
+    environment variable is set.
+
+    Parameters
+    ----------
+    path : :class:`str` or :obj:`None`
+        Path of the cache file. If :obj:`None`, the selected backends are only kept in memory for the current process.
+    """
+    global _backendCacheFile, _tunedBackends
+
+    with _tunedBackendsLock:
+        _backendCacheFile = path
+        _tunedBackends = None
+
+
+def clearBackendCache():
+    """Remove backends selected by the 'auto' backend
+
+    The selections are removed from memory and the cache file is deleted, so the backends are benchmarked again. This
+    is useful after the hardware or installed packages change.
+    """
+    global _tunedBackends
+
+    with _tunedBackendsLock:
+        _tunedBackends = {}
+
+        if _backendCacheFile is not None and os.path.exists(_backendCacheFile):
+            os.remove(_backendCacheFile)
+
+
+def _getTuningKey(plan, coefficients, out):
+    # Backends are benchmarked separately for each direction, size, datatype, number of channels, order and border
+    channels = coefficients.shape[2] if coefficients.ndim == 3 else 1
+
+    return '%s %ix%i->%ix%i %s->%s channels=%i order=%i border=%s precision=%s%s' % (
+        plan.direction, *plan.inputSize, *plan.outputSize, coefficients.dtype, out.dtype, channels, plan.order,
+        plan.border, plan.precision, ' masked' if plan.masked else '')
+
+
+def _readBackendCache():
+    # Read the selected backends from the cache file, a missing or invalid file is the same as an empty one
+    if _backendCacheFile is None:
+        return {}
+
+    try:
+        with open(_backendCacheFile) as file:
+            tunedBackends = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    return tunedBackends if isinstance(tunedBackends, dict) else {}
+
+
+def _getTunedBackend(tuningKey):
+    # Name of the backend selected for the tuning key or None if it has not been benchmarked yet
+    global _tunedBackends
+
+    with _tunedBackendsLock:
+        if _tunedBackends is None:
+            _tunedBackends = _readBackendCache()
+
+        return _tunedBackends.get(tuningKey)
+
+
+def _setTunedBackend(tuningKey, name):
+    # Store the selected backend in memory and in the cache file
+    # The file is read again so that the selections of other processes are kept, and it is replaced in one step so
+    # that other processes never read a partially written file. Storing the file is best effort, if it cannot be
+    # written then the backend is only benchmarked again by the next process.
+    global _tunedBackends
+
+    with _tunedBackendsLock:
+        if _tunedBackends is None:
+            _tunedBackends = {}
+
+        _tunedBackends[tuningKey] = name
+
+        if _backendCacheFile is None:
+            return
+
+        tunedBackends = _readBackendCache()
+        tunedBackends.update(_tunedBackends)
+        temporaryFile = '%s.%i.tmp' % (_backendCacheFile, os.getpid())
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(_backendCacheFile)), exist_ok=True)
+            with open(temporaryFile, 'w') as file:
+                json.dump(tunedBackends, file, indent=1, sort_keys=True)
+
+            os.replace(temporaryFile, _backendCacheFile)
+        except OSError:
+            pass
+
+
+if numba is not None:
+    @numba.njit(cache=True, nogil=True)
+    def _numbaCast(value, isInteger, lower, upper):
+        # Round half away from zero and clip integer values, same as _castInterpolated
+        if isInteger:
+            value = min(max(np.trunc(value + np.copysign(0.5, value)), lower), upper)
+
+        return value
+
+    @numba.njit(cache=True, nogil=True)
+    def _numbaTapIndex(index, size, nearest):
+        # Index of a coefficient along one axis, indices outside the coefficients are clamped for the nearest border and
+        # mirrored for the constant border, same as map_coordinates
+        if nearest:
+            return min(max(index, 0), size - 1)
+
+        period = max(2 * size - 2, 1)
+        index = abs(index) % period
+
+        return period - index if index >= size else index
+
+    @numba.njit(cache=True, nogil=True)
+    def _numbaCubicTaps(coordinate, size, nearest):
+        # Indices and cubic B-spline weights of the four coefficients around the coordinate along one axis
+        start = np.floor(coordinate)
+        t = coordinate - start
+        weights = ((1 - t) ** 3 / 6, (3 * t ** 3 - 6 * t ** 2 + 4) / 6, (-3 * t ** 3 + 3 * t ** 2 + 3 * t + 1) / 6,
+                   t ** 3 / 6)
+
+        start = int(start)
+        indices = (_numbaTapIndex(start - 1, size, nearest), _numbaTapIndex(start, size, nearest),
+                   _numbaTapIndex(start + 1, size, nearest), _numbaTapIndex(start + 2, size, nearest))
+
+        return indices, weights
+
+    @numba.njit(cache=True, nogil=True)
+    def _numbaInterpolate(source, out, i, j, y, x, order, nearest, margin, borderVal, isInteger, lower, upper):
+        # Interpolate all channels of the source at (y, x) and store them in out[i, j]
+        # For order 0 and 1, this is the same as _gatherInterpolate. For the constant border, points beyond the margin
+        # are filled with the border value, otherwise the point is clamped to the image. For order 3, this is the same
+        # as map_coordinates on the padded spline coefficients.
+        height, width, channels = source.shape
+
+        if not nearest:
+            if order <= 1:
+                isOutside = y < -margin or y > height - 1 + margin or x < -margin or x > width - 1 + margin
+            else:
+                isOutside = y < 0 or y > height - 1 or x < 0 or x > width - 1
+
+            if isOutside:
+                for k in range(channels):
+                    out[i, j, k] = _numbaCast(borderVal, isInteger, lower, upper)
+
+                return
+
+        if order <= 1:
+            y, x = min(max(y, 0.0), height - 1.0), min(max(x, 0.0), width - 1.0)
+
+        if order == 0:
+            # Nearest neighbor rounds half up
+            row, column = int(np.floor(y + 0.5)), int(np.floor(x + 0.5))
+
+            for k in range(channels):
+                out[i, j, k] = source[row, column, k]
+        elif order == 1:
+            # Top-left pixel of the 2x2 neighborhood is moved up or left at the last row or column
+            row, column = min(int(np.floor(y)), max(height - 2, 0)), min(int(np.floor(x)), max(width - 2, 0))
+            fy, fx = y - row, x - column
+            rowStep, columnStep = (1 if height > 1 else 0), (1 if width > 1 else 0)
+
+            for k in range(channels):
+                top = source[row, column, k] * (1 - fx) + source[row, column + columnStep, k] * fx
+                bottom = source[row + rowStep, column, k] * (1 - fx) + \
+                    source[row + rowStep, column + columnStep, k] * fx
+                out[i, j, k] = _numbaCast(top * (1 - fy) + bottom * fy, isInteger, lower, upper)
+        else:
+            rows, rowWeights = _numbaCubicTaps(y, height, nearest)
+            columns, columnWeights = _numbaCubicTaps(x, width, nearest)
+
+            for k in range(channels):
+                value = 0.0
+                for a in range(4):
+                    rowValue = 0.0
+                    for b in range(4):
+                        rowValue += columnWeights[b] * source[rows[a], columns[b], k]
+
+                    value += rowWeights[a] * rowValue
+
+                out[i, j, k] = _numbaCast(value, isInteger, lower, upper)
+
+    @numba.njit(cache=True, parallel=True)
+    def _numbaPolarKernel(source, out, radii, cosTheta, sinTheta, centerX, centerY, top, left, padding, order, nearest,
+                          margin, borderVal, isInteger, lower, upper):
+        # Convert cartesian image to polar image, same coordinates as _getPolarImageCoordinates
+        # The source is the crop of the padded image starting at the top and left offsets, see TransformPlan
+        for i in numba.prange(out.shape[0]):
+            for j in range(out.shape[1]):
+                y = radii[i] * sinTheta[j] + centerY + padding - top
+                x = radii[i] * cosTheta[j] + centerX + padding - left
+
+                _numbaInterpolate(source, out, i, j, y, x, order, nearest, margin, borderVal, isInteger, lower, upper)
+
+    @numba.njit(cache=True, parallel=True)
+    def _numbaCartesianKernel(source, out, centerX, centerY, initialRadius, initialAngle, scaleRadius, scaleAngle,
+                              logRadius, padding, order, nearest, margin, borderVal, isInteger, lower, upper):
+        # Convert polar image to cartesian image, same coordinates as _getCartesianImageCoordinates
+        for i in numba.prange(out.shape[0]):
+            cY = i - centerY
+
+            for j in range(out.shape[1]):
+                cX = j - centerX
+                r = np.sqrt(cX * cX + cY * cY)
+                theta = np.arctan2(cY, cX)
+                if theta < 0:
+                    theta += 2 * np.pi
+
+                if logRadius:
+                    r = np.log1p(r)
+
+                r = (r - initialRadius) * scaleRadius
+                theta = ((theta - initialAngle + 2 * np.pi) % (2 * np.pi)) * scaleAngle
+
+                _numbaInterpolate(source, out, i, j, r + padding, theta + padding, order, nearest, margin, borderVal,
+                                  isInteger, lower, upper)
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'count', 'currentBytes', 'maxBytes'])
+
+
+class PlanCache:
+    def __init__(self, maxBytes=0):
+        """Least-recently-used cache of transform plans, or other entries, bounded by size in bytes
+
+        The cache is used by :func:`convertToPolarImage` and :func:`convertToCartesianImage` to reuse the transform
+        metadata and coordinate maps between calls with identical arguments. When adding an entry would exceed
+        :obj:`maxBytes`, the least recently used entries are evicted until the entry fits.
+
+        The size of an entry is its ``nbytes`` attribute, so any object that has one can be cached, such as the
+        :class:`numpy.ndarray` grids of polar offsets that are shared between transforms with different centers.
+
+        .. note::
+            The module-level caches are disabled by default. Use :func:`setCacheSize` to enable them.
+
+        Parameters
+        ----------
+        maxBytes : :class:`int`, optional
+            Maximum number of bytes the entries in the cache may use. A value of 0 disables the cache.
+
+            Default is 0
+        """
+        self.maxBytes = maxBytes
+        self.currentBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._plans = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Retrieve plan or other entry from cache, marking it as most recently used
+
+        Parameters
+        ----------
+        key : :class:`tuple`
+            Key of the entry
+
+        Returns
+        -------
+        plan : :class:`TransformPlan` or :obj:`None`
+            Plan or other entry stored under :obj:`key` or :obj:`None` if it is not in the cache
+        """
+        with self._lock:
+            entry = self._plans.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._plans.move_to_end(key)
+
+            return entry[0]
+
+    def put(self, key, plan):
+        """Add plan or other entry to cache, evicting the least recently used entries if necessary
+
+        Entries that are larger than :attr:`maxBytes` by themselves are not added. The size of the entry is recorded
+        when it is added.
+
+        Parameters
+        ----------
+        key : :class:`tuple`
+            Key of the entry
+        plan : :class:`TransformPlan`
+            Plan to add, or any other entry with an ``nbytes`` attribute
+        """
+        nbytes = plan.nbytes
+
+        with self._lock:
+            if nbytes > self.maxBytes:
+                return
+
+            if key in self._plans:
+                self.currentBytes -= self._plans.pop(key)[1]
+
+            while self._plans and self.currentBytes + nbytes > self.maxBytes:
+                _, (evictedPlan, evictedBytes) = self._plans.popitem(last=False)
+                self.currentBytes -= evictedBytes
+                self.evictions += 1
+
+            self._plans[key] = (plan, nbytes)
+            self.currentBytes += nbytes
+
+    def resize(self, maxBytes):
+        """Change the maximum size of the cache, evicting entries if necessary
+
+        Parameters
+        ----------
+        maxBytes : :class:`int`
+            Maximum number of bytes the entries in the cache may use. A value of 0 disables the cache.
+        """
+        with self._lock:
+            self.maxBytes = maxBytes
+
+            while self._plans and self.currentBytes > self.maxBytes:
+                _, (evictedPlan, evictedBytes) = self._plans.popitem(last=False)
+                self.currentBytes -= evictedBytes
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries from the cache and reset the statistics"""
+        with self._lock:
+            self._plans.clear()
+            self.currentBytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """Get statistics of the cache
+
+        Returns
+        -------
+        info : :class:`CacheInfo`
+            Named tuple containing the number of hits, misses and evictions, the number of entries in the cache, the
+            number of bytes used and the maximum number of bytes
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._plans), self.currentBytes,
+                             self.maxBytes)
+
+    def __len__(self):
+        return len(self._plans)
+
+    def __repr__(self):
+        return 'PlanCache(maxBytes=%i)' % self.maxBytes
+
+    def __str__(self):
+        return self.__repr__()
+
+
+# Module-level cache used by convertToPolarImage and convertToCartesianImage, disabled by default
+_planCache = PlanCache()
+
+# Cache of the grids of polar offsets shared between plans with different centers, see _getPolarGrid. It only uses the
+# nbytes of its entries, so it holds arrays rather than plans. It has the same maximum size as the plan cache and is
+# disabled with it.
+_gridCache = PlanCache()
+
+
+def setCacheSize(maxBytes):
+    """Set maximum size of the plan cache used by :func:`convertToPolarImage` and :func:`convertToCartesianImage`
+
+    When enabled, calls with identical image shape, transform arguments and interpolation options reuse the transform
+    metadata and coordinate maps from a previous call instead of recomputing them. The grids of polar offsets that are
+    shared between transforms with different centers are cached separately, with the same maximum size. Both caches
+    are disabled by default, so a new center only reuses the grid of a previous conversion once this is called.
+
+    Parameters
+    ----------
+    maxBytes : :class:`int`
+        Maximum number of bytes the cached plans may use. A value of 0 disables the cache.
+
+    See Also
+    --------
+    :func:`getCacheInfo`, :func:`clearCache`
+    """
+    _planCache.resize(maxBytes)
+    _gridCache.resize(maxBytes)
+
+
+def getCacheInfo():
+    """Get statistics of the plan cache used by :func:`convertToPolarImage` and :func:`convertToCartesianImage`
+
+    Returns
+    -------
+    info : :class:`CacheInfo`
+        Named tuple containing the number of hits, misses and evictions, the number of plans in the cache, the number
+        of bytes used and the maximum number of bytes
+
+    See Also
+    --------
+    :func:`setCacheSize`, :func:`clearCache`
+    """
+    return _planCache.info()
+
+
+def clearCache():
+    """Remove all plans from the plan cache and reset the statistics
+
+    The cached grids of polar offsets shared between transforms with different centers are removed as well.
+
+    See Also
+    --------
+    :func:`setCacheSize`, :func:`getCacheInfo`
+    """
+    _planCache.clear()
+    _gridCache.clear()
+
+
+def _getCacheKey(*args):
+    # Convert the arguments into a hashable key, converting arrays and lists into tuples
+    key = []
+
+    for arg in args:
+        if isinstance(arg, (np.ndarray, list, tuple)):
+            arg = tuple(np.asarray(arg).ravel().tolist())
+        elif isinstance(arg, np.generic):
+            arg = arg.item()
+
+        key.append(arg)
+
+    return tuple(key)
+
+
+def _lookupPlan(direction, imageShape, order, border, borderVal, precision, backend, settings, arguments,
+                masked=False):
+    """Retrieve plan for a conversion from the plan cache
+
+    Parameters
+    ----------
+    direction : {'polar', 'cartesian'}
+        Domain that the image is converted to
+    imageShape : :class:`tuple` of :class:`int`
+        Shape of the image that is converted
+    order, border, borderVal, precision, backend
+        Interpolation options of the conversion
+    settings : :class:`ImageTransform` or :obj:`None`
+        Settings given for the conversion
+    arguments : :class:`tuple`
+        Remaining arguments of the conversion that determine the settings, only used if :obj:`settings` is
+        :obj:`None`
+    masked : :class:`bool`, optional
+        Whether the conversion only interpolates the pixels inside the polar image
+
+    Returns
+    -------
+    plan : :class:`TransformPlan` or :obj:`None`
+        Cached plan or :obj:`None` if the cache is disabled or the plan is not in the cache
+    settings : :class:`ImageTransform` or :obj:`None`
+        The given settings, or a copy of the settings of the cached plan if no settings were given. The settings are
+        copied so that changes to the returned settings do not affect the cache
+    cacheKey : :class:`tuple` or :obj:`None`
+        Key to store the plan under using :func:`_storePlan` or :obj:`None` if the cache is disabled
+    """
+    if _planCache.maxBytes <= 0:
+        return None, settings, None
+
+    if settings is None:
+        cacheKey = _getCacheKey(direction, imageShape, order, border, borderVal, precision, backend, masked,
+                                'arguments', *arguments)
+    else:
+        cacheKey = _getCacheKey(direction, imageShape, order, border, borderVal, precision, backend, masked, 'settings',
+                                settings.center, settings.initialRadius, settings.finalRadius, settings.initialAngle,
+                                settings.finalAngle, settings.cartesianImageSize, settings.polarImageSize,
+                                settings.radialScale)
+
+    plan = _planCache.get(cacheKey)
+
+    if plan is not None and settings is None:
+        settings = _copySettings(plan.settings)
+
+    return plan, settings, cacheKey
+
+
+def _storePlan(cacheKey, plan):
+    # Add plan to the cache, or update its size if it is already cached, unless the cache is disabled
+    if cacheKey is not None:
+        _planCache.put(cacheKey, plan)
+
+
+def _allocateOutput(plan, image):
+    # Allocate a new output array for converting the image with the plan rather than using the plan's output buffer,
+    # which is shared when the plan is cached
+    return np.empty(plan._getOutputShape(image), dtype=plan._getOutputDtype(image))
+
+
+def _copySettings(settings):
+    # Shallow copy of the settings with a copy of the center so that in-place changes to the center of one do not
+    # affect the other
+    settings = copy.copy(settings)
+    settings.center = copy.copy(settings.center)
+
+    return settings
+
+
+def _getDefaultWorkers():
+    # Default number of workers from the environment, falling back to a single thread
+    try:
+        return max(int(os.environ.get('POLARTRANSFORM_NUM_THREADS', 1)), 1)
+    except ValueError:
+        return 1
+
+
+_numWorkers = _getDefaultWorkers()
+
+
+def setNumWorkers(workers):
+    """Set the default number of threads used for conversions
+
+    Interpolation and prefiltering release the GIL, so large conversions can be split between multiple threads. The
+    work is split by channel, by frame or by chunks of the output image, and the result is the same for any number of
+    workers.
+
+    The initial default is read from the ``POLARTRANSFORM_NUM_THREADS`` environment variable, or a single thread if it
+    is not set. The default is used when the :obj:`workers` argument of a conversion is not specified.
+
+    Parameters
+    ----------
+    workers : :class:`int`
+        Number of threads to use. Negative values count back from the number of CPUs, so -1 uses all CPUs.
+    """
+    global _numWorkers
+
+    _numWorkers = _resolveWorkers(workers)
+
+
+def getNumWorkers():
+    """Get the default number of threads used for conversions
+
+    Returns
+    -------
+    workers : :class:`int`
+        Number of threads used when the :obj:`workers` argument of a conversion is not specified
+
+    See Also
+    --------
+    :func:`setNumWorkers`
+    """
+    return _numWorkers
+
+
+def _resolveWorkers(workers):
+    # Convert the workers argument to a number of threads, using the module default if not specified
+    if workers is None:
+        return _numWorkers
+
+    workers = int(workers)
+    if workers == 0:
+        raise ValueError('Number of workers must be nonzero')
+    elif workers < 0:
+        workers = max((os.cpu_count() or 1) + 1 + workers, 1)
+
+    return workers
+
+
+def _splitRange(size, count):
+    # Split range into count contiguous chunks of nearly equal size, skipping empty chunks
+    bounds = [size * k // count for k in range(count + 1)]
+
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def _runParallel(function, tasks, workers):
+    # Call function with the arguments of each task, spread over a pool of threads if there is more than one worker
+    # The tasks must write to separate parts of the output so that the order they run in does not matter
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            function(*task)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        futures = [executor.submit(function, *task) for task in tasks]
+
+        # Retrieve results to raise any exception from the threads
+        for future in futures:
+            future.result()
+
+
+def getCartesianPoints(rTheta, center):
+    """Convert list of polar points to cartesian points
+
+    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+
+    Parameters
+    ----------
+    rTheta : (N, 2) or (2,) :class:`numpy.ndarray`
+        List of cartesian points to convert to polar domain
+
+        First column is r and second column is theta
+    center : (2,) :class:`numpy.ndarray`
+        Center to use for conversion to cartesian domain of polar points
+
+        Format of center is (x, y)
+
+    Returns
+    -------
+    cartesianPoints : (N, 2) :class:`numpy.ndarray`
+        Corresponding cartesian points from cartesian :obj:`rTheta`
+
+        First column is x and second column is y
+
+    See Also
+    --------
+    :meth:`getCartesianPoints2`
+    """
+    if rTheta.ndim == 2:
+        x = rTheta[:, 0] * np.cos(rTheta[:, 1]) + center[0]
+        y = rTheta[:, 0] * np.sin(rTheta[:, 1]) + center[1]
+    else:
+        x = rTheta[0] * np.cos(rTheta[1]) + center[0]
+        y = rTheta[0] * np.sin(rTheta[1]) + center[1]
+
+    return np.array([x, y]).T
+
+
+def getCartesianPoints2(r, theta, center):
+    """Convert list of polar points to cartesian points
+
+    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+
+    Parameters
+    ----------
+    r : (N,) :class:`numpy.ndarray`
+        List of polar r points to convert to cartesian domain
+    theta : (N,) :class:`numpy.ndarray`
+        List of polar theta points to convert to cartesian domain
+    center : (2,) :class:`numpy.ndarray`
+        Center to use for conversion to cartesian domain of polar points
+
+        Format of center is (x, y)
+
+    Returns
+    -------
+    x : (N,) :class:`numpy.ndarray`
+        Corresponding x points from polar :obj:`r` and :obj:`theta`
+    y : (N,) :class:`numpy.ndarray`
+        Corresponding y points from polar :obj:`r` and :obj:`theta`
+
+    See Also
+    --------
+    :meth:`getCartesianPoints`
+    """
+    x = r * np.cos(theta) + center[0]
+    y = r * np.sin(theta) + center[1]
+
+    return x, y
+
+
+def getPolarPoints(xy, center):
+    """Convert list of cartesian points to polar points
+    
+    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+    
+    Parameters
+    ----------
+    xy : (N, 2) or (2,) :class:`numpy.ndarray`
+        List of cartesian points to convert to polar domain
+
+        First column is x and second column is y
+    center : (2,) :class:`numpy.ndarray`
+        Center to use for conversion to polar domain of cartesian points
+        
+        Format of center is (x, y)
+
+    Returns
+    -------
+    polarPoints : (N, 2) :class:`numpy.ndarray`
+        Corresponding polar points from cartesian :obj:`xy`
+        
+        First column is r and second column is theta
+        
+    See Also
+    --------
+    :meth:`getPolarPoints2`
+    """
+    if xy.ndim == 2:
+        cX, cY = xy[:, 0] - center[0], xy[:, 1] - center[1]
+    else:
+        cX, cY = xy[0] - center[0], xy[1] - center[1]
+
+    r = np.sqrt(cX ** 2 + cY ** 2)
+    theta = np.arctan2(cY, cX)
+
+    # Make range of theta 0 -> 2pi instead of -pi -> pi
+    # According to StackOverflow, this is the fastest method:
+    # https://stackoverflow.com/questions/37358016/numpy-converting-range-of-angles-from-pi-pi-to-0-2pi
+    theta = np.where(theta < 0, theta + 2 * np.pi, theta)
+
+    return np.array([r, theta]).T
+
+
+def getPolarPoints2(x, y, center):
+    """Convert list of cartesian points to polar points
+
+    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+
+    Parameters
+    ----------
+    x : (N,) :class:`numpy.ndarray`
+        List of cartesian x points to convert to polar domain
+    y : (N,) :class:`numpy.ndarray`
+        List of cartesian y points to convert to polar domain
+    center : (2,) :class:`numpy.ndarray`
+        Center to use for conversion to polar domain of cartesian points
+
+        Format of center is (x, y)
 
     Returns
     -------
@@ -451,7 +3310,7 @@ def getPolarPointsImage(points, settings):
         needSqueeze = False
 
     # This is used to scale the result of the radius to get the appropriate Cartesian value
-    scaleRadius = settings.polarImageSize[0] / (settings.finalRadius - settings.initialRadius)
+    initialRadius, scaleRadius = _getRadialScale(settings)
 
     # This is used to scale the result of the angle to get the appropriate Cartesian value
     scaleAngle = settings.polarImageSize[1] / (settings.finalAngle - settings.initialAngle)
@@ -459,8 +3318,11 @@ def getPolarPointsImage(points, settings):
     # Take cartesian grid and convert to polar coordinates
     polarPoints = getPolarPoints(points, settings.center)
 
+    if settings.radialScale == 'log':
+        polarPoints[:, 0] = np.log1p(polarPoints[:, 0])
+
     # Offset the radius by the initial source radius
-    polarPoints[:, 0] = polarPoints[:, 0] - settings.initialRadius
+    polarPoints[:, 0] = polarPoints[:, 0] - initialRadius
 
     # Offset the theta angle by the initial source angle
     # The theta values may go past 2pi, so they are looped back around by taking modulo with 2pi.
@@ -468,95 +3330,762 @@ def getPolarPointsImage(points, settings):
     # theta = np.mod(theta - initialAngle + 2 * np.pi, 2 * np.pi)
     polarPoints[:, 1] = np.mod(polarPoints[:, 1] - settings.initialAngle + 2 * np.pi, 2 * np.pi)
 
-    # Scale the radius using scale factor
-    # Scale the angle from radians to pixels using scale factor
-    polarPoints = polarPoints * [scaleRadius, scaleAngle]
+    # Scale the radius using scale factor
+    # Scale the angle from radians to pixels using scale factor
+    polarPoints = polarPoints * [scaleRadius, scaleAngle]
+
+    if needSqueeze:
+        return np.squeeze(polarPoints)
+    else:
+        return polarPoints
+
+
+def getCartesianPointsImage(points, settings):
+    """Convert list of polar points from image to cartesian image points based on transform metadata
+
+    .. warning::
+        Cleaner and more succinct to use :meth:`ImageTransform.getCartesianPointsImage`
+
+    .. note::
+        This does **not** convert from polar to cartesian points, but rather converts pixels from polar image to
+        pixels from cartesian image using :class:`ImageTransform`.
+
+    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+
+    Parameters
+    ----------
+    points : (N, 2) or (2,) :class:`numpy.ndarray`
+        List of polar points to convert to cartesian domain
+
+        First column is r and second column is theta
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion from polar to cartesian domain
+
+        Settings contains many of the arguments in :func:`convertToPolarImage` and :func:`convertToCartesianImage` and
+        provides an easy way of passing these parameters along without having to specify them all again.
+
+    Returns
+    -------
+    cartesianPoints : (N, 2) or (2,) :class:`numpy.ndarray`
+        Corresponding cartesian points from polar :obj:`points` using :obj:`settings`
+
+    See Also
+    --------
+    :meth:`ImageTransform.getCartesianPointsImage`, :meth:`getCartesianPoints`, :meth:`getCartesianPoints2`
+    """
+    # Convert points to NumPy array
+    points = np.asanyarray(points)
+
+    # If there is only one point specified and number of dimensions is only one, then make the array a 1x2 array so that
+    # points[:, 0/1] will not throw an error
+    if points.ndim == 1 and points.shape[0] == 2:
+        points = np.expand_dims(points, axis=0)
+        needSqueeze = True
+    else:
+        needSqueeze = False
+
+    # This is used to scale the result of the radius to get the appropriate Cartesian value
+    initialRadius, scaleRadius = _getRadialScale(settings)
+
+    # This is used to scale the result of the angle to get the appropriate Cartesian value
+    scaleAngle = settings.polarImageSize[1] / (settings.finalAngle - settings.initialAngle)
+
+    # Create a new copy of the points variable because we are going to change it and don't want the points parameter to
+    # change outside of this function
+    points = points.copy()
+
+    # Scale the radius using scale factor
+    # Scale the angle from radians to pixels using scale factor
+    points = points / [scaleRadius, scaleAngle]
+
+    # Offset the radius by the initial source radius
+    points[:, 0] = points[:, 0] + initialRadius
+
+    if settings.radialScale == 'log':
+        points[:, 0] = np.expm1(points[:, 0])
+
+    # Offset the theta angle by the initial source angle
+    # The theta values may go past 2pi, so they are looped back around by taking modulo with 2pi.
+    # Note: This assumes initial source angle is positive
+    # theta = np.mod(theta - initialAngle + 2 * np.pi, 2 * np.pi)
+    points[:, 1] = np.mod(points[:, 1] + settings.initialAngle + 2 * np.pi, 2 * np.pi)
+
+    # Take cartesian grid and convert to polar coordinates
+    cartesianPoints = getCartesianPoints(points, settings.center)
+
+    if needSqueeze:
+        return np.squeeze(cartesianPoints)
+    else:
+        return cartesianPoints
+
+
+def _getRadii(settings):
+    """Get the radius of each row of the polar image
+
+    Parameters
+    ----------
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+
+    Returns
+    -------
+    radii : (N,) :class:`numpy.ndarray`
+        Radius of each row of the polar image, where N is the radial size of the polar image
+    """
+    # Create radii from start to finish with radiusSize
+    # Set endpoint to False to NOT include the final sample specified. Think of it like this, if you ask to count from
+    # 0 to 30, that is 31 numbers not 30. Thus, we count 0...29 to get 30 numbers.
+    # For the log scale, log(1 + r) is evenly spaced instead, see _getRadialScale
+    if settings.radialScale == 'log':
+        return np.expm1(np.linspace(np.log1p(settings.initialRadius), np.log1p(settings.finalRadius),
+                                    settings.polarImageSize[0], endpoint=False))
+
+    return np.linspace(settings.initialRadius, settings.finalRadius, settings.polarImageSize[0], endpoint=False)
+
+
+def _getRadialScale(settings):
+    # Offset and scale factor that map a radius to the row of the polar image, row = (r - offset) * scale
+    # For the log scale, the radius is replaced by log(1 + r) before applying these. The one is added so that the scale
+    # is defined at the center, where the spacing between rows is the smallest.
+    initialRadius, finalRadius = settings.initialRadius, settings.finalRadius
+
+    if settings.radialScale == 'log':
+        initialRadius, finalRadius = np.log1p(initialRadius), np.log1p(finalRadius)
+
+    return initialRadius, settings.polarImageSize[0] / (finalRadius - initialRadius)
+
+
+@functools.lru_cache(maxsize=32)
+def _getTrigTable(initialAngle, finalAngle, angleSize):
+    """Get cosine and sine of each angle of the polar image
+
+    The tables only depend on the angles and are cached, so they are shared between transforms with different radii or
+    centers.
+
+    Parameters
+    ----------
+    initialAngle : :class:`float`
+        Starting angle in radians in the polar image
+    finalAngle : :class:`float`
+        Final angle in radians in the polar image, not included in the tables
+    angleSize : :class:`int`
+        Size of polar image for angular (2nd) dimension
+
+    Returns
+    -------
+    cosTheta : (angleSize,) :class:`numpy.ndarray`
+        Read-only table of the cosine of each angle
+    sinTheta : (angleSize,) :class:`numpy.ndarray`
+        Read-only table of the sine of each angle
+    """
+    theta = np.linspace(initialAngle, finalAngle, angleSize, endpoint=False)
+    cosTheta, sinTheta = np.cos(theta), np.sin(theta)
+
+    # Tables are shared by the cache, so prevent them from being modified
+    cosTheta.flags.writeable = False
+    sinTheta.flags.writeable = False
+
+    return cosTheta, sinTheta
+
+
+def _getPolarImageCoordinates(settings, rows=slice(None), columns=slice(None), dtype=np.float64):
+    """Get the cartesian image coordinates sampled by each pixel of the polar image
+
+    Parameters
+    ----------
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+    rows, columns : :class:`slice`, optional
+        Rows (radii) and columns (angles) of the polar image to get the coordinates for, default is the entire image
+    dtype : :class:`numpy.dtype`, optional
+        Floating point datatype of the coordinates, default is float64
+
+    Returns
+    -------
+    coordinates : (2, N, M) :class:`numpy.ndarray`
+        Cartesian coordinates for each pixel of the polar image, where N and M are the radial and angular size of the
+        polar image or the number of rows and columns selected.
+
+        First item is the y-coordinate (row) and second item is the x-coordinate (column)
+    """
+    # The offsets from the center do not depend on the center, so the grid of the entire polar image is shared between
+    # settings with different centers, including fractional centers. Tiles only calculate their part of the grid so
+    # that the memory used stays bounded.
+    if rows == slice(None) and columns == slice(None):
+        grid = _getPolarGrid(settings, dtype)
+    else:
+        grid = _getPolarOffsets(settings, rows, columns, dtype)
+
+    # Move the grid to the center, which is the same as adding the center to the coordinates in place
+    coordinates = np.empty(grid.shape, dtype=dtype)
+    np.add(grid[0], settings.center[1], out=coordinates[0], casting='unsafe')
+    np.add(grid[1], settings.center[0], out=coordinates[1], casting='unsafe')
+
+    return coordinates
+
+
+def _getPolarOffsets(settings, rows=slice(None), columns=slice(None), dtype=np.float64):
+    # Cartesian offsets from the center sampled by each pixel of the polar image, first item is the y offset (row) and
+    # second item is the x offset (column)
+    # Create radii from start to finish with radiusSize, do same for theta
+    radii = _getRadii(settings)
+    cosTheta, sinTheta = _getTrigTable(settings.initialAngle, settings.finalAngle, settings.polarImageSize[1])
+    radii = radii[rows].astype(dtype)
+    cosTheta, sinTheta = cosTheta[columns].astype(dtype), sinTheta[columns].astype(dtype)
+
+    # Take polar grid and convert to cartesian coordinates
+    # Cosine and sine only depend on the angle, so rather than evaluating them over the entire grid, the grid is the
+    # outer product of the radii and the trig tables. This gives the same result as getCartesianPoints2 on a meshgrid.
+    offsets = np.empty((2, radii.size, cosTheta.size), dtype=dtype)
+    np.multiply.outer(radii, sinTheta, out=offsets[0])
+    np.multiply.outer(radii, cosTheta, out=offsets[1])
+
+    return offsets
+
+
+def _getPolarGrid(settings, dtype=np.float64):
+    """Get the cartesian offsets from the center sampled by each pixel of the polar image
+
+    The offsets only depend on the radii, angles and size of the polar image, so the grid is a template that is shared
+    by all settings with different centers. The coordinates for a center are the grid plus the center. The grids are
+    cached while the plan cache is enabled, see :func:`setCacheSize`. The cache is opt-in like the plan cache, so
+    with the default cache size of 0 every call computes its grid.
+
+    Parameters
+    ----------
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image. The center is not used.
+    dtype : :class:`numpy.dtype`, optional
+        Floating point datatype of the grid, default is float64
+
+    Returns
+    -------
+    grid : (2, N, M) :class:`numpy.ndarray`
+        Read-only offsets from the center for each pixel of the polar image, where N and M are the radial and angular
+        size of the polar image.
+
+        First item is the y offset (row) and second item is the x offset (column)
+    """
+    # Grids are keyed on every transform argument except the center
+    # The grids are as large as the coordinate map of a plan, so they are bounded by the size of the plan cache
+    cacheKey = _getCacheKey(settings.initialRadius, settings.finalRadius, settings.initialAngle, settings.finalAngle,
+                            settings.polarImageSize, settings.radialScale, np.dtype(dtype).name)
+    grid = _gridCache.get(cacheKey) if _gridCache.maxBytes > 0 else None
+
+    if grid is None:
+        grid = _getPolarOffsets(settings, dtype=dtype)
+
+        # Grids are shared by the cache, so prevent them from being modified
+        grid.flags.writeable = False
+
+        if _gridCache.maxBytes > 0:
+            _gridCache.put(cacheKey, grid)
+
+    return grid
+
+
+def _isSymmetricCenter(imageSize, center):
+    # Center must be a whole pixel located inside the image for the polar grid to be symmetric about it
+    center = np.asarray(center)
+
+    return bool(np.all(np.mod(center, 1) == 0) and 0 <= center[0] < imageSize[1] and 0 <= center[1] < imageSize[0])
+
+
+def _getSymmetricPolarGrid(imageSize, center, dtype=np.float64):
+    """Convert grid of cartesian image pixels to polar points using symmetry about the center
+
+    The radius and angle for one octant of the largest quadrant are calculated and the remaining pixels are filled by
+    reflection. Mirroring about the diagonal gives the other octant, i.e. swapping x and y is the same as
+    :math:`\\frac{\\pi}{2} - \\theta`, and mirroring about the x and y axes gives the other three quadrants. For
+    non-square quadrants, the part that does not fit in the octant is calculated directly.
+
+    .. note::
+        The center must be a whole pixel inside the image, see :func:`_isSymmetricCenter`.
+
+    Parameters
+    ----------
+    imageSize : (2,) :class:`tuple` of :class:`int`
+        Size of cartesian image
+    center : (2,) :class:`numpy.ndarray` of :class:`int`
+        Center to use for conversion to polar domain of cartesian points
+
+        Format of center is (x, y)
+    dtype : :class:`numpy.dtype`, optional
+        Floating point datatype of the result, default is float64. The octant is always calculated in float64.
+
+    Returns
+    -------
+    r : (N, M) :class:`numpy.ndarray`
+        Radius of each pixel of the cartesian image
+    theta : (N, M) :class:`numpy.ndarray`
+        Angle of each pixel of the cartesian image in the range of 0 to :math:`2\\pi`
+
+    See Also
+    --------
+    :meth:`getPolarPoints2`
+    """
+    cX, cY = int(center[0]), int(center[1])
+    height, width = imageSize[0], imageSize[1]
+
+    # Number of pixels left, right, below and above the center
+    left, right, down, up = cX, width - 1 - cX, cY, height - 1 - cY
+
+    # Largest quadrant, rows are y offset and columns are x offset from center
+    maxX, maxY = max(left, right), max(down, up)
+    rQuadrant = np.empty((maxY + 1, maxX + 1), dtype=dtype)
+    thetaQuadrant = np.empty((maxY + 1, maxX + 1), dtype=dtype)
+
+    # Calculate one octant of the square portion of the quadrant, where the y offset is less than the x offset
+    # The other octant is the transpose with the angle mirrored about pi/4. The calculated octant is assigned last so
+    # the diagonal uses the calculated angle.
+    n = min(maxX, maxY) + 1
+    xOctant, yOctant = np.tril_indices(n)
+    rOctant = np.sqrt(xOctant ** 2 + yOctant ** 2)
+    thetaOctant = np.arctan2(yOctant, xOctant)
+
+    rQuadrant[xOctant, yOctant] = rOctant
+    thetaQuadrant[xOctant, yOctant] = np.pi / 2 - thetaOctant
+    rQuadrant[yOctant, xOctant] = rOctant
+    thetaQuadrant[yOctant, xOctant] = thetaOctant
+
+    # Calculate the remaining strip of a non-square quadrant directly
+    if maxX >= n:
+        xs, ys = np.arange(n, maxX + 1), np.arange(0, maxY + 1)[:, None]
+        rQuadrant[:, n:] = np.sqrt(xs ** 2 + ys ** 2)
+        thetaQuadrant[:, n:] = np.arctan2(ys, xs)
+    elif maxY >= n:
+        xs, ys = np.arange(0, maxX + 1), np.arange(n, maxY + 1)[:, None]
+        rQuadrant[n:, :] = np.sqrt(xs ** 2 + ys ** 2)
+        thetaQuadrant[n:, :] = np.arctan2(ys, xs)
+
+    r = np.empty((height, width), dtype=dtype)
+    theta = np.empty((height, width), dtype=dtype)
+
+    # Fill the four quadrants of the image by mirroring the quadrant about the x and y axes
+    # Slices to the left and below the center are reversed so that the offset from the center increases
+    r[cY:, cX:] = rQuadrant[:up + 1, :right + 1]
+    theta[cY:, cX:] = thetaQuadrant[:up + 1, :right + 1]
+
+    r[cY:, :cX][:, ::-1] = rQuadrant[:up + 1, 1:left + 1]
+    np.subtract(np.pi, thetaQuadrant[:up + 1, 1:left + 1], out=theta[cY:, :cX][:, ::-1])
+
+    r[:cY, cX:][::-1, :] = rQuadrant[1:down + 1, :right + 1]
+    np.subtract(2 * np.pi, thetaQuadrant[1:down + 1, :right + 1], out=theta[:cY, cX:][::-1, :])
+
+    r[:cY, :cX][::-1, ::-1] = rQuadrant[1:down + 1, 1:left + 1]
+    np.add(np.pi, thetaQuadrant[1:down + 1, 1:left + 1], out=theta[:cY, :cX][::-1, ::-1])
+
+    return r, theta
+
+
+def _getSymmetricPolarTile(imageSize, center, xs, ys, dtype=np.float64):
+    """Convert part of the grid of cartesian image pixels to polar points
+
+    Gives the same result as the corresponding part of :func:`_getSymmetricPolarGrid`, which is used when only a tile
+    of the image is needed. Each pixel is reflected into the quadrant and octant it would be calculated in by
+    :func:`_getSymmetricPolarGrid` and then the same calculation is done, so the result is identical.
+
+    Parameters
+    ----------
+    imageSize : (2,) :class:`tuple` of :class:`int`
+        Size of cartesian image
+    center : (2,) :class:`numpy.ndarray` of :class:`int`
+        Center to use for conversion to polar domain of cartesian points
+
+        Format of center is (x, y)
+    xs, ys : :class:`numpy.ndarray` of :class:`int`
+        Columns and rows of the cartesian image in the tile
+    dtype : :class:`numpy.dtype`, optional
+        Floating point datatype of the result, default is float64
+
+    Returns
+    -------
+    r : (N, M) :class:`numpy.ndarray`
+        Radius of each pixel of the tile
+    theta : (N, M) :class:`numpy.ndarray`
+        Angle of each pixel of the tile in the range of 0 to :math:`2\\pi`
+    """
+    cX, cY = int(center[0]), int(center[1])
+    height, width = imageSize[0], imageSize[1]
+
+    # Size of the square portion of the largest quadrant, see _getSymmetricPolarGrid
+    n = min(max(cX, width - 1 - cX), max(cY, height - 1 - cY)) + 1
+
+    # Offset from the center in the largest quadrant, rows are y offset and columns are x offset
+    dx, dy = np.abs(xs - cX)[None, :], np.abs(ys - cY)[:, None]
+
+    r = np.sqrt(dx ** 2 + dy ** 2).astype(dtype, copy=False)
+
+    # Pixels above the diagonal of the square portion are mirrored from the calculated octant
+    mirrored = (dy > dx) & (dy < n)
+    theta = np.where(mirrored, np.pi / 2 - np.arctan2(dx, dy), np.arctan2(dy, dx)).astype(dtype, copy=False)
+
+    # Mirror the quadrant about the x and y axes
+    left, down = (xs < cX)[None, :], (ys < cY)[:, None]
+    theta = np.where(left & ~down, np.pi - theta, theta)
+    theta = np.where(~left & down, 2 * np.pi - theta, theta)
+    theta = np.where(left & down, np.pi + theta, theta)
+
+    return r, theta
+
+
+def _getCartesianImageCoordinates(settings, rows=slice(None), columns=slice(None), dtype=np.float64):
+    """Get the polar image coordinates sampled by each pixel of the cartesian image
+
+    Parameters
+    ----------
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+    rows, columns : :class:`slice`, optional
+        Rows and columns of the cartesian image to get the coordinates for, default is the entire image
+    dtype : :class:`numpy.dtype`, optional
+        Floating point datatype of the coordinates, default is float64
+
+    Returns
+    -------
+    coordinates : (2, N, M) :class:`numpy.ndarray`
+        Polar coordinates for each pixel of the cartesian image, where N and M are the number of rows and columns of
+        the cartesian image or the number of rows and columns selected.
+
+        First item is the radial coordinate (row) and second item is the angular coordinate (column)
+    """
+    # This is used to scale the result of the radius to get the appropriate Cartesian value
+    initialRadius, scaleRadius = _getRadialScale(settings)
+
+    # This is used to scale the result of the angle to get the appropriate Cartesian value
+    scaleAngle = settings.polarImageSize[1] / (settings.finalAngle - settings.initialAngle)
+
+    # Get list of cartesian x and y coordinate
+    xs = np.arange(0, settings.cartesianImageSize[1])[columns]
+    ys = np.arange(0, settings.cartesianImageSize[0])[rows]
+
+    # When the center lies on a pixel of the cartesian image, the polar coordinates are symmetric about the center and
+    # only need to be calculated for one octant. Otherwise, fall back to calculating the coordinates for every pixel.
+    if _isSymmetricCenter(settings.cartesianImageSize, settings.center):
+        if xs.size == settings.cartesianImageSize[1] and ys.size == settings.cartesianImageSize[0]:
+            r, theta = _getSymmetricPolarGrid(settings.cartesianImageSize, settings.center, dtype)
+        else:
+            r, theta = _getSymmetricPolarTile(settings.cartesianImageSize, settings.center, xs, ys, dtype)
+    else:
+        # Take cartesian grid and convert to polar coordinates
+        # The offsets from the center are calculated for each row and column and then broadcast over the grid, which
+        # gives the same result as a meshgrid without creating it
+        cX = (xs - settings.center[0]).astype(dtype)[None, :]
+        cY = (ys - settings.center[1]).astype(dtype)[:, None]
+        r, theta = getPolarPoints2(cX, cY, (0, 0))
+
+    # Remaining steps are done in place so that the coordinates stay in the requested datatype
+    if settings.radialScale == 'log':
+        np.log1p(r, out=r)
+
+    # Offset the radius by the initial source radius
+    r -= initialRadius
+
+    # Offset the theta angle by the initial source angle
+    # The theta values may go past 2pi, so they are looped back around by taking modulo with 2pi.
+    # Note: This assumes initial source angle is positive
+    theta -= settings.initialAngle
+    theta += 2 * np.pi
+    np.mod(theta, 2 * np.pi, out=theta)
+
+    # Scale the radius using scale factor
+    r *= scaleRadius
+
+    # Scale the angle from radians to pixels using scale factor
+    theta *= scaleAngle
+
+    return np.stack((r, theta))
+
+
+def _getLogRadiusSize(linearSize, initialRadius, finalRadius, fovealRadius=None):
+    """Get the radius size of the log scale from the radius size of the linear scale
+
+    The spacing between the rows of the log scale is :math:`1 + r` times the spacing of :math:`\\log(1 + r)`, so no
+    number of rows matches the linear spacing at every radius. Instead, the rows are at least as dense as the linear
+    rows up to the foveal radius and sparser beyond it. The log scale never uses more rows than the linear scale.
+
+    Parameters
+    ----------
+    linearSize : :class:`int`
+        Radius size of the linear scale
+    initialRadius, finalRadius : :class:`float`
+        Radii of the first row and the end of the last row of the polar image
+    fovealRadius : :class:`float`, optional
+        Radius up to which the rows are at least as dense as the linear rows, limited to :obj:`initialRadius` and
+        :obj:`finalRadius`. If not specified, it is one tenth of the way from :obj:`initialRadius` to
+        :obj:`finalRadius`.
+
+    Returns
+    -------
+    radiusSize : :class:`int`
+        Radius size of the log scale
+    """
+    if finalRadius <= initialRadius:
+        return linearSize
+
+    if fovealRadius is None:
+        fovealRadius = initialRadius + (finalRadius - initialRadius) / 10
 
-    if needSqueeze:
-        return np.squeeze(polarPoints)
-    else:
-        return polarPoints
+    fovealRadius = min(max(fovealRadius, initialRadius), finalRadius)
 
+    # Spacing of the log rows at the foveal radius is (1 + fovealRadius) times the log span divided by the size, which
+    # equals the linear spacing (finalRadius - initialRadius) / linearSize for this size
+    scale = (1 + fovealRadius) * (np.log1p(finalRadius) - np.log1p(initialRadius)) / (finalRadius - initialRadius)
 
-def getCartesianPointsImage(points, settings):
-    """Convert list of polar points from image to cartesian image points based on transform metadata
+    return max(min(int(np.ceil(linearSize * scale)), int(linearSize)), 1)
 
-    .. warning::
-        Cleaner and more succinct to use :meth:`ImageTransform.getCartesianPointsImage`
 
-    .. note::
-        This does **not** convert from polar to cartesian points, but rather converts pixels from polar image to
-        pixels from cartesian image using :class:`ImageTransform`.
+def _createPolarSettings(imageShape, center, initialRadius, finalRadius, initialAngle, finalAngle, radiusSize,
+                         angleSize, radialScale='linear', sizing='default', fovealRadius=None):
+    """Create transform metadata for converting a cartesian image to the polar domain
 
-    The returned points are not rounded to the nearest point. User must do that by hand if desired.
+    Any argument that is :obj:`None` is set to its default value, see :func:`convertToPolarImage` for a description of
+    the arguments and how the defaults are calculated.
 
     Parameters
     ----------
-    points : (N, 2) or (2,) :class:`numpy.ndarray`
-        List of polar points to convert to cartesian domain
-
-        First column is r and second column is theta
-    settings : :class:`ImageTransform`
-        Contains metadata for conversion from polar to cartesian domain
-
-        Settings contains many of the arguments in :func:`convertToPolarImage` and :func:`convertToCartesianImage` and
-        provides an easy way of passing these parameters along without having to specify them all again.
+    imageShape : :class:`tuple` of :class:`int`
+        Shape of the cartesian image
 
     Returns
     -------
-    cartesianPoints : (N, 2) or (2,) :class:`numpy.ndarray`
-        Corresponding cartesian points from polar :obj:`points` using :obj:`settings`
-
-    See Also
-    --------
-    :meth:`ImageTransform.getCartesianPointsImage`, :meth:`getCartesianPoints`, :meth:`getCartesianPoints2`
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
     """
-    # Convert points to NumPy array
-    points = np.asanyarray(points)
+    # Number of samples per cartesian pixel at the outermost ring of the image, or None for the default sizing
+    if isinstance(sizing, str):
+        if sizing not in ('default', 'nyquist'):
+            raise ValueError('Invalid sizing %s, must be either \'default\', \'nyquist\' or a number of samples per '
+                             'pixel' % sizing)
+
+        samplesPerPixel = 1.0 if sizing == 'nyquist' else None
+    elif np.ndim(sizing) == 0 and sizing > 0:
+        samplesPerPixel = float(sizing)
+    else:
+        raise ValueError('Sizing must be a positive number of samples per pixel, but got %s' % sizing)
 
-    # If there is only one point specified and number of dimensions is only one, then make the array a 1x2 array so that
-    # points[:, 0/1] will not throw an error
-    if points.ndim == 1 and points.shape[0] == 2:
-        points = np.expand_dims(points, axis=0)
-        needSqueeze = True
+    # If center is not specified, set to the center of the image
+    # Image shape is reversed because center is specified as x,y and shape is r,c.
+    # Otherwise, make sure the center is a Numpy array
+    if center is None:
+        center = (np.array(imageShape[1::-1]) / 2).astype(int)
     else:
-        needSqueeze = False
+        center = np.array(center)
+
+    # Initial radius is zero if none is selected
+    if initialRadius is None:
+        initialRadius = 0
+
+    # Calculate the maximum radius possible
+    # Get four corners (indices) of the cartesian image
+    # Convert the corners to polar and get the largest radius
+    # This will be the maximum radius to represent the entire image in polar
+    corners = np.array([[0, 0], [0, 1], [1, 0], [1, 1]]) * imageShape[0:2]
+    radii, _ = getPolarPoints2(corners[:, 1], corners[:, 0], center)
+    maxRadius = np.ceil(radii.max()).astype(int)
+
+    if finalRadius is None:
+        finalRadius = maxRadius
+
+    # Initial angle of zero if none is selected
+    if initialAngle is None:
+        initialAngle = 0
+
+    # Final radius is the size of the image so that all points from cartesian are on the polar image
+    # Final angle is 2pi to loop throughout entire image
+    if finalAngle is None:
+        finalAngle = 2 * np.pi
+
+    # For the nyquist sizing, the samples are spaced one cartesian pixel apart at the outermost ring of the image, which
+    # is the farthest pixel from the center that is inside the polar image. The angular spacing is largest there, so
+    # every ring closer to the center is sampled at least as finely. Other number of samples per pixel scale the sizes,
+    # the radial spacing of the linear scale is the same everywhere.
+    if samplesPerPixel is not None:
+        pixelCorners = np.array([[0, 0], [0, 1], [1, 0], [1, 1]]) * (np.array(imageShape[0:2]) - 1)
+        pixelRadii, _ = getPolarPoints2(pixelCorners[:, 1], pixelCorners[:, 0], center)
+        outerRadius = min(finalRadius, pixelRadii.max())
 
-    # This is used to scale the result of the radius to get the appropriate Cartesian value
-    scaleRadius = settings.polarImageSize[0] / (settings.finalRadius - settings.initialRadius)
+        if radiusSize is None:
+            radiusSize = max(int(np.ceil(samplesPerPixel * (finalRadius - initialRadius))), 1)
 
-    # This is used to scale the result of the angle to get the appropriate Cartesian value
-    scaleAngle = settings.polarImageSize[1] / (settings.finalAngle - settings.initialAngle)
+            if radialScale == 'log':
+                radiusSize = _getLogRadiusSize(radiusSize, initialRadius, finalRadius, fovealRadius)
 
-    # Create a new copy of the points variable because we are going to change it and don't want the points parameter to
-    # change outside of this function
-    points = points.copy()
+        if angleSize is None:
+            angleSize = max(int(np.ceil(samplesPerPixel * outerRadius * (finalAngle - initialAngle))), 1)
+
+    # If no radius size is given, then the size will be set to make the radius size twice the size of the largest
+    # dimension of the image
+    # There is a surprisingly close relationship between the maximum difference from
+    # width/height of image to center times two.
+    # The radius size is proportional to the final radius and initial radius
+    if radiusSize is None:
+        cross = np.array([[imageShape[1] - 1, center[1]], [0, center[1]], [center[0], imageShape[0] - 1],
+                          [center[0], 0]])
+
+        radiusSize = np.ceil(np.abs(cross - center).max() * 2 * (finalRadius - initialRadius) / maxRadius) \
+            .astype(int)
+
+        if radialScale == 'log':
+            radiusSize = _getLogRadiusSize(radiusSize, initialRadius, finalRadius, fovealRadius)
+
+    # Make the angle size be twice the size of largest dimension for images above 500px, otherwise
+    # use a factor of 4x.
+    # This angle size is proportional to the initial and final angle.
+    # This was experimentally determined to yield the best resolution
+    # The actual answer for the necessary angle size to represent all of the pixels is
+    # (finalAngle - initialAngle) / (min(arctan(y / x) - arctan((y - 1) / x)))
+    # Where the coordinates used in min are the four corners of the cartesian image with the center
+    # subtracted from it. The minimum will be the corner that is the furthest away from the center
+    # The nyquist sizing above calculates the angle size from the outermost ring instead
+    if angleSize is None:
+        maxSize = np.max(imageShape)
+
+        if maxSize > 500:
+            angleSize = int(2 * np.max(imageShape) * (finalAngle - initialAngle) / (2 * np.pi))
+        else:
+            angleSize = int(4 * np.max(imageShape) * (finalAngle - initialAngle) / (2 * np.pi))
 
-    # Scale the radius using scale factor
-    # Scale the angle from radians to pixels using scale factor
-    points = points / [scaleRadius, scaleAngle]
+    # Create the settings
+    return ImageTransform(center, initialRadius, finalRadius, initialAngle, finalAngle, imageShape[0:2],
+                          (radiusSize, angleSize), radialScale)
 
-    # Offset the radius by the initial source radius
-    points[:, 0] = points[:, 0] + settings.initialRadius
 
-    # Offset the theta angle by the initial source angle
-    # The theta values may go past 2pi, so they are looped back around by taking modulo with 2pi.
-    # Note: This assumes initial source angle is positive
-    # theta = np.mod(theta - initialAngle + 2 * np.pi, 2 * np.pi)
-    points[:, 1] = np.mod(points[:, 1] + settings.initialAngle + 2 * np.pi, 2 * np.pi)
+def _createCartesianSettings(imageShape, center, initialRadius, finalRadius, initialAngle, finalAngle, imageSize,
+                             radialScale='linear'):
+    """Create transform metadata for converting a polar image to the cartesian domain
 
-    # Take cartesian grid and convert to polar coordinates
-    cartesianPoints = getCartesianPoints(points, settings.center)
+    Any argument that is :obj:`None` is set to its default value, see :func:`convertToCartesianImage` for a description
+    of the arguments and how the defaults are calculated.
 
-    if needSqueeze:
-        return np.squeeze(cartesianPoints)
-    else:
-        return cartesianPoints
+    Parameters
+    ----------
+    imageShape : :class:`tuple` of :class:`int`
+        Shape of the polar image
+
+    Returns
+    -------
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+    """
+    # Center is set to middle-middle, which means all four quadrants will be shown
+    if center is None:
+        center = 'middle-middle'
+
+    # Initial radius of the source image
+    # In other words, what radius does row 0 correspond to?
+    # If not set, default is 0 to get the entire image
+    if initialRadius is None:
+        initialRadius = 0
+
+    # Final radius of the source image
+    # In other words, what radius does the last row of polar image correspond to?
+    # If not set, default is the largest radius from image
+    if finalRadius is None:
+        finalRadius = imageShape[0]
+
+    # Initial angle of the source image
+    # In other words, what angle does column 0 correspond to?
+    # If not set, default is 0 to get the entire image
+    if initialAngle is None:
+        initialAngle = 0
+
+    # Final angle of the source image
+    # In other words, what angle does the last column of polar image correspond to?
+    # If not set, default is 2pi to get the entire image
+    if finalAngle is None:
+        finalAngle = 2 * np.pi
+
+    if imageSize is None:
+        # Obtain the image size by looping from initial to final source angle (every possible theta in the image
+        # basically)
+        thetas = np.mod(np.linspace(0, (finalAngle - initialAngle), imageShape[1]) + initialAngle,
+                        2 * np.pi)
+        maxRadius = finalRadius * np.ones_like(thetas)
+
+        # Then get the maximum radius of the image and compute the x/y coordinates for each option
+        # If a center is not specified, then use the origin as a default. This will be used to determine
+        # the new center and image size at once
+        if center is not None and not isinstance(center, str):
+            xO, yO = getCartesianPoints2(maxRadius, thetas, center)
+        else:
+            xO, yO = getCartesianPoints2(maxRadius, thetas, np.array([0, 0]))
+
+        # Finally, get the maximum and minimum x/y to obtain the bounds necessary
+        # For the minimum x/y, the largest it can be is 0 because of the origin
+        # For the maximum x/y, the smallest it can be is 0 because of the origin
+        # This happens when the initial and final source angle are in the same quadrant
+        # Because of this, it is guaranteed that the min is <= 0 and max is >= 0
+        xMin, xMax = min(xO.min(), 0), max(xO.max(), 0)
+        yMin, yMax = min(yO.min(), 0), max(yO.max(), 0)
+
+        # Set the image size and center based on the x/y min/max
+        if center == 'bottom-left':
+            imageSize = np.array([yMax, xMax])
+            center = np.array([0, 0])
+        elif center == 'bottom-middle':
+            imageSize = np.array([yMax, xMax - xMin])
+            center = np.array([xMin, 0])
+        elif center == 'bottom-right':
+            imageSize = np.array([yMax, xMin])
+            center = np.array([xMin, 0])
+        elif center == 'middle-left':
+            imageSize = np.array([yMax - yMin, xMax])
+            center = np.array([0, yMin])
+        elif center == 'middle-middle':
+            imageSize = np.array([yMax - yMin, xMax - xMin])
+            center = np.array([xMin, yMin])
+        elif center == 'middle-right':
+            imageSize = np.array([yMax - yMin, xMin])
+            center = np.array([xMin, yMin])
+        elif center == 'top-left':
+            imageSize = np.array([yMin, xMax])
+            center = np.array([0, yMin])
+        elif center == 'top-middle':
+            imageSize = np.array([yMin, xMax - xMin])
+            center = np.array([xMin, yMin])
+        elif center == 'top-right':
+            imageSize = np.array([yMin, xMin])
+            center = np.array([xMin, yMin])
+
+        # When the image size or center are set to x or y min, then that is a negative value
+        # Instead of typing abs for each one, an absolute value of the image size and center is done at the end to
+        # make it easier.
+        imageSize = np.ceil(np.abs(imageSize)).astype(int)
+        center = np.ceil(np.abs(center)).astype(int)
+    elif isinstance(center, str):
+        # Set the center based on the image size given
+        if center == 'bottom-left':
+            center = imageSize[1::-1] * np.array([0, 0])
+        elif center == 'bottom-middle':
+            center = imageSize[1::-1] * np.array([1 / 2, 0])
+        elif center == 'bottom-right':
+            center = imageSize[1::-1] * np.array([1, 0])
+        elif center == 'middle-left':
+            center = imageSize[1::-1] * np.array([0, 1 / 2])
+        elif center == 'middle-middle':
+            center = imageSize[1::-1] * np.array([1 / 2, 1 / 2])
+        elif center == 'middle-right':
+            center = imageSize[1::-1] * np.array([1, 1 / 2])
+        elif center == 'top-left':
+            center = imageSize[1::-1] * np.array([0, 1])
+        elif center == 'top-middle':
+            center = imageSize[1::-1] * np.array([1 / 2, 1])
+        elif center == 'top-right':
+            center = imageSize[1::-1] * np.array([1, 1])
+
+    # Convert image size to tuple to standardize the variable type
+    # Some people may use list but we want to convert this
+    imageSize = tuple(imageSize)
+
+    return ImageTransform(center, initialRadius, finalRadius, initialAngle, finalAngle, imageSize, imageShape[0:2],
+                          radialScale)
 
 
 def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None, initialAngle=None, finalAngle=None,
                         radiusSize=None, angleSize=None, order=3, border='constant', borderVal=0.0,
-                        settings=None):
+                        settings=None, workers=None, maxMemory=None, precision='float64', out=None,
+                        backend=None, radialScale='linear', sizing='default', fovealRadius=None):
     """Convert cartesian image to polar image.
 
     Using a cartesian image, this function creates a polar domain image where the first dimension is radius and
@@ -570,12 +4099,16 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
 
     Parameters
     ----------
-    image : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+    image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
         Cartesian image to convert to polar domain
 
+        The image may also be given as spline coefficients from :func:`prefilterImage` to skip the prefiltering
+        step when converting the same image multiple times.
+
         .. note::
-            If an alpha band (4th channel of image is present, then it will be ignored during polar conversion. The
-            resulting polar image will contain four channels but the alpha channel will be all fully on.
+            Each channel of a multichannel image is converted. If an alpha band (4th channel of image is present, then
+            it will be ignored during polar conversion. The resulting polar image will contain four channels but the
+            alpha channel will be all fully on.
     center : (2,) :class:`list`, :class:`tuple` or :class:`numpy.ndarray` of :class:`int`, optional
         Specifies the center in the cartesian image to use as the origin in polar domain. The center in the
         cartesian domain will be (0, 0) in the polar domain.
@@ -583,6 +4116,11 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
         The center is structured as (x, y) where the first item is the x-coordinate and second item is the y-coordinate.
 
         If center is not set, then it will default to ``round(image.shape[::-1] / 2)``.
+
+        .. note::
+            Conversions with a new center but otherwise the same arguments can reuse the grid of polar offsets of a
+            previous conversion. This is opt-in: the grids are only cached while the plan cache is enabled with
+            :func:`setCacheSize`.
     initialRadius : :class:`int`, optional
         Starting radius in pixels from the center of the cartesian image that will appear in the polar image
 
@@ -650,7 +4188,7 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
         the :obj:`center` times two.
 
         The radiusSize is calculated based on this relationship and is proportional to the :obj:`initialRadius` and
-        :obj:`finalRadius` given.
+        :obj:`finalRadius` given. See :obj:`sizing` for calculating the minimal size instead.
     angleSize : :class:`int`, optional
         Size of polar image for angular (2nd) dimension
 
@@ -671,8 +4209,8 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
         largest dimension proportional to :obj:`initialAngle` and :obj:`finalAngle`.
 
         .. note::
-            The above logic **estimates** the necessary angleSize to reduce image information loss. No algorithm
-            currently exists for determining the required angleSize.
+            The above logic **estimates** the necessary angleSize to reduce image information loss. See
+            :obj:`sizing` for calculating the size from the outermost ring of the image instead.
     order : :class:`int` (0-5), optional
         The order of the spline interpolation, default is 3. The order has to be in the range 0-5.
 
@@ -719,10 +4257,99 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
 
         If settings is not specified, then the other arguments are used in this function and the defaults will be
         calculated if necessary. If settings is given, then the values from settings will be used.
+    workers : :class:`int`, optional
+        Number of threads used for the conversion, see :func:`setNumWorkers`. The result is the same for any number of
+        workers.
+
+        If not specified, the module default is used.
+    maxMemory : :class:`int`, optional
+        Maximum number of bytes of temporary memory used for the conversion. If specified, the polar image is converted
+        in tiles and each tile reads only the part of the cartesian image it needs, which bounds the peak memory for
+        very large images. The size of the tiles is derived from this budget. The memory of the cartesian and polar
+        image are not included in the budget.
+
+        The result matches converting the entire image at once. For an order greater than 1, the spline coefficients
+        of each tile are computed from a margin around it, so floating point images may differ by rounding error.
+
+        If not specified, the entire image is converted at once.
+    precision : {'float64', 'float32'}, optional
+        Floating point precision of the coordinate map and spline coefficients used for the interpolation. Using
+        'float32' halves the memory used for them, which speeds up the memory bound parts of the conversion.
+
+        In float32, the coordinates have a relative error of at most about :math:`2 \\times 10^{-7}`, which is less
+        than 0.004 pixels for images up to 16384 pixels. The interpolated values differ from float64 by at most the
+        image gradient times this error, plus the rounding of the spline coefficients to float32. For integer images,
+        this may change the rounding of a value by one and for nearest neighbor interpolation, points within this error
+        of halfway between two pixels may select the other pixel.
+
+        Default is 'float64'
+    out : (N, M) or (N, M, C) :class:`numpy.ndarray`, optional
+        Array to store the polar image in, such as a :class:`numpy.memmap` to write the result directly to a file on
+        disk. Must have the shape of the polar image and the same number of channels as :obj:`image`.
+
+        If not specified, a new array is allocated.
+    backend : :class:`str`, optional
+        Interpolation backend used for the conversion. The built-in backends are:
+
+            * 'scipy' - interpolates the coordinate map with :func:`scipy.ndimage.map_coordinates`, supports every
+              order and border
+            * 'numpy' - gathers the neighboring pixels of each point with NumPy, for an order of 0 or 1 with the
+              'constant' or 'nearest' border
+            * 'gather' - same as 'numpy', except bilinear interpolation of uint8 and uint16 images is done in fixed
+              point integer arithmetic
+            * 'matrix' - sparse matrix product with the matrix from :meth:`TransformPlan.getMatrix`, for an order of 0
+              or 1 with the 'constant' or 'nearest' border
+            * 'numba' - compiled kernel that calculates the coordinates of each pixel as it is interpolated, so the
+              coordinate map is never stored, and splits the rows between :obj:`workers` threads. Requires Numba to be
+              installed and supports an order of 0, 1 or 3 with the 'constant' or 'nearest' border.
+
+        Backends added with :func:`registerBackend` can be selected by name as well. If 'auto', the supported backends
+        are benchmarked the first time an image of a given size, datatype, order and border is converted and the
+        fastest one is used from then on. The selection is stored in a cache file so that other processes do not need
+        to benchmark again, see :func:`setBackendCacheFile`.
+
+        If not specified, the 'gather' or 'numpy' backend is used where supported and 'scipy' otherwise. Conversions
+        that are not supported by the selected backend use this default instead, and :obj:`maxMemory` always uses
+        'scipy'. The backends may round the coordinates and interpolated values differently, so floating point results
+        agree to within 1e-9 times the range of the image and integer results may differ by one where a value is within
+        that of halfway between two integers.
+
+        Default is :obj:`None`
+    radialScale : {'linear', 'log'}, optional
+        Spacing of the radii of the rows of the polar image. If 'linear', the radii are evenly spaced from
+        :obj:`initialRadius` to :obj:`finalRadius`. If 'log', :math:`\\log(1 + r)` is evenly spaced instead, which is
+        log-polar sampling. The rows are then densest near the center and the spacing grows in proportion to
+        :math:`1 + r`.
+
+        If :obj:`radiusSize` is not set for the log scale, it is chosen so that the rows are at least as dense as the
+        rows of the linear scale up to :obj:`fovealRadius`, which needs far fewer rows. The log scale never uses more
+        rows than the linear scale.
+
+        Default is 'linear'
+    sizing : {'default', 'nyquist'} or :class:`float`, optional
+        Determines :obj:`radiusSize` and :obj:`angleSize` when they are not set. If 'default', the sizes described for
+        those arguments are used.
+
+        If 'nyquist', the sizes are the minimal number of samples that represent the outermost ring of the image,
+        which is the pixel farthest from the :obj:`center` up to :obj:`finalRadius`. The samples are spaced one
+        cartesian pixel apart along that ring, so the angleSize is the length of the arc and the radiusSize is the
+        number of pixels between :obj:`initialRadius` and :obj:`finalRadius`. For the log scale, the radiusSize is
+        chosen so that the radial spacing is at most one pixel up to :obj:`fovealRadius`.
+
+        A number sets the target resolution in samples per cartesian pixel at the outermost ring instead, so 'nyquist'
+        is the same as 1. Smaller values give smaller polar images that no longer represent every pixel.
+
+        Default is 'default'
+    fovealRadius : :class:`float`, optional
+        Radius in pixels from the center up to which the rows of the log scale are at least as dense as the rows of the
+        linear scale, used to determine :obj:`radiusSize` if it is not set. Beyond this radius, the spacing between the
+        rows grows in proportion to :math:`1 + r`. Not used for the linear scale.
+
+        If not specified, it is one tenth of the way from :obj:`initialRadius` to :obj:`finalRadius`.
 
     Returns
     -------
-    polarImage : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+    polarImage : (N, M) or (N, M, C) :class:`numpy.ndarray`
         Polar image where first dimension is radii and second dimension is angle
     settings : :class:`ImageTransform`
         Contains metadata for conversion between polar and cartesian image.
@@ -731,123 +4358,37 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
         provides an easy way of passing these parameters along without having to specify them all again.
     """
 
-    # Determines whether there are multiple bands or channels in image by checking for 3rd dimension
-    isMultiChannel = image.ndim == 3
+    _checkBackend(backend)
+
+    # Retrieve the plan from the cache if it is enabled
+    # Tiled conversions calculate the coordinates as they go rather than using a plan
+    plan, cacheKey = None, None
+    if maxMemory is None:
+        plan, settings, cacheKey = _lookupPlan('polar', image.shape, order, border, borderVal, precision, backend,
+                                               settings, (center, initialRadius, finalRadius, initialAngle, finalAngle,
+                                                          radiusSize, angleSize, radialScale, sizing, fovealRadius))
 
     # Create settings if none are given
     if settings is None:
-        # If center is not specified, set to the center of the image
-        # Image shape is reversed because center is specified as x,y and shape is r,c.
-        # Otherwise, make sure the center is a Numpy array
-        if center is None:
-            center = (np.array(image.shape[1::-1]) / 2).astype(int)
-        else:
-            center = np.array(center)
-
-        # Initial radius is zero if none is selected
-        if initialRadius is None:
-            initialRadius = 0
-
-        # Calculate the maximum radius possible
-        # Get four corners (indices) of the cartesian image
-        # Convert the corners to polar and get the largest radius
-        # This will be the maximum radius to represent the entire image in polar
-        corners = np.array([[0, 0], [0, 1], [1, 0], [1, 1]]) * image.shape[0:2]
-        radii, _ = getPolarPoints2(corners[:, 1], corners[:, 0], center)
-        maxRadius = np.ceil(radii.max()).astype(int)
-
-        if finalRadius is None:
-            finalRadius = maxRadius
-
-        # Initial angle of zero if none is selected
-        if initialAngle is None:
-            initialAngle = 0
-
-        # Final radius is the size of the image so that all points from cartesian are on the polar image
-        # Final angle is 2pi to loop throughout entire image
-        if finalAngle is None:
-            finalAngle = 2 * np.pi
-
-        # If no radius size is given, then the size will be set to make the radius size twice the size of the largest
-        # dimension of the image
-        # There is a surprisingly close relationship between the maximum difference from
-        # width/height of image to center times two.
-        # The radius size is proportional to the final radius and initial radius
-        if radiusSize is None:
-            cross = np.array([[image.shape[1] - 1, center[1]], [0, center[1]], [center[0], image.shape[0] - 1],
-                              [center[0], 0]])
-
-            radiusSize = np.ceil(np.abs(cross - center).max() * 2 * (finalRadius - initialRadius) / maxRadius) \
-                .astype(int)
-
-        # Make the angle size be twice the size of largest dimension for images above 500px, otherwise
-        # use a factor of 4x.
-        # This angle size is proportional to the initial and final angle.
-        # This was experimentally determined to yield the best resolution
-        # The actual answer for the necessary angle size to represent all of the pixels is
-        # (finalAngle - initialAngle) / (min(arctan(y / x) - arctan((y - 1) / x)))
-        # Where the coordinates used in min are the four corners of the cartesian image with the center
-        # subtracted from it. The minimum will be the corner that is the furthest away from the center
-        # TODO Find a better solution to determining default angle size (optimum?)
-        if angleSize is None:
-            maxSize = np.max(image.shape)
-
-            if maxSize > 500:
-                angleSize = int(2 * np.max(image.shape) * (finalAngle - initialAngle) / (2 * np.pi))
-            else:
-                angleSize = int(4 * np.max(image.shape) * (finalAngle - initialAngle) / (2 * np.pi))
-
-        # Create the settings
-        settings = ImageTransform(center, initialRadius, finalRadius, initialAngle, finalAngle, image.shape[0:2],
-                                  (radiusSize, angleSize))
-
-    # Create radii from start to finish with radiusSize, do same for theta
-    # Then create a 2D grid of radius and theta using meshgrid
-    # Set endpoint to False to NOT include the final sample specified. Think of it like this, if you ask to count from
-    # 0 to 30, that is 31 numbers not 30. Thus, we count 0...29 to get 30 numbers.
-    radii = np.linspace(settings.initialRadius, settings.finalRadius, settings.polarImageSize[0], endpoint=False)
-    theta = np.linspace(settings.initialAngle, settings.finalAngle, settings.polarImageSize[1], endpoint=False)
-    r, theta = np.meshgrid(radii, theta)
+        settings = _createPolarSettings(image.shape, center, initialRadius, finalRadius, initialAngle, finalAngle,
+                                        radiusSize, angleSize, radialScale, sizing, fovealRadius)
 
-    # Take polar  grid and convert to cartesian coordinates
-    xCartesian, yCartesian = getCartesianPoints2(r, theta, settings.center)
+    if maxMemory is not None:
+        return _convertTiled(image, settings, 'polar', order, border, borderVal, maxMemory,
+                             _resolveWorkers(workers), precision, out), settings
 
-    # Flatten the desired x/y cartesian points into one 2xN array
-    desiredCoords = np.vstack((yCartesian.flatten(), xCartesian.flatten()))
+    # Create a plan for the settings and use it to convert the image
+    # The plan is added to the cache after executing it so that any tables computed on first use are included in its
+    # size
+    if plan is None:
+        plan = TransformPlan(settings, 'polar', order=order, border=border, borderVal=borderVal,
+                             precision=precision, backend=backend)
 
-    # If border is set to constant, then pad the image by the edges by 3 pixels.
-    # If one tries to convert back to cartesian without the borders padded then the border of the cartesian image will
-    # be corrupted because it will average the pixels with the border value
-    if border == 'constant':
-        # Pad image by 3 pixels and then offset all of the desired coordinates by 3
-        image = np.pad(image, ((3, 3), (3, 3), (0, 0)) if isMultiChannel else 3, 'edge')
-        desiredCoords += 3
-
-    # Retrieve polar image using map_coordinates. Returns a linear array of the values that
-    # must be reshaped into the desired size
-    # For multiple channels, repeat this process for each band and concatenate them at end
-    # Take the transpose of the polar image such that first dimension is radius and second
-    # dimension is theta.
-    if isMultiChannel:
-        polarImages = []
-
-        # Assume that there are at least 3 bands in 3D matrix
-        for k in range(3):
-            polarImage = scipy.ndimage.map_coordinates(image[:, :, k], desiredCoords, mode=border, cval=borderVal,
-                                                       order=order).reshape(r.shape).T
-            polarImages.append(polarImage)
+    if out is None:
+        out = _allocateOutput(plan, image)
 
-        # If there are 4 bands, then assume the 4th band is alpha
-        # We do not want to interpolate the transparency so we just make it all fully opaque
-        if image.shape[2] == 4:
-            imin, imax = skimage.util.dtype_limits(polarImages[0], False)
-            polarImage = np.full_like(polarImages[0], imax)
-            polarImages.append(polarImage)
-
-        polarImage = np.dstack(polarImages)
-    else:
-        polarImage = scipy.ndimage.map_coordinates(image, desiredCoords, mode=border, cval=borderVal,
-                                                   order=order).reshape(r.shape).T
+    polarImage = plan.execute(image, out=out, workers=workers)
+    _storePlan(cacheKey, plan)
 
     return polarImage, settings
 
@@ -855,7 +4396,8 @@ def convertToPolarImage(image, center=None, initialRadius=None, finalRadius=None
 def convertToCartesianImage(image, center=None, initialRadius=None,
                             finalRadius=None, initialAngle=None,
                             finalAngle=None, imageSize=None, order=3, border='constant',
-                            borderVal=0.0, settings=None):
+                            borderVal=0.0, settings=None, workers=None, maxMemory=None, precision='float64',
+                            out=None, backend=None, radialScale='linear', masked=False):
     """Convert polar image to cartesian image.
 
     Using a polar image, this function creates a cartesian image. This function is versatile because it can
@@ -864,12 +4406,16 @@ def convertToCartesianImage(image, center=None, initialRadius=None,
 
     Parameters
     ----------
-    image : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+    image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
         Polar image to convert to cartesian domain
 
+        The image may also be given as spline coefficients from :func:`prefilterImage` to skip the prefiltering
+        step when converting the same image multiple times.
+
         .. note::
-            If an alpha band (4th channel of image is present, then it will be ignored during cartesian conversion. The
-            resulting polar image will contain four channels but the alpha channel will be all fully on.
+            Each channel of a multichannel image is converted. If an alpha band (4th channel of image is present, then
+            it will be ignored during cartesian conversion. The resulting polar image will contain four channels but the
+            alpha channel will be all fully on.
     center : :class:`str` or (2,) :class:`list`, :class:`tuple` or :class:`numpy.ndarray` of :class:`int`, optional
         Specifies the center in the cartesian image to use as the origin in polar domain. The center in the
         cartesian domain will be (0, 0) in the polar domain.
@@ -999,10 +4545,85 @@ def convertToCartesianImage(image, center=None, initialRadius=None,
 
         If settings is not specified, then the other arguments are used in this function and the defaults will be
         calculated if necessary. If settings is given, then the values from settings will be used.
+    workers : :class:`int`, optional
+        Number of threads used for the conversion, see :func:`setNumWorkers`. The result is the same for any number of
+        workers.
+
+        If not specified, the module default is used.
+    maxMemory : :class:`int`, optional
+        Maximum number of bytes of temporary memory used for the conversion. If specified, the cartesian image is
+        converted in tiles and each tile reads only the part of the polar image it needs, which bounds the peak memory
+        for very large images. The size of the tiles is derived from this budget. The memory of the polar and cartesian
+        image are not included in the budget.
+
+        The result matches converting the entire image at once. For an order greater than 1, the spline coefficients
+        of each tile are computed from a margin around it, so floating point images may differ by rounding error.
+
+        If not specified, the entire image is converted at once.
+    precision : {'float64', 'float32'}, optional
+        Floating point precision of the coordinate map and spline coefficients used for the interpolation. Using
+        'float32' halves the memory used for them, which speeds up the memory bound parts of the conversion.
+
+        In float32, the coordinates have a relative error of at most about :math:`2 \\times 10^{-7}`, which is less
+        than 0.004 pixels for images up to 16384 pixels. The interpolated values differ from float64 by at most the
+        image gradient times this error, plus the rounding of the spline coefficients to float32. For integer images,
+        this may change the rounding of a value by one and for nearest neighbor interpolation, points within this error
+        of halfway between two pixels may select the other pixel.
+
+        Default is 'float64'
+    out : (N, M) or (N, M, C) :class:`numpy.ndarray`, optional
+        Array to store the cartesian image in, such as a :class:`numpy.memmap` to write the result directly to a file on
+        disk. Must have the shape of the cartesian image and the same number of channels as :obj:`image`.
+
+        If not specified, a new array is allocated.
+    backend : :class:`str`, optional
+        Interpolation backend used for the conversion. The built-in backends are:
+
+            * 'scipy' - interpolates the coordinate map with :func:`scipy.ndimage.map_coordinates`, supports every
+              order and border
+            * 'numpy' - gathers the neighboring pixels of each point with NumPy, for an order of 0 or 1 with the
+              'constant' or 'nearest' border
+            * 'gather' - same as 'numpy', except bilinear interpolation of uint8 and uint16 images is done in fixed
+              point integer arithmetic
+            * 'matrix' - sparse matrix product with the matrix from :meth:`TransformPlan.getMatrix`, for an order of 0
+              or 1 with the 'constant' or 'nearest' border
+            * 'numba' - compiled kernel that calculates the coordinates of each pixel as it is interpolated, so the
+              coordinate map is never stored, and splits the rows between :obj:`workers` threads. Requires Numba to be
+              installed and supports an order of 0, 1 or 3 with the 'constant' or 'nearest' border.
+
+        Backends added with :func:`registerBackend` can be selected by name as well. If 'auto', the supported backends
+        are benchmarked the first time an image of a given size, datatype, order and border is converted and the
+        fastest one is used from then on. The selection is stored in a cache file so that other processes do not need
+        to benchmark again, see :func:`setBackendCacheFile`.
+
+        If not specified, the 'gather' or 'numpy' backend is used where supported and 'scipy' otherwise. Conversions
+        that are not supported by the selected backend use this default instead, and :obj:`maxMemory` always uses
+        'scipy'. The backends may round the coordinates and interpolated values differently, so floating point results
+        agree to within 1e-9 times the range of the image and integer results may differ by one where a value is within
+        that of halfway between two integers.
+
+        Default is :obj:`None`
+    radialScale : {'linear', 'log'}, optional
+        Spacing of the radii of the rows of the polar image, see :func:`convertToPolarImage`. Must match the scale the
+        polar image was created with.
+
+        Default is 'linear'
+    masked : :class:`bool`, optional
+        If :obj:`True`, only the cartesian pixels inside the polar image are interpolated and the remaining pixels,
+        such as the corners outside :obj:`finalRadius`, the hole inside :obj:`initialRadius` and the pixels outside the
+        range of angles, are filled with :obj:`borderVal` directly. The mask of the pixels is computed once for each
+        :class:`ImageTransform` and cached, see :meth:`ImageTransform.getCartesianMask`. For a partial sector, most
+        of the interpolation is skipped.
+
+        For the 'constant' border, the result is the same as without the mask. For the other borders, the pixels
+        outside the mask are filled with :obj:`borderVal` instead of being extended from the polar image. The 'numba'
+        backend does not support masked conversions.
+
+        Default is :obj:`False`
 
     Returns
     -------
-    cartesianImage : (N, M, 3) or (N, M, 4) :class:`numpy.ndarray`
+    cartesianImage : (N, M) or (N, M, C) :class:`numpy.ndarray`
         Cartesian image
     settings : :class:`ImageTransform`
         Contains metadata for conversion between polar and cartesian image.
@@ -1010,190 +4631,773 @@ def convertToCartesianImage(image, center=None, initialRadius=None,
         Settings contains many of the arguments in :func:`convertToPolarImage` and :func:`convertToCartesianImage` and
         provides an easy way of passing these parameters along without having to specify them all again.
     """
-    # Determines whether there are multiple bands or channels in image by checking for 3rd dimension
-    isMultiChannel = image.ndim == 3
+    _checkBackend(backend)
+
+    # Retrieve the plan from the cache if it is enabled
+    # Tiled conversions calculate the coordinates as they go rather than using a plan
+    plan, cacheKey = None, None
+    if maxMemory is None:
+        plan, settings, cacheKey = _lookupPlan('cartesian', image.shape, order, border, borderVal, precision, backend,
+                                               settings, (center, initialRadius, finalRadius, initialAngle, finalAngle,
+                                                          imageSize, radialScale), masked)
 
+    # Create settings if none are given
     if settings is None:
-        # Center is set to middle-middle, which means all four quadrants will be shown
-        if center is None:
-            center = 'middle-middle'
-
-        # Initial radius of the source image
-        # In other words, what radius does row 0 correspond to?
-        # If not set, default is 0 to get the entire image
-        if initialRadius is None:
-            initialRadius = 0
-
-        # Final radius of the source image
-        # In other words, what radius does the last row of polar image correspond to?
-        # If not set, default is the largest radius from image
-        if finalRadius is None:
-            finalRadius = image.shape[0]
-
-        # Initial angle of the source image
-        # In other words, what angle does column 0 correspond to?
-        # If not set, default is 0 to get the entire image
-        if initialAngle is None:
-            initialAngle = 0
-
-        # Final angle of the source image
-        # In other words, what angle does the last column of polar image correspond to?
-        # If not set, default is 2pi to get the entire image
-        if finalAngle is None:
-            finalAngle = 2 * np.pi
-
-        # This is used to scale the result of the radius to get the appropriate Cartesian value
-        scaleRadius = image.shape[0] / (finalRadius - initialRadius)
-
-        # This is used to scale the result of the angle to get the appropriate Cartesian value
-        scaleAngle = image.shape[1] / (finalAngle - initialAngle)
-
-        if imageSize is None:
-            # Obtain the image size by looping from initial to final source angle (every possible theta in the image
-            # basically)
-            thetas = np.mod(np.linspace(0, (finalAngle - initialAngle), image.shape[1]) + initialAngle,
-                            2 * np.pi)
-            maxRadius = finalRadius * np.ones_like(thetas)
-
-            # Then get the maximum radius of the image and compute the x/y coordinates for each option
-            # If a center is not specified, then use the origin as a default. This will be used to determine
-            # the new center and image size at once
-            if center is not None and not isinstance(center, str):
-                xO, yO = getCartesianPoints2(maxRadius, thetas, center)
-            else:
-                xO, yO = getCartesianPoints2(maxRadius, thetas, np.array([0, 0]))
-
-            # Finally, get the maximum and minimum x/y to obtain the bounds necessary
-            # For the minimum x/y, the largest it can be is 0 because of the origin
-            # For the maximum x/y, the smallest it can be is 0 because of the origin
-            # This happens when the initial and final source angle are in the same quadrant
-            # Because of this, it is guaranteed that the min is <= 0 and max is >= 0
-            xMin, xMax = min(xO.min(), 0), max(xO.max(), 0)
-            yMin, yMax = min(yO.min(), 0), max(yO.max(), 0)
-
-            # Set the image size and center based on the x/y min/max
-            if center == 'bottom-left':
-                imageSize = np.array([yMax, xMax])
-                center = np.array([0, 0])
-            elif center == 'bottom-middle':
-                imageSize = np.array([yMax, xMax - xMin])
-                center = np.array([xMin, 0])
-            elif center == 'bottom-right':
-                imageSize = np.array([yMax, xMin])
-                center = np.array([xMin, 0])
-            elif center == 'middle-left':
-                imageSize = np.array([yMax - yMin, xMax])
-                center = np.array([0, yMin])
-            elif center == 'middle-middle':
-                imageSize = np.array([yMax - yMin, xMax - xMin])
-                center = np.array([xMin, yMin])
-            elif center == 'middle-right':
-                imageSize = np.array([yMax - yMin, xMin])
-                center = np.array([xMin, yMin])
-            elif center == 'top-left':
-                imageSize = np.array([yMin, xMax])
-                center = np.array([0, yMin])
-            elif center == 'top-middle':
-                imageSize = np.array([yMin, xMax - xMin])
-                center = np.array([xMin, yMin])
-            elif center == 'top-right':
-                imageSize = np.array([yMin, xMin])
-                center = np.array([xMin, yMin])
-
-            # When the image size or center are set to x or y min, then that is a negative value
-            # Instead of typing abs for each one, an absolute value of the image size and center is done at the end to
-            # make it easier.
-            imageSize = np.ceil(np.abs(imageSize)).astype(int)
-            center = np.ceil(np.abs(center)).astype(int)
-        elif isinstance(center, str):
-            # Set the center based on the image size given
-            if center == 'bottom-left':
-                center = imageSize[1::-1] * np.array([0, 0])
-            elif center == 'bottom-middle':
-                center = imageSize[1::-1] * np.array([1 / 2, 0])
-            elif center == 'bottom-right':
-                center = imageSize[1::-1] * np.array([1, 0])
-            elif center == 'middle-left':
-                center = imageSize[1::-1] * np.array([0, 1 / 2])
-            elif center == 'middle-middle':
-                center = imageSize[1::-1] * np.array([1 / 2, 1 / 2])
-            elif center == 'middle-right':
-                center = imageSize[1::-1] * np.array([1, 1 / 2])
-            elif center == 'top-left':
-                center = imageSize[1::-1] * np.array([0, 1])
-            elif center == 'top-middle':
-                center = imageSize[1::-1] * np.array([1 / 2, 1])
-            elif center == 'top-right':
-                center = imageSize[1::-1] * np.array([1, 1])
-
-        # Convert image size to tuple to standardize the variable type
-        # Some people may use list but we want to convert this
-        imageSize = tuple(imageSize)
-
-        settings = ImageTransform(center, initialRadius, finalRadius, initialAngle, finalAngle, imageSize,
-                                  image.shape[0:2])
+        settings = _createCartesianSettings(image.shape, center, initialRadius, finalRadius, initialAngle, finalAngle,
+                                            imageSize, radialScale)
+
+    if maxMemory is not None:
+        cartesianImage = _convertTiled(image, settings, 'cartesian', order, border, borderVal, maxMemory,
+                                       _resolveWorkers(workers), precision, out)
+
+        # Tiles interpolate every pixel, so the pixels outside the mask are filled afterwards
+        if masked:
+            cartesianImage[~_getSettingsMask(settings, precision)] = _castInterpolated(
+                np.full(1, borderVal, dtype=np.float64), np.empty(1, dtype=cartesianImage.dtype))[0]
+
+        return cartesianImage, settings
+
+    # Create a plan for the settings and use it to convert the image
+    # The plan is added to the cache after executing it so that any tables computed on first use are included in its
+    # size
+    if plan is None:
+        plan = TransformPlan(settings, 'cartesian', order=order, border=border, borderVal=borderVal,
+                             precision=precision, backend=backend, masked=masked)
+
+    if out is None:
+        out = _allocateOutput(plan, image)
+
+    cartesianImage = plan.execute(image, out=out, workers=workers)
+    _storePlan(cacheKey, plan)
+
+    return cartesianImage, settings
+
+
+def convertToPolarStack(images, center=None, initialRadius=None, finalRadius=None, initialAngle=None, finalAngle=None,
+                        radiusSize=None, angleSize=None, order=3, border='constant', borderVal=0.0, settings=None,
+                        batchSize=None, workers=None, precision='float64', out=None, backend=None,
+                        radialScale='linear', sizing='default', fovealRadius=None):
+    """Convert stack of cartesian images to polar images.
+
+    This is the same as calling :func:`convertToPolarImage` on each image in the stack, such as the frames of a video,
+    except the settings and coordinate map are computed once and the results are stored in one array. The settings are
+    determined from the size of one image in the stack.
+
+    See :func:`convertToPolarImage` for a description of the arguments.
+
+    Parameters
+    ----------
+    images : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+        Stack of cartesian images to convert to polar domain, where the first dimension is the frame
+    batchSize : :class:`int`, optional
+        Number of frames converted at once, see :meth:`TransformPlan.executeStack`.
+
+        If not specified, all frames are converted at once, or one at a time for a :class:`numpy.memmap` stack.
+    workers : :class:`int`, optional
+        Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+        If not specified, the module default is used.
+    precision : {'float64', 'float32'}, optional
+        Floating point precision of the coordinate map and spline coefficients, see :func:`convertToPolarImage`.
+
+        Default is 'float64'
+    out : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`, optional
+        Array to store the polar images in, such as a :class:`numpy.memmap` to write the results directly to a
+        file on disk, see :meth:`TransformPlan.executeStack`.
+
+        If not specified, a new array is allocated.
+    backend : :class:`str`, optional
+        Interpolation backend used for the conversion, see :func:`convertToPolarImage`.
+
+        Default is :obj:`None`
+    radialScale : {'linear', 'log'}, optional
+        Spacing of the radii of the rows of the polar image, see :func:`convertToPolarImage`.
+
+        Default is 'linear'
+    sizing : {'default', 'nyquist'} or :class:`float`, optional
+        Determines the size of the polar images when it is not set, see :func:`convertToPolarImage`.
+
+        Default is 'default'
+    fovealRadius : :class:`float`, optional
+        Radius up to which the rows of the log scale are at least as dense as the linear scale, see
+        :func:`convertToPolarImage`.
+
+    Returns
+    -------
+    polarImages : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+        Stack of polar images where second dimension is radii and third dimension is angle
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+    """
+    images = np.asanyarray(images)
+    _checkBackend(backend)
+
+    # Retrieve the plan from the cache if it is enabled
+    plan, settings, cacheKey = _lookupPlan('polar', images.shape[1:], order, border, borderVal, precision, backend,
+                                           settings, (center, initialRadius, finalRadius, initialAngle, finalAngle,
+                                                      radiusSize, angleSize, radialScale, sizing, fovealRadius))
+
+    # Create settings if none are given
+    if settings is None:
+        settings = _createPolarSettings(images.shape[1:], center, initialRadius, finalRadius, initialAngle,
+                                        finalAngle, radiusSize, angleSize, radialScale, sizing, fovealRadius)
+
+    if plan is None:
+        plan = TransformPlan(settings, 'polar', order=order, border=border, borderVal=borderVal,
+                             precision=precision, backend=backend)
+
+    polarImages = plan.executeStack(images, out=out, batchSize=batchSize, workers=workers)
+    _storePlan(cacheKey, plan)
+
+    return polarImages, settings
+
+
+def convertToCartesianStack(images, center=None, initialRadius=None, finalRadius=None, initialAngle=None,
+                            finalAngle=None, imageSize=None, order=3, border='constant', borderVal=0.0, settings=None,
+                            batchSize=None, workers=None, precision='float64', out=None, backend=None,
+                            radialScale='linear', masked=False):
+    """Convert stack of polar images to cartesian images.
+
+    This is the same as calling :func:`convertToCartesianImage` on each image in the stack, such as the frames of a
+    video, except the settings and coordinate map are computed once and the results are stored in one array. The
+    settings are determined from the size of one image in the stack.
+
+    See :func:`convertToCartesianImage` for a description of the arguments.
+
+    Parameters
+    ----------
+    images : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+        Stack of polar images to convert to cartesian domain, where the first dimension is the frame
+    batchSize : :class:`int`, optional
+        Number of frames converted at once, see :meth:`TransformPlan.executeStack`.
+
+        If not specified, all frames are converted at once, or one at a time for a :class:`numpy.memmap` stack.
+    workers : :class:`int`, optional
+        Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+        If not specified, the module default is used.
+    precision : {'float64', 'float32'}, optional
+        Floating point precision of the coordinate map and spline coefficients, see :func:`convertToPolarImage`.
+
+        Default is 'float64'
+    out : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`, optional
+        Array to store the cartesian images in, such as a :class:`numpy.memmap` to write the results directly to a
+        file on disk, see :meth:`TransformPlan.executeStack`.
+
+        If not specified, a new array is allocated.
+    backend : :class:`str`, optional
+        Interpolation backend used for the conversion, see :func:`convertToCartesianImage`.
+
+        Default is :obj:`None`
+    radialScale : {'linear', 'log'}, optional
+        Spacing of the radii of the rows of the polar image, see :func:`convertToCartesianImage`.
+
+        Default is 'linear'
+    masked : :class:`bool`, optional
+        If :obj:`True`, only the cartesian pixels inside the polar image are interpolated, see
+        :func:`convertToCartesianImage`.
+
+        Default is :obj:`False`
+
+    Returns
+    -------
+    cartesianImages : (T, N, M) or (T, N, M, C) :class:`numpy.ndarray`
+        Stack of cartesian images
+    settings : :class:`ImageTransform`
+        Contains metadata for conversion between polar and cartesian image.
+    """
+    images = np.asanyarray(images)
+    _checkBackend(backend)
+
+    # Retrieve the plan from the cache if it is enabled
+    plan, settings, cacheKey = _lookupPlan('cartesian', images.shape[1:], order, border, borderVal, precision, backend,
+                                           settings, (center, initialRadius, finalRadius, initialAngle, finalAngle,
+                                                      imageSize, radialScale), masked)
+
+    # Create settings if none are given
+    if settings is None:
+        settings = _createCartesianSettings(images.shape[1:], center, initialRadius, finalRadius, initialAngle,
+                                            finalAngle, imageSize, radialScale)
+
+    if plan is None:
+        plan = TransformPlan(settings, 'cartesian', order=order, border=border, borderVal=borderVal,
+                             precision=precision, backend=backend, masked=masked)
+
+    cartesianImages = plan.executeStack(images, out=out, batchSize=batchSize, workers=workers)
+    _storePlan(cacheKey, plan)
+
+    return cartesianImages, settings
+
+
+def _getPatchTable(grid, shape, fixedPointDtype=None):
+    """Precompute bilinear source offsets and weights of a grid of points relative to a whole pixel center
+
+    Moving the center by a whole pixel moves every point by the same number of pixels, so the fractional offsets and
+    weights of the points stay the same and the flat source indices move by the flat index of the center. The table is
+    the same as :func:`_getGatherTable` for any center where the points and their neighbors are inside the image, up to
+    floating point rounding of the coordinates.
+
+    Parameters
+    ----------
+    grid : (2, ...) :class:`numpy.ndarray`
+        Coordinates of the points relative to the center, first item is the row and second item is the column
+    shape : (2,) :class:`tuple` of :class:`int`
+        Size of the image that is interpolated
+    fixedPointDtype : :class:`numpy.dtype`, optional
+        Integer datatype to compute fixed point bilinear weights for, see :func:`_getFixedPointWeights`
+
+    Returns
+    -------
+    offsets : (P,) :class:`numpy.ndarray`
+        Flat index of the top-left source pixel of each point relative to the flat index of the center
+    fractions : (2, P) :class:`numpy.ndarray`
+        Fractional row and column offsets of each point
+    weights : (4, P) :class:`numpy.ndarray`
+        Fixed point bilinear weights, :obj:`None` unless :obj:`fixedPointDtype` is given
+    bounds : :class:`tuple` of :class:`int`
+        Top, bottom, left and right offset from the center of the source pixels that are read
+    """
+    y, x = grid[0].ravel(), grid[1].ravel()
+
+    # Each point reads the 2x2 neighborhood of its top-left pixel
+    y0, x0 = np.floor(y), np.floor(x)
+    offsets = y0.astype(np.intp) * shape[1] + x0.astype(np.intp)
+    fractions = np.stack((y - y0, x - x0))
+    weights = None if fixedPointDtype is None else _getFixedPointWeights(fractions, fixedPointDtype)
+    bounds = (int(y0.min()), int(y0.max()) + 1, int(x0.min()), int(x0.max()) + 1)
+
+    return offsets, fractions, weights, bounds
+
+
+def convertToPolarPatches(image, centers, initialRadius=None, finalRadius=None, initialAngle=None, finalAngle=None,
+                          radiusSize=None, angleSize=None, order=3, border='constant', borderVal=0.0, batchSize=None,
+                          workers=None, precision='float64', out=None, radialScale='linear', fovealRadius=None):
+    """Convert patches around many centers of one cartesian image to polar images.
+
+    This is the same as calling :func:`convertToPolarImage` with each center, such as the candidate centers of a
+    detection, except the image is padded and prefiltered once and the coordinates of every patch are calculated from
+    one grid relative to the center. Each patch offsets the grid by its center, which is done for a batch of patches at
+    once. For bilinear interpolation with the 'constant' or 'nearest' border and whole pixel centers, the patches inside
+    the image also share the interpolation weights of the grid, so floating point results may differ from
+    :func:`convertToPolarImage` by rounding error.
+
+    See :func:`convertToPolarImage` for a description of the arguments.
+
+    Parameters
+    ----------
+    image : (N, M) or (N, M, C) :class:`numpy.ndarray` or :class:`SplineCoefficients`
+        Cartesian image to extract the polar patches from
+    centers : (P, 2) :class:`numpy.ndarray`
+        Center of each patch in the cartesian image, structured as (x, y) like the center of
+        :func:`convertToPolarImage`
+    finalRadius : :class:`int`
+        Final radius of the patches in pixels from their center. Unlike :func:`convertToPolarImage`, this must be given
+        since the default depends on the center.
+    radiusSize, angleSize : :class:`int`, optional
+        Size of the patches for the radial and angular dimension. If not specified, the patches are sampled one
+        cartesian pixel apart at :obj:`finalRadius`, which is the same as the 'nyquist' sizing of
+        :func:`convertToPolarImage` for a patch inside the image.
+    batchSize : :class:`int`, optional
+        Number of patches converted at once. The coordinates of each batch are stored, so this can be set to limit the
+        memory used for many large patches.
+
+        If not specified, all patches are converted at once.
+    workers : :class:`int`, optional
+        Number of threads used for the conversion, see :func:`setNumWorkers`.
+
+        If not specified, the module default is used.
+    precision : {'float64', 'float32'}, optional
+        Floating point precision of the coordinates and spline coefficients, see :func:`convertToPolarImage`.
+
+        Default is 'float64'
+    out : (P, R, A) or (P, R, A, C) :class:`numpy.ndarray`, optional
+        Array to store the patches in. Must have one patch for each center, the size of the patches and the same number
+        of channels as :obj:`image`.
+
+        If not specified, a new array is allocated.
+    radialScale : {'linear', 'log'}, optional
+        Spacing of the radii of the rows of the patches, see :func:`convertToPolarImage`.
+
+        Default is 'linear'
+    fovealRadius : :class:`float`, optional
+        Radius up to which the rows of the log scale are at least as dense as the linear scale, see
+        :func:`convertToPolarImage`.
+
+    Returns
+    -------
+    patches : (P, R, A) or (P, R, A, C) :class:`numpy.ndarray`
+        Polar patches where the first dimension is the patch, second dimension is radii and third dimension is angle
+    settings : :class:`list` of :class:`ImageTransform`
+        Metadata for conversion between polar and cartesian image for each patch
+    """
+    centers = np.asarray(centers)
+    if centers.ndim != 2 or centers.shape[1] != 2:
+        raise ValueError('Centers must have shape (P, 2) but has shape %s' % (centers.shape,))
+
+    if finalRadius is None:
+        raise ValueError('Final radius must be given for polar patches')
+
+    # Fill in the defaults, see _createPolarSettings
+    initialRadius = 0 if initialRadius is None else initialRadius
+    initialAngle = 0 if initialAngle is None else initialAngle
+    finalAngle = 2 * np.pi if finalAngle is None else finalAngle
+
+    if radiusSize is None:
+        radiusSize = max(int(np.ceil(finalRadius - initialRadius)), 1)
+
+        if radialScale == 'log':
+            radiusSize = _getLogRadiusSize(radiusSize, initialRadius, finalRadius, fovealRadius)
+
+    if angleSize is None:
+        angleSize = max(int(np.ceil(finalRadius * (finalAngle - initialAngle))), 1)
+
+    shape = image.shape
+    settings = [ImageTransform(center, initialRadius, finalRadius, initialAngle, finalAngle, shape[0:2],
+                               (radiusSize, angleSize), radialScale) for center in centers]
+
+    workers = _resolveWorkers(workers)
+    dtype = _getPrecisionDtype(precision)
+
+    outputShape = (centers.shape[0], radiusSize, angleSize) + tuple(shape[2:3])
+    if out is None:
+        out = np.empty(outputShape, dtype=image.dtype)
+    elif out.shape != outputShape:
+        raise ValueError('Output array has shape %s but expected shape %s' % (out.shape, outputShape))
+
+    # Pad and prefilter the image once for all patches unless spline coefficients are given
+    if isinstance(image, SplineCoefficients):
+        if image.order != order or image.border != border or image.borderVal != borderVal:
+            raise ValueError('Spline coefficients were created with order=%i, border=%s, borderVal=%s but conversion '
+                             'uses order=%i, border=%s, borderVal=%s' % (image.order, image.border, image.borderVal,
+                                                                         order, border, borderVal))
     else:
-        # This is used to scale the result of the radius to get the appropriate Cartesian value
-        scaleRadius = settings.polarImageSize[0] / (settings.finalRadius - settings.initialRadius)
+        image = prefilterImage(image, order=order, border=border, borderVal=borderVal, workers=workers,
+                               precision=precision)
+
+    coefficients, padding = image.coefficients, image.padding
+    # Grid of coordinates relative to the center, which is the same for every patch
+    grid = _getPolarGrid(settings[0], dtype) if settings else np.empty((2, radiusSize, angleSize), dtype=dtype)
+
+    # Nearest neighbor and bilinear interpolation gather the pixels of all channels at once, same as the default
+    # backend of convertToPolarImage. The gather works on three dimensional arrays, so a single channel is given its own
+    # dimension.
+    isGather = order <= 1 and border in ('constant', 'nearest')
+    margin = _getBorderMargin(order, border)
+    source = coefficients[:, :, None] if coefficients.ndim == 2 else coefficients
+    # Integer images are interpolated in fixed point arithmetic when the output has the same datatype, same as the
+    # gather backend, otherwise the floating point result is cast into the output
+    isFixedPoint = order == 1 and source.dtype == out.dtype and out.dtype in _fixedPointFormats
+
+    # For bilinear interpolation, patches with a whole pixel center that lie inside the image share one table of
+    # source offsets and weights. Nearest neighbor interpolation calculates the table for each patch instead, since
+    # points halfway between two pixels may round to the other pixel when the center is added.
+    patchTable = _getPatchTable(grid, source.shape, out.dtype if isFixedPoint else None) \
+        if isGather and order == 1 and np.issubdtype(centers.dtype, np.integer) else None
+
+    if batchSize is None:
+        batchSize = max(centers.shape[0], 1)
+
+    for start in range(0, centers.shape[0], batchSize):
+        batch = centers[start:start + batchSize] + padding
+        result = out[start:start + batch.shape[0]]
+        result = result[..., None] if coefficients.ndim == 2 else result
+
+        isShared = np.zeros(batch.shape[0], dtype=bool)
+        if patchTable is not None:
+            offsets, fractions, weights, (top, bottom, left, right) = patchTable
+            isShared = (batch[:, 1] + top >= 0) & (batch[:, 1] + bottom < source.shape[0]) & \
+                       (batch[:, 0] + left >= 0) & (batch[:, 0] + right < source.shape[1])
+
+        if isShared.any():
+            # Offset the flat source indices of the grid by the flat index of each center
+            shared = batch[isShared]
+            indices = (offsets[None, :] + (shared[:, 1] * source.shape[1] + shared[:, 0])[:, None]).ravel()
+            table = (indices, np.tile(fractions, (1, shared.shape[0])), np.empty(0, dtype=np.intp), source.shape[1], 1)
+            values = np.empty((shared.shape[0],) + result.shape[1:], dtype=out.dtype)
+
+            _gatherInterpolate(table, source, values, borderVal, workers=workers,
+                               weights=None if weights is None else np.tile(weights, (1, shared.shape[0])))
+            result[isShared] = values
+
+        if isShared.all():
+            continue
+
+        # Offset the grid by the center and padding of the remaining patches, in the same order as
+        # _getPolarImageCoordinates so that each patch is the same as converting it on its own
+        remaining = centers[start:start + batchSize][~isShared]
+        coordinates = np.repeat(grid[:, None], remaining.shape[0], axis=1)
+        coordinates[0] += remaining[:, 1, None, None]
+        coordinates[1] += remaining[:, 0, None, None]
+        if padding:
+            coordinates += padding
+
+        values = result if not isShared.any() else np.empty((remaining.shape[0],) + result.shape[1:], dtype=out.dtype)
+        if isGather:
+            table = _getGatherTable(coordinates, source.shape[:2], order, border, margin)
+            weights = _getFixedPointWeights(table[1], out.dtype) if isFixedPoint else None
+            _gatherInterpolate(table, source, values, borderVal, workers=workers, weights=weights)
+        else:
+            _mapCoordinates(source, coordinates, values, order, border, borderVal, workers,
+                            _getBorderLimits(source.shape, margin))
 
-        # This is used to scale the result of the angle to get the appropriate Cartesian value
-        scaleAngle = settings.polarImageSize[1] / (settings.finalAngle - settings.initialAngle)
+        if isShared.any():
+            result[~isShared] = values
 
-    # Get list of cartesian x and y coordinate and create a 2D create of the coordinates using meshgrid
-    xs = np.arange(0, settings.cartesianImageSize[1])
-    ys = np.arange(0, settings.cartesianImageSize[0])
-    x, y = np.meshgrid(xs, ys)
+    # If there are 4 bands, then assume the 4th band is alpha
+    # We do not want to interpolate the transparency so we just make it all fully opaque
+    if len(shape) == 3 and shape[2] == 4:
+        imin, imax = skimage.util.dtype_limits(out, False)
+        out[..., 3] = imax
 
-    # Take cartesian grid and convert to polar coordinates
-    r, theta = getPolarPoints2(x, y, settings.center)
+    return out, settings
 
-    # Offset the radius by the initial source radius
-    r = r - settings.initialRadius
 
-    # Offset the theta angle by the initial source angle
-    # The theta values may go past 2pi, so they are looped back around by taking modulo with 2pi.
-    # Note: This assumes initial source angle is positive
-    theta = np.mod(theta - settings.initialAngle + 2 * np.pi, 2 * np.pi)
+# File extensions read and written by the command line converter. TIFF files with more than one page are stacks
+_imageExtensions = ('.npy', '.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff')
+_stackExtensions = ('.npy', '.tif', '.tiff')
 
-    # Scale the radius using scale factor
-    r = r * scaleRadius
+# Settings loaded by each worker process of the command line converter, see _initConverter
+_converterSettings = None
 
-    # Scale the angle from radians to pixels using scale factor
-    theta = theta * scaleAngle
 
-    # Flatten the desired x/y cartesian points into one 2xN array
-    desiredCoords = np.vstack((r.flatten(), theta.flatten()))
+def _findInputFiles(patterns):
+    """Expand the inputs of the command line converter into a list of files
 
-    # If border is set to constant, then pad the image by the edges by 3 pixels.
-    # If one tries to convert back to cartesian without the borders padded then the border of the cartesian image will
-    # be corrupted because it will average the pixels with the border value
-    if border == 'constant':
-        # Pad image by 3 pixels and then offset all of the desired coordinates by 3
-        image = np.pad(image, ((3, 3), (3, 3), (0, 0)) if isMultiChannel else 3, 'edge')
-        desiredCoords += 3
-
-    # Retrieve cartesian image using map_coordinates. Returns a linear array of the values that
-    # must be reshaped into the desired size.
-    # For multiple channels, repeat this process for each band and concatenate them at end
-    if isMultiChannel:
-        cartesianImages = []
-
-        # Assume that there are at least 3 bands in 3D matrix
-        for k in range(3):
-            cartesianImage = scipy.ndimage.map_coordinates(image[:, :, k], desiredCoords, mode=border, cval=borderVal,
-                                                           order=order).reshape(x.shape)
-            cartesianImages.append(cartesianImage)
+    Parameters
+    ----------
+    patterns : :class:`list` of :class:`str`
+        Files, directories or glob patterns. Directories are expanded into the supported image files inside them.
 
-        # If there are 4 bands, then assume the 4th band is alpha
-        # We do not want to interpolate the transparency so we just make it all fully opaque
-        if image.shape[2] == 4:
-            imin, imax = skimage.util.dtype_limits(cartesianImages[0], False)
-            cartesianImage = np.full_like(cartesianImages[0], imax)
-            cartesianImages.append(cartesianImage)
+    Returns
+    -------
+    files : :class:`list` of :class:`str`
+        Files in the order of the patterns, each pattern sorted by name, without duplicates
+    """
+    files, seenFiles = [], set()
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            matches = glob.glob(pattern)
+
+        matches = sorted(match for match in matches if os.path.isfile(match) and
+                         os.path.splitext(match)[1].lower() in _imageExtensions)
+        if not matches:
+            raise ValueError('No image files match %s' % pattern)
+
+        for match in matches:
+            if match not in seenFiles:
+                seenFiles.add(match)
+                files.append(match)
+
+    return files
+
+
+def _getOutputPath(inputPath, outputDirectory, outputFormat):
+    # Output file has the name of the input file in the output directory, with the extension of the output format
+    name, extension = os.path.splitext(os.path.basename(inputPath))
+
+    return os.path.join(outputDirectory, name + ('.' + outputFormat.lower() if outputFormat else extension.lower()))
+
+
+def _readImage(path, isStack):
+    """Read an image or stack of images for the command line converter
+
+    Parameters
+    ----------
+    path : :class:`str`
+        Path of the file to read
+    isStack : :class:`bool`
+        Whether the first axis of arrays in npy files and single page TIFF files is the frame of a stack. TIFF files
+        with more than one page are always stacks and the other formats are never stacks.
+
+    Returns
+    -------
+    image : :class:`numpy.ndarray`
+        Image or stack of images
+    isStack : :class:`bool`
+        Whether the image is a stack of images
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.npy':
+        return np.load(path), isStack
+    elif imageio is None:
+        raise ImportError('Reading %s files requires imageio, only npy files can be used without it' % extension)
+    elif extension in ('.tif', '.tiff'):
+        pages = imageio.mimread(path, memtest=False)
+
+        return (np.stack(pages), True) if len(pages) > 1 else (pages[0], isStack)
+
+    return np.asarray(imageio.imread(path)), False
 
-        cartesianImage = np.dstack(cartesianImages)
+
+def _writeImage(path, image, isStack):
+    """Write an image or stack of images for the command line converter
+
+    The file is written to a temporary file first and then renamed, so that an interrupted conversion does not leave
+    a partial file that would be skipped when the conversion is resumed.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        Path of the file to write
+    image : :class:`numpy.ndarray`
+        Image or stack of images to write
+    isStack : :class:`bool`
+        Whether the image is a stack of images
+    """
+    name, extension = os.path.splitext(path)
+    extension = extension.lower()
+    temporaryFile = '%s.%i.tmp%s' % (name, os.getpid(), extension)
+
+    if isStack and extension not in _stackExtensions:
+        raise ValueError('Stacks of images can only be written to %s files, not %s' %
+                         (', '.join(_stackExtensions), extension))
+
+    try:
+        if extension == '.npy':
+            with open(temporaryFile, 'wb') as file:
+                np.save(file, image)
+        elif imageio is None:
+            raise ImportError('Writing %s files requires imageio, only npy files can be used without it' % extension)
+        elif extension in ('.tif', '.tiff'):
+            imageio.mimwrite(temporaryFile, list(image) if isStack else [image], format=extension)
+        else:
+            imageio.imwrite(temporaryFile, image, format=extension)
+
+        os.replace(temporaryFile, path)
+    finally:
+        if os.path.exists(temporaryFile):
+            os.remove(temporaryFile)
+
+
+def _initConverter(transformPath, workers, cacheSize):
+    """Initialize a worker process of the command line converter
+
+    Each process keeps its own plan cache, so the coordinate maps of each geometry are calculated once per process and
+    reused for every following file with the same shape. Settings saved with :meth:`ImageTransform.save` are
+    memory-mapped, so the processes share their coordinate maps rather than calculating them at all.
+    """
+    global _converterSettings
+
+    setNumWorkers(workers)
+    setCacheSize(cacheSize)
+
+    if transformPath is not None:
+        _converterSettings = ImageTransform.load(transformPath)
+
+
+def _convertFile(inputPath, outputPath, direction, isStack, arguments):
+    """Convert a single file for the command line converter
+
+    Parameters
+    ----------
+    inputPath, outputPath : :class:`str`
+        Paths of the file to convert and the file to write the result to
+    direction : {'polar', 'cartesian'}
+        Domain that the image is converted to
+    isStack : :class:`bool`
+        Whether the first axis of arrays in npy and single page TIFF files is the frame of a stack
+    arguments : :class:`dict`
+        Keyword arguments of the conversion, the settings loaded by :func:`_initConverter` are added if given
+
+    Returns
+    -------
+    frames : :class:`int`
+        Number of images converted
+    pixels : :class:`int`
+        Number of pixels of the converted images
+    """
+    image, isStack = _readImage(inputPath, isStack)
+
+    if _converterSettings is not None:
+        arguments = dict(arguments, settings=_converterSettings)
+
+    if direction == 'polar':
+        convert = convertToPolarStack if isStack else convertToPolarImage
     else:
-        cartesianImage = scipy.ndimage.map_coordinates(image, desiredCoords, mode=border, cval=borderVal,
-                                                       order=order).reshape(x.shape)
+        convert = convertToCartesianStack if isStack else convertToCartesianImage
+
+    result, _ = convert(image, **arguments)
+    _writeImage(outputPath, result, isStack)
+
+    frames = result.shape[0] if isStack else 1
+    pixels = int(np.prod(result.shape[1:3] if isStack else result.shape[:2])) * frames
+
+    return frames, pixels
+
+
+def _parseSizing(sizing):
+    # Sizing is either the name of a sizing or a number of samples per pixel
+    if sizing in ('default', 'nyquist'):
+        return sizing
+
+    try:
+        return float(sizing)
+    except ValueError:
+        raise argparse.ArgumentTypeError('must be default, nyquist or a number of samples per pixel')
+
+
+def _createParser():
+    # Command line arguments of the converter, with the same names and defaults as the conversion functions
+    parser = argparse.ArgumentParser(prog='polarTransform',
+                                     description='Convert image files between the polar and cartesian domain.')
+
+    parser.add_argument('inputs', nargs='+', metavar='INPUT',
+                        help='image files, directories or glob patterns to convert (%s)' % ', '.join(_imageExtensions))
+    parser.add_argument('-o', '--output', required=True, help='directory to write the converted files to')
+    parser.add_argument('-d', '--direction', choices=('polar', 'cartesian'), default='polar',
+                        help='domain to convert the images to (default: polar)')
+    parser.add_argument('-f', '--format', dest='outputFormat', choices=[e[1:] for e in _imageExtensions],
+                        help='format of the converted files (default: format of each input file)')
+    parser.add_argument('--stack', action='store_true', dest='isStack',
+                        help='treat the first axis of arrays in npy and single page tiff files as the frames of a '
+                             'stack')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='convert files whose output already exists instead of skipping them')
+
+    geometry = parser.add_argument_group('geometry', 'Transform arguments, see convertToPolarImage and '
+                                                     'convertToCartesianImage. Array coordinates are used, so x is '
+                                                     'the column and y is the row of the image.')
+    geometry.add_argument('--transform', dest='transformPath', metavar='PATH',
+                          help='directory of settings saved with ImageTransform.save to use instead of the arguments '
+                               'below')
+    geometry.add_argument('--center', nargs=2, type=float, metavar=('X', 'Y'))
+    geometry.add_argument('--initial-radius', dest='initialRadius', type=float, metavar='R')
+    geometry.add_argument('--final-radius', dest='finalRadius', type=float, metavar='R')
+    geometry.add_argument('--initial-angle', dest='initialAngle', type=float, metavar='A', help='in radians')
+    geometry.add_argument('--final-angle', dest='finalAngle', type=float, metavar='A', help='in radians')
+    geometry.add_argument('--radius-size', dest='radiusSize', type=int, metavar='N', help='polar direction only')
+    geometry.add_argument('--angle-size', dest='angleSize', type=int, metavar='N', help='polar direction only')
+    geometry.add_argument('--sizing', type=_parseSizing, help='default, nyquist or a number of samples per pixel, '
+                                                              'polar direction only')
+    geometry.add_argument('--foveal-radius', dest='fovealRadius', type=float, metavar='R',
+                          help='polar direction only')
+    geometry.add_argument('--image-size', dest='imageSize', nargs=2, type=int, metavar=('ROWS', 'COLUMNS'),
+                          help='cartesian direction only')
+    geometry.add_argument('--radial-scale', dest='radialScale', choices=('linear', 'log'))
+
+    interpolation = parser.add_argument_group('interpolation')
+    interpolation.add_argument('--order', type=int, choices=range(6), default=3)
+    interpolation.add_argument('--border', choices=('constant', 'nearest', 'wrap', 'reflect', 'mirror'),
+                               default='constant')
+    interpolation.add_argument('--border-val', dest='borderVal', type=float, default=0.0, metavar='VALUE')
+    interpolation.add_argument('--precision', choices=('float32', 'float64'), default='float64')
+
+    performance = parser.add_argument_group('performance')
+    performance.add_argument('-j', '--jobs', type=int, default=-1, metavar='N',
+                             help='number of processes, negative values count back from the number of CPUs '
+                                  '(default: -1)')
+    performance.add_argument('--threads', type=int, default=1, metavar='N',
+                             help='number of threads per process (default: 1)')
+    performance.add_argument('--cache-size', dest='cacheSize', type=int, default=1 << 30, metavar='BYTES',
+                             help='maximum size of the plan cache of each process (default: 1 GiB)')
+
+    return parser
+
+
+def main(args=None):
+    """Command line converter, run with ``python -m polarTransform`` or the ``polarTransform`` script
+
+    Converts image files between the polar and cartesian domain in a pool of processes. Files whose output already
+    exists are skipped, so an interrupted run continues where it stopped when it is run again. The throughput is
+    printed once all files are converted. Use ``--help`` for the list of arguments.
 
-    return cartesianImage, settings
+    Parameters
+    ----------
+    args : :class:`list` of :class:`str`, optional
+        Command line arguments, uses :obj:`sys.argv` if not specified
+
+    Returns
+    -------
+    status : :class:`int`
+        Exit status, 0 if every file was converted or skipped and 1 if any file failed
+    """
+    parser = _createParser()
+    arguments = parser.parse_args(args)
+
+    # Geometry arguments that apply to the other direction, or to settings loaded from a file, are rejected rather
+    # than silently ignored. Arguments that are not given keep the defaults of the conversion functions
+    geometryOptions = {'center': '--center', 'initialRadius': '--initial-radius', 'finalRadius': '--final-radius',
+                       'initialAngle': '--initial-angle', 'finalAngle': '--final-angle',
+                       'radialScale': '--radial-scale'}
+    directionOptions = {'polar': {'radiusSize': '--radius-size', 'angleSize': '--angle-size', 'sizing': '--sizing',
+                                  'fovealRadius': '--foveal-radius'},
+                        'cartesian': {'imageSize': '--image-size'}}
+
+    for direction, options in directionOptions.items():
+        for name, option in options.items():
+            if getattr(arguments, name) is None:
+                continue
+            elif direction != arguments.direction:
+                parser.error('argument %s is not used for the %s direction' % (option, arguments.direction))
+
+            geometryOptions[name] = option
+
+    geometryArguments = {name: getattr(arguments, name) for name in geometryOptions
+                         if getattr(arguments, name) is not None}
+    if arguments.transformPath is not None and geometryArguments:
+        parser.error('argument %s cannot be combined with --transform' % geometryOptions[next(iter(geometryArguments))])
+
+    try:
+        inputPaths = _findInputFiles(arguments.inputs)
+    except ValueError as error:
+        parser.error(str(error))
+
+    os.makedirs(arguments.output, exist_ok=True)
+
+    # Outputs with the same name would overwrite each other, and an output that replaces its input would be
+    # skipped by later runs as if it was converted
+    outputPaths = [_getOutputPath(path, arguments.output, arguments.outputFormat) for path in inputPaths]
+    for inputPath, outputPath in zip(inputPaths, outputPaths):
+        if os.path.abspath(inputPath) == os.path.abspath(outputPath):
+            parser.error('output of %s would overwrite the input file' % inputPath)
+    if len(set(outputPaths)) != len(outputPaths):
+        parser.error('input files with the same name would be converted to the same output file')
+
+    conversionArguments = dict(geometryArguments, order=arguments.order, border=arguments.border,
+                               borderVal=arguments.borderVal, precision=arguments.precision)
+
+    # Skip files that were converted by a previous run
+    tasks = [(inputPath, outputPath) for inputPath, outputPath in zip(inputPaths, outputPaths)
+             if arguments.overwrite or not os.path.exists(outputPath)]
+    skipped = len(inputPaths) - len(tasks)
+
+    converted, failed, frames, pixels = 0, 0, 0, 0
+    startTime = time.perf_counter()
+
+    if tasks:
+        jobs = min(_resolveWorkers(arguments.jobs), len(tasks))
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_initConverter,
+                                                    initargs=(arguments.transformPath, arguments.threads,
+                                                              arguments.cacheSize)) as executor:
+            futures = {executor.submit(_convertFile, inputPath, outputPath, arguments.direction, arguments.isStack,
+                                       conversionArguments): inputPath for inputPath, outputPath in tasks}
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    fileFrames, filePixels = future.result()
+                except Exception as error:
+                    print('Failed to convert %s: %s' % (futures[future], error), file=sys.stderr)
+                    failed += 1
+                else:
+                    converted += 1
+                    frames += fileFrames
+                    pixels += filePixels
+
+    elapsedTime = time.perf_counter() - startTime
+    rate = 1 / elapsedTime if elapsedTime > 0 else 0.0
+
+    print('Converted %i files (%i images, %.1f megapixels) in %.2f s, skipped %i and failed %i' %
+          (converted, frames, pixels / 1e6, elapsedTime, skipped, failed))
+    print('Throughput: %.1f files/s, %.1f images/s, %.1f megapixels/s' %
+          (converted * rate, frames * rate, pixels / 1e6 * rate))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
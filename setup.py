@@ -29,6 +29,9 @@ setup(name='polarTransform',
       },
       python_requires='>=3',
       py_modules=['polarTransform'],
+      entry_points={
+          'console_scripts': ['polarTransform = polarTransform:main'],
+      },
       license='MIT License',
       install_requires=[
           'numpy', 'scipy', 'scikit-image']
@@ -1,8 +1,15 @@
+import contextlib
+import io
+import json
 import os
 import sys
+import tempfile
+import time
+import tracemalloc
 import unittest
 
 import numpy as np
+import scipy.ndimage
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from util import loadImage, assert_image_equal
@@ -499,5 +506,1546 @@ class TestPointConversion(unittest.TestCase):
                       [60 * 802 / 543, 1200]])), np.array([[451, 365], [401, 400], [348, 365], [401, 305]]))
 
 
+class TestTransformPlan(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        self.verticalLinesPolarImage = loadImage('verticalLinesPolarImage.png')
+        self.verticalLinesPolarImage_scaled = loadImage('verticalLinesPolarImage_scaled.png')
+        self.verticalLinesCartesianImage_scaled = loadImage('verticalLinesCartesianImage_scaled.png')
+
+    def test_polarPlan(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        plan = ptSettings.createPolarPlan()
+
+        self.assertEqual(plan.inputSize, self.verticalLinesImage.shape[0:2])
+        self.assertEqual(plan.outputSize, (256, 1024))
+
+        polarImage = plan.execute(self.verticalLinesImage)
+        np.testing.assert_almost_equal(polarImage, self.verticalLinesPolarImage)
+
+        # Output buffer of the plan is reused for subsequent calls
+        polarImage2 = plan.execute(self.verticalLinesImage)
+        self.assertIs(polarImage, polarImage2)
+
+    def test_cartesianPlan(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, initialRadius=30,
+                                                                    finalRadius=100, initialAngle=2 / 4 * np.pi,
+                                                                    finalAngle=5 / 4 * np.pi, radiusSize=140,
+                                                                    angleSize=700)
+        plan = ptSettings.createCartesianPlan()
+
+        cartesianImage = plan.execute(self.verticalLinesPolarImage_scaled)
+        np.testing.assert_almost_equal(cartesianImage, self.verticalLinesCartesianImage_scaled)
+
+    def test_out(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage,
+                                                                    center=np.array([401, 365]), order=1)
+        plan = ptSettings.createPolarPlan(order=1)
+
+        out = np.zeros_like(polarImage)
+        result = plan.execute(self.shortAxisApexImage, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, polarImage)
+
+        with self.assertRaises(ValueError):
+            plan.execute(self.shortAxisApexImage, out=np.zeros((10, 10), dtype=polarImage.dtype))
+
+    def test_dtype(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage.astype(float),
+                                                                    center=np.array([401, 365]))
+        plan = ptSettings.createPolarPlan(dtype=np.float64)
+
+        np.testing.assert_array_equal(plan.execute(self.shortAxisApexImage), polarImage)
+
+    def test_settingsCopied(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        plan = ptSettings.createPolarPlan()
+
+        ptSettings.polarImageSize = (100, 100)
+        np.testing.assert_almost_equal(plan.execute(self.verticalLinesImage), self.verticalLinesPolarImage)
+
+    def test_invalidDirection(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+
+        with self.assertRaises(ValueError):
+            polarTransform.TransformPlan(ptSettings, 'logPolar')
+
+
+class TestPlanCache(unittest.TestCase):
+    def setUp(self):
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        self.verticalLinesPolarImage = loadImage('verticalLinesPolarImage.png')
+        self.verticalLinesPolarImage_scaled = loadImage('verticalLinesPolarImage_scaled.png')
+        self.verticalLinesCartesianImage_scaled = loadImage('verticalLinesCartesianImage_scaled.png')
+
+        polarTransform.clearCache()
+        polarTransform.setCacheSize(256 * 1024 ** 2)
+
+    def tearDown(self):
+        polarTransform.setCacheSize(0)
+        polarTransform.clearCache()
+
+    def test_disabledByDefault(self):
+        polarTransform.setCacheSize(0)
+
+        polarTransform.convertToPolarImage(self.verticalLinesImage)
+        polarTransform.convertToPolarImage(self.verticalLinesImage)
+
+        info = polarTransform.getCacheInfo()
+        self.assertEqual((info.hits, info.count, info.currentBytes), (0, 0, 0))
+
+    def test_polar(self):
+        polarImage1, ptSettings1 = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        polarImage2, ptSettings2 = polarTransform.convertToPolarImage(self.verticalLinesImage)
+
+        info = polarTransform.getCacheInfo()
+        self.assertEqual((info.hits, info.misses, info.count), (1, 1, 1))
+        self.assertGreater(info.currentBytes, 0)
+
+        np.testing.assert_almost_equal(polarImage1, self.verticalLinesPolarImage)
+        np.testing.assert_almost_equal(polarImage2, self.verticalLinesPolarImage)
+        self.assertIsNot(polarImage1, polarImage2)
+
+        # Changing the returned settings must not change the cached settings
+        self.assertIsNot(ptSettings1, ptSettings2)
+        ptSettings2.center[0] = 0
+        polarImage3, ptSettings3 = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        np.testing.assert_array_equal(ptSettings3.center, np.array([128, 128]))
+
+    def test_cartesianSettings(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, initialRadius=30,
+                                                                    finalRadius=100, initialAngle=2 / 4 * np.pi,
+                                                                    finalAngle=5 / 4 * np.pi, radiusSize=140,
+                                                                    angleSize=700)
+
+        for _ in range(2):
+            cartesianImage, ptSettings2 = polarTransform.convertToCartesianImage(
+                self.verticalLinesPolarImage_scaled, settings=ptSettings)
+
+            self.assertIs(ptSettings2, ptSettings)
+            np.testing.assert_almost_equal(cartesianImage, self.verticalLinesCartesianImage_scaled)
+
+        self.assertEqual(polarTransform.getCacheInfo().hits, 1)
+
+        # Changing the settings results in a new plan
+        ptSettings.center = np.array([100, 100])
+        polarTransform.convertToCartesianImage(self.verticalLinesPolarImage_scaled, settings=ptSettings)
+        self.assertEqual(polarTransform.getCacheInfo().misses, 3)
+
+    def test_eviction(self):
+        polarTransform.convertToPolarImage(self.verticalLinesImage, order=1)
+        nbytes = polarTransform.getCacheInfo().currentBytes
+
+        polarTransform.setCacheSize(nbytes)
+        polarTransform.convertToPolarImage(self.verticalLinesImage, order=0)
+
+        info = polarTransform.getCacheInfo()
+        self.assertEqual((info.evictions, info.count), (1, 1))
+        self.assertLessEqual(info.currentBytes, nbytes)
+
+        polarTransform.convertToPolarImage(self.verticalLinesImage, order=1)
+        self.assertEqual(polarTransform.getCacheInfo().hits, 0)
+
+        polarTransform.clearCache()
+        info = polarTransform.getCacheInfo()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.count, info.currentBytes), (0, 0, 0, 0, 0))
+
+
+class TestCoordinates(unittest.TestCase):
+    def test_polarGrid(self):
+        ptSettings = polarTransform.ImageTransform(np.array([401.5, 365]), 5, 543, 0.25, 2 * np.pi, (608, 800),
+                                                   (802, 1600))
+
+        radii = np.linspace(5, 543, 802, endpoint=False)
+        theta = np.linspace(0.25, 2 * np.pi, 1600, endpoint=False)
+        x, y = polarTransform.getCartesianPoints2(*np.meshgrid(radii, theta, indexing='ij'), ptSettings.center)
+
+        coordinates = polarTransform._getPolarImageCoordinates(ptSettings)
+        np.testing.assert_array_equal(coordinates[0], y)
+        np.testing.assert_array_equal(coordinates[1], x)
+
+        # Trig tables are shared between transforms with the same angles
+        cosTheta, sinTheta = polarTransform._getTrigTable(0.25, 2 * np.pi, 1600)
+        self.assertIs(polarTransform._getTrigTable(0.25, 2 * np.pi, 1600)[0], cosTheta)
+        self.assertFalse(cosTheta.flags.writeable)
+
+    def test_symmetricCartesianGrid(self):
+        for imageSize, center in [((608, 800), (401, 365)), ((500, 500), (250, 250)), ((7, 3), (0, 6)),
+                                  ((5, 9), (8, 0)), ((1, 1), (0, 0))]:
+            x, y = np.meshgrid(np.arange(imageSize[1]), np.arange(imageSize[0]))
+            r, theta = polarTransform.getPolarPoints2(x, y, np.array(center))
+
+            self.assertTrue(polarTransform._isSymmetricCenter(imageSize, center))
+            r2, theta2 = polarTransform._getSymmetricPolarGrid(imageSize, center)
+            np.testing.assert_array_equal(r2, r)
+            np.testing.assert_allclose(theta2, theta, rtol=0, atol=1e-14)
+
+        # Fractional or off-image centers are not symmetric
+        self.assertFalse(polarTransform._isSymmetricCenter((608, 800), (401.5, 365)))
+        self.assertFalse(polarTransform._isSymmetricCenter((608, 800), (800, 365)))
+        self.assertFalse(polarTransform._isSymmetricCenter((608, 800), (401, -1)))
+
+
+class TestSplineCoefficients(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        self.shortAxisApexPolarImage = loadImage('shortAxisApexPolarImage.png')
+        self.verticalLinesPolarImage = loadImage('verticalLinesPolarImage.png')
+        self.verticalLinesPolarImage_scaled2 = loadImage('verticalLinesPolarImage_scaled2.png')
+        self.verticalLinesCartesianImage_scaled = loadImage('verticalLinesCartesianImage_scaled.png')
+
+    def test_polar(self):
+        coefficients = polarTransform.prefilterImage(self.verticalLinesImage)
+
+        self.assertEqual(coefficients.shape, self.verticalLinesImage.shape)
+        self.assertEqual(coefficients.dtype, self.verticalLinesImage.dtype)
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(coefficients)
+        self.assertEqual(ptSettings.polarImageSize, (256, 1024))
+        np.testing.assert_almost_equal(polarImage, self.verticalLinesPolarImage)
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(coefficients, initialRadius=30, finalRadius=100)
+        np.testing.assert_almost_equal(polarImage, self.verticalLinesPolarImage_scaled2)
+
+    def test_grayscale(self):
+        coefficients = polarTransform.prefilterImage(self.shortAxisApexImage)
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(coefficients, center=np.array([401, 365]))
+        np.testing.assert_almost_equal(polarImage, self.shortAxisApexPolarImage)
+
+        plan = ptSettings.createPolarPlan()
+        np.testing.assert_almost_equal(plan.execute(coefficients), self.shortAxisApexPolarImage)
+
+    def test_cartesian(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, initialRadius=30,
+                                                                    finalRadius=100, initialAngle=2 / 4 * np.pi,
+                                                                    finalAngle=5 / 4 * np.pi, radiusSize=140,
+                                                                    angleSize=700)
+
+        coefficients = polarTransform.prefilterImage(polarImage)
+        cartesianImage = ptSettings.convertToCartesianImage(coefficients)
+        np.testing.assert_almost_equal(cartesianImage, self.verticalLinesCartesianImage_scaled)
+
+    def test_borders(self):
+        for border in ['nearest', 'reflect', 'wrap', 'mirror']:
+            for order in [0, 1, 3]:
+                polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, border=border,
+                                                                            order=order)
+
+                coefficients = polarTransform.prefilterImage(self.shortAxisApexImage, order=order, border=border)
+                polarImage2, ptSettings = polarTransform.convertToPolarImage(coefficients, border=border,
+                                                                             order=order)
+                np.testing.assert_array_equal(polarImage2, polarImage)
+
+    def test_mismatch(self):
+        coefficients = polarTransform.prefilterImage(self.verticalLinesImage, order=3)
+
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarImage(coefficients, order=1)
+
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarImage(coefficients, border='nearest')
+
+
+class TestMultiChannel(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        # Stack of bands made from the grayscale and color images
+        self.multiChannelImage = np.dstack((self.verticalLinesImage[:, :, :3], self.verticalLinesImage[:, :, 2::-1],
+                                            self.verticalLinesImage[:, :, 1:3]))
+
+    def test_allChannels(self):
+        for border in ['constant', 'nearest', 'reflect']:
+            for order in [0, 1, 3]:
+                polarImage, ptSettings = polarTransform.convertToPolarImage(self.multiChannelImage, order=order,
+                                                                            border=border, borderVal=64)
+
+                self.assertEqual(polarImage.shape, ptSettings.polarImageSize + (8,))
+                self.assertTrue(polarImage.flags.c_contiguous)
+
+                for k in range(8):
+                    polarBand, _ = polarTransform.convertToPolarImage(self.multiChannelImage[:, :, k], order=order,
+                                                                      border=border, borderVal=64,
+                                                                      settings=ptSettings)
+                    np.testing.assert_array_equal(polarImage[:, :, k], polarBand)
+
+    def test_twoChannels(self):
+        image = np.dstack((self.shortAxisApexImage, 255 - self.shortAxisApexImage)).astype(np.float32)
+
+        cartesianImage, ptSettings = polarTransform.convertToCartesianImage(image, order=1, imageSize=(400, 400))
+        self.assertEqual(cartesianImage.shape, (400, 400, 2))
+        self.assertEqual(cartesianImage.dtype, np.float32)
+
+        for k in range(2):
+            cartesianBand = ptSettings.convertToCartesianImage(image[:, :, k], order=1)
+            np.testing.assert_allclose(cartesianImage[:, :, k], cartesianBand, rtol=1e-6, atol=1e-3)
+
+    def test_nonContiguousOut(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.multiChannelImage, order=1)
+        plan = ptSettings.createPolarPlan(order=1)
+
+        out = np.zeros((8,) + ptSettings.polarImageSize, dtype=polarImage.dtype).transpose(1, 2, 0)
+        plan.execute(self.multiChannelImage, out=out)
+        np.testing.assert_array_equal(out, polarImage)
+
+
+class TestStack(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        # Stacks of frames made by shifting the image values
+        self.grayscaleStack = np.stack([self.shortAxisApexImage // (k + 1) for k in range(5)])
+        self.colorStack = np.stack([self.verticalLinesImage, 255 - self.verticalLinesImage, self.verticalLinesImage])
+
+    def test_polarGrayscale(self):
+        for order in [0, 1, 3]:
+            polarImages, ptSettings = polarTransform.convertToPolarStack(self.grayscaleStack, center=[401, 365],
+                                                                         order=order)
+            self.assertEqual(polarImages.shape, (5,) + ptSettings.polarImageSize)
+            self.assertEqual(polarImages.dtype, self.grayscaleStack.dtype)
+
+            for k in range(5):
+                polarImage, _ = polarTransform.convertToPolarImage(self.grayscaleStack[k], order=order,
+                                                                   settings=ptSettings)
+                np.testing.assert_array_equal(polarImages[k], polarImage)
+
+    def test_polarColor(self):
+        polarImages, ptSettings = polarTransform.convertToPolarStack(self.colorStack, border='nearest')
+        self.assertEqual(polarImages.shape, (3,) + ptSettings.polarImageSize + (4,))
+
+        for k in range(3):
+            polarImage, _ = polarTransform.convertToPolarImage(self.colorStack[k], border='nearest',
+                                                               settings=ptSettings)
+            np.testing.assert_array_equal(polarImages[k], polarImage)
+
+    def test_cartesian(self):
+        polarImages, ptSettings = polarTransform.convertToPolarStack(self.colorStack)
+        cartesianImages = ptSettings.convertToCartesianStack(polarImages)
+        self.assertEqual(cartesianImages.shape, self.colorStack.shape)
+
+        for k in range(3):
+            cartesianImage = ptSettings.convertToCartesianImage(polarImages[k])
+            np.testing.assert_array_equal(cartesianImages[k], cartesianImage)
+
+    def test_batchSize(self):
+        polarImages, ptSettings = polarTransform.convertToPolarStack(self.grayscaleStack, center=[401, 365])
+
+        for batchSize in [1, 2, 5, 10]:
+            np.testing.assert_array_equal(ptSettings.convertToPolarStack(self.grayscaleStack, batchSize=batchSize),
+                                          polarImages)
+
+    def test_out(self):
+        polarImages, ptSettings = polarTransform.convertToPolarStack(self.colorStack, order=1)
+        plan = ptSettings.createPolarPlan(order=1)
+
+        out = np.zeros_like(polarImages)
+        self.assertIs(plan.executeStack(self.colorStack, out=out, batchSize=2), out)
+        np.testing.assert_array_equal(out, polarImages)
+
+        with self.assertRaises(ValueError):
+            plan.executeStack(self.colorStack, out=out[:2])
+
+
+class TestWorkers(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def tearDown(self):
+        polarTransform.setNumWorkers(1)
+
+    def test_polar(self):
+        for order in [0, 1, 3]:
+            polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                        order=order, workers=1)
+
+            for workers in [2, 3, -1]:
+                np.testing.assert_array_equal(ptSettings.convertToPolarImage(self.shortAxisApexImage, order=order,
+                                                                             workers=workers), polarImage)
+
+    def test_multiChannel(self):
+        for border in ['constant', 'reflect']:
+            for order in [1, 3]:
+                polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, order=order,
+                                                                            border=border, workers=1)
+                cartesianImage = ptSettings.convertToCartesianImage(polarImage, order=order, border=border, workers=1)
+
+                np.testing.assert_array_equal(ptSettings.convertToPolarImage(self.verticalLinesImage, order=order,
+                                                                             border=border, workers=4), polarImage)
+                np.testing.assert_array_equal(ptSettings.convertToCartesianImage(polarImage, order=order,
+                                                                                 border=border, workers=4),
+                                              cartesianImage)
+
+    def test_stack(self):
+        images = np.stack([self.shortAxisApexImage, 255 - self.shortAxisApexImage, self.shortAxisApexImage // 2])
+        polarImages, ptSettings = polarTransform.convertToPolarStack(images, workers=1)
+
+        np.testing.assert_array_equal(ptSettings.convertToPolarStack(images, batchSize=2, workers=5), polarImages)
+
+    def test_default(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+
+        polarTransform.setNumWorkers(3)
+        self.assertEqual(polarTransform.getNumWorkers(), 3)
+        np.testing.assert_array_equal(ptSettings.convertToPolarImage(self.shortAxisApexImage), polarImage)
+
+        polarTransform.setNumWorkers(-1)
+        self.assertGreaterEqual(polarTransform.getNumWorkers(), 1)
+
+        with self.assertRaises(ValueError):
+            polarTransform.setNumWorkers(0)
+
+
+class TestTiled(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def test_polar(self):
+        for border in ['constant', 'nearest', 'wrap']:
+            for order in [0, 1, 3]:
+                polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                            order=order, border=border)
+                tiledImage, _ = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                   order=order, border=border, maxMemory=2 ** 19)
+
+                np.testing.assert_array_equal(tiledImage, polarImage)
+
+    def test_cartesian(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+
+        for order in [1, 3]:
+            cartesianImage = ptSettings.convertToCartesianImage(polarImage, order=order, border='nearest')
+            tiledImage = ptSettings.convertToCartesianImage(polarImage, order=order, border='nearest',
+                                                            maxMemory=2 ** 20)
+
+            self.assertEqual(tiledImage.shape, cartesianImage.shape)
+            np.testing.assert_array_equal(tiledImage, cartesianImage)
+
+    def test_float(self):
+        image = self.shortAxisApexImage.astype(np.float64)
+
+        for order in [1, 3, 5]:
+            polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[400.5, 360.25], order=order)
+            tiledImage = ptSettings.convertToPolarImage(image, order=order, maxMemory=2 ** 18)
+
+            np.testing.assert_allclose(tiledImage, polarImage, rtol=0, atol=1e-10)
+
+    def test_splineCoefficients(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, border='nearest')
+        coefficients = polarTransform.prefilterImage(self.verticalLinesImage, border='nearest')
+
+        tiledImage = ptSettings.convertToPolarImage(coefficients, border='nearest', maxMemory=2 ** 20)
+        np.testing.assert_array_equal(tiledImage, polarImage)
+
+        with self.assertRaises(ValueError):
+            ptSettings.convertToPolarImage(coefficients, maxMemory=2 ** 20)
+
+
+class TestPrecision(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def test_polar(self):
+        image = self.shortAxisApexImage.astype(np.float64)
+
+        for order in [1, 3]:
+            polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[400.5, 360.25], order=order)
+            polarImage32 = ptSettings.convertToPolarImage(image, order=order, precision='float32')
+
+            self.assertEqual(polarImage32.dtype, np.float64)
+            np.testing.assert_allclose(polarImage32, polarImage, rtol=0, atol=0.05)
+
+    def test_cartesian(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+
+        for order in [1, 3]:
+            cartesianImage = ptSettings.convertToCartesianImage(polarImage, order=order)
+            cartesianImage32 = ptSettings.convertToCartesianImage(polarImage, order=order, precision='float32')
+
+            self.assertEqual(cartesianImage32.dtype, np.uint8)
+            self.assertLessEqual(np.abs(cartesianImage32.astype(int) - cartesianImage).max(), 1)
+
+    def test_plan(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+
+        plan = ptSettings.createPolarPlan(order=3)
+        plan32 = ptSettings.createPolarPlan(order=3, precision='float32')
+        self.assertEqual(plan32.nbytes * 2, plan.nbytes)
+        self.assertLessEqual(np.abs(plan32.execute(self.shortAxisApexImage).astype(int) - polarImage).max(), 1)
+
+        coefficients = polarTransform.prefilterImage(self.shortAxisApexImage, precision='float32')
+        self.assertEqual(coefficients.coefficients.dtype, np.float32)
+        np.testing.assert_array_equal(plan32.execute(coefficients), plan32.execute(self.shortAxisApexImage))
+
+        with self.assertRaises(ValueError):
+            ptSettings.createPolarPlan(precision='float16')
+
+
+class TestStream(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        self.frames = [self.shortAxisApexImage // (k + 1) for k in range(6)]
+
+    def test_polar(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+
+        buffers = set()
+        for k, polarFrame in enumerate(ptSettings.convertToPolarStream(iter(self.frames), queueSize=1)):
+            np.testing.assert_array_equal(polarFrame, ptSettings.convertToPolarImage(self.frames[k]))
+            buffers.add(id(polarFrame))
+
+        self.assertEqual(k, len(self.frames) - 1)
+        self.assertLessEqual(len(buffers), 3)
+
+    def test_cartesian(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        polarFrames = [polarImage, 255 - polarImage]
+
+        cartesianFrames = [frame.copy() for frame in ptSettings.convertToCartesianStream(polarFrames, order=1)]
+
+        self.assertEqual(len(cartesianFrames), 2)
+        for polarFrame, cartesianFrame in zip(polarFrames, cartesianFrames):
+            np.testing.assert_array_equal(cartesianFrame, ptSettings.convertToCartesianImage(polarFrame, order=1))
+
+    def test_error(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+
+        def frames():
+            yield self.shortAxisApexImage
+            raise IOError('Unable to decode frame')
+
+        stream = ptSettings.convertToPolarStream(frames())
+        np.testing.assert_array_equal(next(stream), polarImage)
+
+        with self.assertRaises(IOError):
+            next(stream)
+
+    def test_backpressure(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+        framesRead = []
+
+        def frames():
+            while True:
+                framesRead.append(None)
+                yield self.shortAxisApexImage
+
+        stream = ptSettings.convertToPolarStream(frames(), order=1, queueSize=2)
+        next(stream)
+        time.sleep(0.5)
+
+        # Frames read are bounded by the frame held by the caller, the frames in both queues and the frame being
+        # converted
+        self.assertLessEqual(len(framesRead), 7)
+        stream.close()
+
+        with self.assertRaises(ValueError):
+            next(ptSettings.convertToPolarStream(self.frames, queueSize=0))
+
+
+class TestMemmap(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        self.tempDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_polarStack(self):
+        images = np.stack([self.shortAxisApexImage // (k + 1) for k in range(3)])
+        np.save(os.path.join(self.tempDir.name, 'images.npy'), images)
+        images = np.load(os.path.join(self.tempDir.name, 'images.npy'), mmap_mode='r')
+
+        polarImages, ptSettings = polarTransform.convertToPolarStack(images, center=[401, 365])
+
+        out = np.memmap(os.path.join(self.tempDir.name, 'polar.dat'), dtype=polarImages.dtype, mode='w+',
+                        shape=polarImages.shape)
+        result = ptSettings.convertToPolarStack(images, out=out)
+
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, polarImages)
+
+    def test_cartesianImage(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        cartesianImage = ptSettings.convertToCartesianImage(polarImage)
+
+        out = np.memmap(os.path.join(self.tempDir.name, 'cartesian.dat'), dtype=cartesianImage.dtype, mode='w+',
+                        shape=cartesianImage.shape)
+        result = ptSettings.convertToCartesianImage(polarImage, out=out)
+
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, cartesianImage)
+
+    def test_tiled(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    order=1)
+
+        out = np.memmap(os.path.join(self.tempDir.name, 'polar.dat'), dtype=polarImage.dtype, mode='w+',
+                        shape=polarImage.shape)
+        result = ptSettings.convertToPolarImage(self.shortAxisApexImage, order=1, maxMemory=2 ** 20, out=out)
+
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, polarImage)
+
+    def test_outShape(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+
+        out = np.empty((10, 10, 4), dtype=polarImage.dtype)
+        with self.assertRaises(ValueError):
+            ptSettings.convertToPolarImage(self.shortAxisApexImage, out=out)
+        with self.assertRaises(ValueError):
+            ptSettings.convertToPolarImage(self.shortAxisApexImage, maxMemory=2 ** 20, out=out)
+        with self.assertRaises(ValueError):
+            ptSettings.convertToPolarStack(self.shortAxisApexImage[None], out=out[None])
+
+
+class TestConstantBorder(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def convertPadded(self, image, ptSettings, order, borderVal):
+        # Convert by padding the entire image by the edges and interpolating with the constant border
+        padded = np.pad(image, ((3, 3), (3, 3)) + ((0, 0),) * (image.ndim - 2), 'edge')
+        coordinates = polarTransform._getPolarImageCoordinates(ptSettings) + 3
+        channels = [padded] if image.ndim == 2 else [padded[:, :, k] for k in range(image.shape[2])]
+
+        return np.stack([scipy.ndimage.map_coordinates(channel, coordinates, order=order, mode='constant',
+                                                       cval=borderVal) for channel in channels], axis=-1).squeeze()
+
+    def test_padded(self):
+        for image, center in [(self.shortAxisApexImage, [401, 365]), (self.verticalLinesImage, [100.5, 30.25])]:
+            for order in (0, 1, 3):
+                for borderVal in (0.0, 100.0):
+                    polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=center, order=order,
+                                                                                borderVal=borderVal,
+                                                                                finalRadius=800)
+
+                    np.testing.assert_array_equal(polarImage[..., :3],
+                                                  self.convertPadded(image, ptSettings, order, borderVal)[..., :3])
+
+                    tiledImage = ptSettings.convertToPolarImage(image, order=order, borderVal=borderVal,
+                                                                maxMemory=2 ** 20)
+                    np.testing.assert_array_equal(tiledImage, polarImage)
+
+    def test_noCopy(self):
+        # Without prefiltering, the coefficients are the image itself
+        coefficients = polarTransform.prefilterImage(self.shortAxisApexImage, order=1)
+        self.assertIs(coefficients.coefficients, self.shortAxisApexImage)
+
+        # With prefiltering, the image is padded directly into the coefficients
+        tracemalloc.start()
+        try:
+            coefficients = polarTransform.prefilterImage(self.shortAxisApexImage, order=3)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(coefficients.padding, 3)
+        self.assertLess(peak, coefficients.coefficients.nbytes + self.shortAxisApexImage.nbytes // 2)
+
+
+class TestMatrix(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def test_execute(self):
+        image = np.asarray(self.verticalLinesImage[:, :, :3], dtype=np.float64)
+        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[100.5, 30.25])
+
+        for order in (0, 1):
+            for border in ('constant', 'nearest'):
+                plan = ptSettings.createPolarPlan(order=order, border=border)
+
+                np.testing.assert_allclose(plan.executeMatrix(image), plan.execute(image), atol=1e-10)
+
+    def test_batch(self):
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[401, 365], order=1)
+        frames = np.stack([image, image / 2, image / 4], axis=-1)
+
+        plan = ptSettings.createPolarPlan(order=1)
+        polarFrames = plan.executeMatrix(frames)
+
+        self.assertEqual(polarFrames.shape, polarImage.shape + (3,))
+        for k in range(3):
+            np.testing.assert_allclose(polarFrames[:, :, k], plan.execute(frames[:, :, k]), atol=1e-10)
+
+    def test_adjoint(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+        plan = ptSettings.createCartesianPlan(order=1)
+
+        rng = np.random.default_rng(0)
+        x, y = rng.random(plan.inputSize), rng.random(plan.outputSize)
+
+        self.assertAlmostEqual(np.vdot(plan.executeMatrix(x), y), np.vdot(x, plan.executeMatrix(y, adjoint=True)),
+                               delta=1e-9 * x.size)
+        self.assertEqual(plan.executeMatrix(y, adjoint=True).shape, plan.inputSize)
+
+        with self.assertRaises(ValueError):
+            plan.executeMatrix(x, adjoint=True)
+
+    def test_cache(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+
+        matrix = ptSettings.getPolarMatrix()
+        self.assertIs(ptSettings.getPolarMatrix(), matrix)
+        self.assertIsNot(ptSettings.getPolarMatrix(order=0), matrix)
+        self.assertEqual(matrix.shape, (polarImage.size, self.shortAxisApexImage.size))
+        self.assertEqual(ptSettings.getCartesianMatrix().shape, (self.shortAxisApexImage.size, polarImage.size))
+
+        # Changing the settings creates a new matrix
+        ptSettings.center[0] += 1
+        self.assertIsNot(ptSettings.getPolarMatrix(), matrix)
+
+        with self.assertRaises(ValueError):
+            ptSettings.getPolarMatrix(order=3)
+        with self.assertRaises(ValueError):
+            ptSettings.getPolarMatrix(border='wrap')
+
+
+class TestIntegerGather(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def convertReference(self, image, ptSettings, order):
+        # Convert each channel with map_coordinates and the nearest border
+        coordinates = polarTransform._getPolarImageCoordinates(ptSettings)
+        channels = [image] if image.ndim == 2 else [image[:, :, k] for k in range(image.shape[2])]
+
+        return np.stack([scipy.ndimage.map_coordinates(channel, coordinates, order=order, mode='nearest')
+                         for channel in channels], axis=-1).reshape(ptSettings.polarImageSize + image.shape[2:])
+
+    def test_labels(self):
+        rng = np.random.default_rng(0)
+        labels = rng.integers(0, 1000, self.shortAxisApexImage.shape, dtype=np.uint16)
+
+        polarLabels, ptSettings = polarTransform.convertToPolarImage(labels, center=[401, 365], order=0,
+                                                                     border='nearest')
+
+        np.testing.assert_array_equal(polarLabels, self.convertReference(labels, ptSettings, 0))
+        self.assertTrue(np.all(np.isin(polarLabels, labels)))
+
+    def test_bilinear(self):
+        rng = np.random.default_rng(0)
+        images = [np.asarray(self.shortAxisApexImage), np.asarray(self.verticalLinesImage[:, :, :3]),
+                  rng.integers(0, 65536, self.shortAxisApexImage.shape, dtype=np.uint16)]
+
+        for image in images:
+            polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[100.5, 30.25], order=1,
+                                                                        border='nearest')
+
+            np.testing.assert_array_equal(polarImage, self.convertReference(image, ptSettings, 1))
+
+    def test_ties(self):
+        # Points halfway between two pixels with values that differ by one are exactly halfway between two integers,
+        # which must round up like floating point
+        source = np.array([[0], [1], [2], [3]], dtype=np.uint8)
+        index = np.array([0, 1, 2, 0], dtype=np.intp)
+        fractions = np.array([[0.0, 0.0, 0.0, 0.0], [0.5, 0.5, 0.5, 0.25]])
+        weights = polarTransform._getFixedPointWeights(fractions, source.dtype)
+
+        out = np.empty((4, 1), dtype=np.uint8)
+        polarTransform._fixedPointBilinear(source, index, weights, fractions, 0, 1, out)
+
+        np.testing.assert_array_equal(out[:, 0], [1, 2, 3, 0])
+
+        expected = np.empty_like(out)
+        polarTransform._castInterpolated(polarTransform._bilinear(source, index, fractions, 0, 1), expected)
+        np.testing.assert_array_equal(out, expected)
+
+
+class TestNumba(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    @unittest.skipIf(polarTransform.numba is None, 'Numba is not installed')
+    def test_polar(self):
+        for image, center in [(self.shortAxisApexImage, [401, 365]), (self.verticalLinesImage, None)]:
+            for order in (0, 1, 3):
+                for border in ('constant', 'nearest'):
+                    polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=center, order=order,
+                                                                                border=border, borderVal=7)
+                    numbaImage = ptSettings.convertToPolarImage(image, order=order, border=border, borderVal=7,
+                                                                backend='numba')
+
+                    self.assertLessEqual(np.abs(numbaImage.astype(int) - polarImage).max(), 1)
+
+    @unittest.skipIf(polarTransform.numba is None, 'Numba is not installed')
+    def test_cartesian(self):
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[401.5, 300.25])
+
+        for order in (0, 1, 3):
+            for border in ('constant', 'nearest'):
+                cartesianImage = ptSettings.convertToCartesianImage(polarImage, order=order, border=border)
+                numbaImage = ptSettings.convertToCartesianImage(polarImage, order=order, border=border,
+                                                                backend='numba')
+
+                np.testing.assert_allclose(numbaImage, cartesianImage, rtol=0, atol=1e-9 * 255)
+
+    def test_fallback(self):
+        # Unsupported conversions, or all conversions if Numba is not installed, use the scipy backend
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    order=5, border='wrap')
+
+        np.testing.assert_array_equal(ptSettings.convertToPolarImage(self.shortAxisApexImage, order=5, border='wrap',
+                                                                     backend='numba'), polarImage)
+
+        if polarTransform.numba is None:
+            polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, backend='numba')
+            np.testing.assert_array_equal(polarImage, ptSettings.convertToPolarImage(self.shortAxisApexImage))
+
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarImage(self.shortAxisApexImage, backend='opencv')
+
+
+class CountingBackend(polarTransform.InterpolationBackend):
+    # Backend that counts how often it is used and interpolates with map_coordinates
+    def __init__(self):
+        self.count = 0
+
+    def interpolate(self, plan, coefficients, out, workers=1):
+        self.count += 1
+        polarTransform._backends['scipy'].interpolate(plan, coefficients, out, workers)
+
+
+class TestBackend(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+        self.cacheDir = tempfile.TemporaryDirectory()
+        self.previousCacheFile = polarTransform._backendCacheFile
+        polarTransform.setBackendCacheFile(os.path.join(self.cacheDir.name, 'backends.json'))
+
+    def tearDown(self):
+        polarTransform.setBackendCacheFile(self.previousCacheFile)
+        polarTransform._backends.pop('counting', None)
+        self.cacheDir.cleanup()
+
+    def test_backends(self):
+        for image in (self.shortAxisApexImage, np.asarray(self.verticalLinesImage[:, :, :3], dtype=np.float64)):
+            for order in (0, 1):
+                for border in ('constant', 'nearest'):
+                    polarImage, ptSettings = polarTransform.convertToPolarImage(image, order=order, border=border,
+                                                                                borderVal=7)
+                    cartesianImage = ptSettings.convertToCartesianImage(polarImage, order=order, border=border)
+
+                    for backend in ('scipy', 'numpy', 'gather', 'matrix', 'numba', 'auto'):
+                        backendImage = ptSettings.convertToPolarImage(image, order=order, border=border, borderVal=7,
+                                                                      backend=backend)
+                        np.testing.assert_allclose(backendImage, polarImage, rtol=0, atol=1)
+
+                        backendImage = ptSettings.convertToCartesianImage(polarImage, order=order, border=border,
+                                                                          backend=backend)
+                        np.testing.assert_allclose(backendImage, cartesianImage, rtol=0, atol=1)
+
+    def test_fallback(self):
+        # Conversions that are not supported by the backend use the default backend
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+
+        for backend in ('numpy', 'gather', 'matrix'):
+            np.testing.assert_array_equal(ptSettings.convertToPolarImage(self.shortAxisApexImage, backend=backend),
+                                          polarImage)
+
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarImage(self.shortAxisApexImage, backend='opencv')
+
+        with self.assertRaises(ValueError):
+            ptSettings.createPolarPlan(backend='opencv')
+
+    def test_register(self):
+        backend = CountingBackend()
+        polarTransform.registerBackend('counting', backend)
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+        np.testing.assert_array_equal(ptSettings.convertToPolarImage(self.shortAxisApexImage, backend='counting'),
+                                      polarImage)
+        self.assertEqual(backend.count, 1)
+
+        with self.assertRaises(ValueError):
+            polarTransform.registerBackend('scipy', backend)
+
+        with self.assertRaises(ValueError):
+            polarTransform.registerBackend('auto', backend)
+
+    def test_auto(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    order=1)
+        plan = ptSettings.createPolarPlan(order=1, backend='auto')
+        np.testing.assert_allclose(plan.execute(self.shortAxisApexImage), polarImage, rtol=0, atol=1)
+
+        # The selected backend is stored in the cache file
+        with open(polarTransform._backendCacheFile) as file:
+            tunedBackends = json.load(file)
+
+        self.assertEqual(len(tunedBackends), 1)
+        tuningKey, name = tunedBackends.popitem()
+        self.assertIn(name, polarTransform._backends)
+
+        # Later conversions, including those of other processes, use the stored backend without benchmarking again
+        backend = CountingBackend()
+        polarTransform.registerBackend('counting', backend)
+
+        with open(polarTransform._backendCacheFile, 'w') as file:
+            json.dump({tuningKey: 'counting'}, file)
+
+        polarTransform.setBackendCacheFile(polarTransform._backendCacheFile)
+        plan = ptSettings.createPolarPlan(order=1, backend='auto')
+        plan.execute(self.shortAxisApexImage)
+        self.assertEqual(backend.count, 1)
+
+        polarTransform.clearBackendCache()
+        self.assertFalse(os.path.exists(polarTransform._backendCacheFile))
+
+    @unittest.skipIf(polarTransform.numba is None, 'Numba is not installed')
+    def test_numbaCoordinates(self):
+        # The numba backend calculates the coordinates as it goes, so the plan never computes the coordinate map
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+        plan = ptSettings.createPolarPlan(backend='numba')
+
+        np.testing.assert_allclose(plan.execute(self.shortAxisApexImage), polarImage, rtol=0, atol=1)
+        self.assertIsNone(plan._coordinates)
+
+
+class TestLogPolar(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def test_radii(self):
+        # Each row of the polar image of the distance from the center samples its radius
+        ys, xs = np.mgrid[:301, :401]
+        distance = np.hypot(xs - 200, ys - 150)
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(distance, center=[200, 150], initialRadius=2,
+                                                                    finalRadius=140, radiusSize=50, order=1,
+                                                                    radialScale='log')
+        radii = np.expm1(np.linspace(np.log1p(2), np.log1p(140), 50, endpoint=False))
+
+        self.assertEqual(polarImage.shape[0], 50)
+        np.testing.assert_allclose(polarImage.mean(axis=1), radii, atol=0.05)
+
+    def test_defaultSize(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365])
+        logImage, logSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                   radialScale='log')
+
+        self.assertEqual(logSettings.radialScale, 'log')
+        self.assertEqual(logImage.shape[1], polarImage.shape[1])
+        self.assertLess(logImage.shape[0], polarImage.shape[0])
+
+        # Spacing between the rows is at most the linear spacing up to the default foveal radius, a tenth of the final
+        # radius
+        fovealRadius = ptSettings.finalRadius / 10
+        linearSpacing = ptSettings.finalRadius / ptSettings.polarImageSize[0]
+        row = logSettings.getPolarPointsImage(np.array([[401 + fovealRadius, 365]]))[0, 0]
+        radii = logSettings.getCartesianPointsImage(np.array([[0, 0], [1, 0], [np.floor(row) - 1, 0],
+                                                              [np.floor(row), 0]]))[:, 0] - 401
+        self.assertLessEqual(radii[1] - radii[0], linearSpacing)
+        self.assertLessEqual(radii[3] - radii[2], linearSpacing)
+
+        # Larger foveal radii use more rows, but never more than the linear scale
+        logImage2, logSettings2 = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                     radialScale='log', fovealRadius=60)
+        self.assertGreater(logImage2.shape[0], logImage.shape[0])
+        self.assertLess(logImage2.shape[0], polarImage.shape[0])
+
+        logImage3, logSettings3 = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                     radialScale='log', fovealRadius=1000)
+        self.assertEqual(logImage3.shape, polarImage.shape)
+
+    def test_points(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    initialRadius=5, radiusSize=200,
+                                                                    radialScale='log')
+        points = np.array([[420, 380], [500, 300], [401, 500]])
+
+        polarPoints = ptSettings.getPolarPointsImage(points)
+        np.testing.assert_allclose(ptSettings.getCartesianPointsImage(polarPoints), points, atol=1e-9)
+
+        # Log of one plus the radius is linear in the row
+        radii = np.hypot(*(points - [401, 365]).T)
+        np.testing.assert_allclose(polarPoints[:, 0],
+                                   (np.log1p(radii) - np.log1p(5)) * 200 / (np.log1p(543) - np.log1p(5)))
+
+    def test_roundTrip(self):
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[401, 365], radiusSize=200,
+                                                                    radialScale='log')
+        cartesianImage = ptSettings.convertToCartesianImage(polarImage)
+
+        # Near the center the rows are dense enough to recover the image
+        ys, xs = np.mgrid[:image.shape[0], :image.shape[1]]
+        mask = np.hypot(xs - 401, ys - 365) < 60
+        self.assertLess(np.abs(cartesianImage - image)[mask].mean(), 1)
+
+        # Same result from the module function, the tiled conversion and the other backends
+        cartesianImage2, _ = polarTransform.convertToCartesianImage(polarImage, settings=ptSettings)
+        np.testing.assert_array_equal(cartesianImage2, cartesianImage)
+        np.testing.assert_allclose(ptSettings.convertToCartesianImage(polarImage, maxMemory=2 ** 20),
+                                   cartesianImage, atol=1e-9)
+        np.testing.assert_allclose(ptSettings.convertToPolarImage(image, maxMemory=2 ** 20), polarImage, atol=1e-9)
+
+        for backend in ('matrix', 'numba'):
+            np.testing.assert_allclose(ptSettings.convertToPolarImage(image, order=1, backend=backend),
+                                       ptSettings.convertToPolarImage(image, order=1), atol=1e-9)
+            np.testing.assert_allclose(ptSettings.convertToCartesianImage(polarImage, order=1, backend=backend),
+                                       ptSettings.convertToCartesianImage(polarImage, order=1), atol=1e-9)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarImage(self.shortAxisApexImage, radialScale='sqrt')
+
+
+class TestSizing(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+
+    def test_nyquist(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    sizing='nyquist')
+
+        # Farthest pixel from the center is the corner at (0, 0)
+        outerRadius = np.hypot(401, 365)
+        self.assertEqual(ptSettings.polarImageSize, (ptSettings.finalRadius, int(np.ceil(outerRadius * 2 * np.pi))))
+        self.assertEqual(polarImage.shape, ptSettings.polarImageSize)
+
+        # Partial rings and explicit sizes
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    initialRadius=50, finalRadius=200,
+                                                                    finalAngle=np.pi, angleSize=100,
+                                                                    sizing='nyquist')
+        self.assertEqual(ptSettings.polarImageSize, (150, 100))
+
+    def test_log(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    finalRadius=300, sizing='nyquist')
+        logImage, logSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                   finalRadius=300, radialScale='log',
+                                                                   sizing='nyquist', fovealRadius=30)
+
+        # Fewer rows than the linear scale, with a radial spacing of at most one pixel up to the foveal radius
+        self.assertLess(logSettings.polarImageSize[0], ptSettings.polarImageSize[0])
+        self.assertEqual(logSettings.polarImageSize[1], int(np.ceil(300 * 2 * np.pi)))
+
+        row = int(logSettings.getPolarPointsImage(np.array([[431, 365]]))[0, 0])
+        radii = logSettings.getCartesianPointsImage(np.array([[row, 0], [row + 1, 0]]))[:, 0] - 401
+        self.assertLessEqual(radii[1] - radii[0], 1)
+
+    def test_resolution(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, sizing='nyquist')
+        halfImage, halfSettings = polarTransform.convertToPolarImage(self.verticalLinesImage, sizing=0.5)
+
+        self.assertEqual(halfSettings.polarImageSize[0], int(np.ceil(ptSettings.polarImageSize[0] / 2)))
+        self.assertLessEqual(abs(halfSettings.polarImageSize[1] - ptSettings.polarImageSize[1] / 2), 1)
+
+        # Default sizing is unchanged
+        defaultImage, defaultSettings = polarTransform.convertToPolarImage(self.verticalLinesImage)
+        self.assertEqual(defaultSettings.polarImageSize, (256, 1024))
+
+        for sizing in ('optimal', 0, -1, [1, 2]):
+            with self.assertRaises(ValueError):
+                polarTransform.convertToPolarImage(self.verticalLinesImage, sizing=sizing)
+
+    def test_roundTrip(self):
+        # Sampling the outermost ring at one sample per pixel loses less than the default size
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[401, 365])
+        defaultError = np.abs(ptSettings.convertToCartesianImage(polarImage) - image).mean()
+
+        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=[401, 365], sizing='nyquist')
+        nyquistError = np.abs(ptSettings.convertToCartesianImage(polarImage) - image).mean()
+
+        self.assertLess(nyquistError, defaultError)
+
+
+class TestCrop(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.sector = dict(initialRadius=30, finalRadius=100, initialAngle=np.pi / 2, finalAngle=5 * np.pi / 4)
+
+    def test_bounds(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, **self.sector)
+
+        # Bounding box of the points of the sector, bilinear interpolation reads one pixel around it
+        plan = ptSettings.createPolarPlan(order=1)
+        coordinates = polarTransform._getPolarImageCoordinates(ptSettings)
+        for (start, stop), values in zip(plan._cropBounds, coordinates):
+            self.assertEqual(start, np.floor(values.min()) - 1)
+            self.assertEqual(stop, np.ceil(values.max()) + 2)
+
+        # Full image and cartesian plans are not cropped
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+        self.assertIsNone(ptSettings.createPolarPlan()._cropBounds)
+        self.assertIsNone(ptSettings.createCartesianPlan()._cropBounds)
+
+    def test_execute(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, **self.sector)
+
+        for order in (0, 1, 3):
+            for border in ('constant', 'nearest', 'reflect', 'wrap'):
+                plan = ptSettings.createPolarPlan(order=order, border=border)
+                expected = plan._getUncroppedPlan().execute(self.shortAxisApexImage)
+                np.testing.assert_array_equal(plan.execute(self.shortAxisApexImage), expected)
+
+                coefficients = polarTransform.prefilterImage(self.shortAxisApexImage, order=order, border=border)
+                np.testing.assert_array_equal(plan.execute(coefficients), expected)
+
+        # Bicubic interpolation of a floating point image is the same up to rounding
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+        plan = ptSettings.createPolarPlan(order=3)
+        np.testing.assert_allclose(plan.execute(image), plan._getUncroppedPlan().execute(image), atol=1e-9)
+
+    def test_stack(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, **self.sector)
+        images = np.stack((self.shortAxisApexImage, self.shortAxisApexImage[::-1]))
+
+        plan = ptSettings.createPolarPlan(order=1)
+        np.testing.assert_array_equal(plan.executeStack(images), plan._getUncroppedPlan().executeStack(images))
+
+        # Images with another size are converted without cropping
+        polarImage = plan.execute(self.shortAxisApexImage[:300, :300])
+        self.assertEqual(polarImage.shape, ptSettings.polarImageSize)
+
+    def test_matrix(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, **self.sector)
+        plan = ptSettings.createPolarPlan(order=1)
+        uncroppedPlan = plan._getUncroppedPlan()
+
+        matrix = plan.getMatrix()
+        self.assertEqual(matrix.shape, (np.prod(plan.outputSize), np.prod(plan.inputSize)))
+        self.assertEqual(abs(matrix - uncroppedPlan.getMatrix()).max(), 0)
+
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+        np.testing.assert_array_equal(plan.executeMatrix(image), uncroppedPlan.executeMatrix(image))
+
+        polarImage = np.random.RandomState(0).rand(*plan.outputSize)
+        np.testing.assert_array_equal(plan.executeMatrix(polarImage, adjoint=True),
+                                      uncroppedPlan.executeMatrix(polarImage, adjoint=True))
+
+
+class TestMasked(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.polarImage, self.ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage,
+                                                                              initialRadius=30, finalRadius=100,
+                                                                              initialAngle=np.pi / 2,
+                                                                              finalAngle=5 * np.pi / 4)
+
+    def test_mask(self):
+        mask = self.ptSettings.getCartesianMask()
+        self.assertEqual(mask.shape, self.ptSettings.cartesianImageSize)
+        self.assertIs(self.ptSettings.getCartesianMask(), mask)
+        self.assertFalse(mask.flags.writeable)
+
+        # Center, corners and the opposite side of the sector are outside, the middle of the sector is inside
+        center = self.ptSettings.center
+        self.assertFalse(mask[center[1], center[0]])
+        self.assertFalse(mask[0, 0])
+        self.assertFalse(mask[center[1], center[0] + 65])
+        self.assertTrue(mask[center[1], center[0] - 65])
+
+        # Mask is recomputed when the settings change in place
+        self.ptSettings.finalAngle = 2 * np.pi
+        self.assertIsNot(self.ptSettings.getCartesianMask(), mask)
+
+    def test_constant(self):
+        for order in (0, 1, 3):
+            for backend in (None, 'scipy', 'matrix'):
+                if backend == 'matrix' and order > 1:
+                    continue
+
+                expected = self.ptSettings.convertToCartesianImage(self.polarImage, order=order, backend=backend)
+                cartesianImage = self.ptSettings.convertToCartesianImage(self.polarImage, order=order,
+                                                                         backend=backend, masked=True)
+                np.testing.assert_array_equal(cartesianImage, expected)
+
+        # Tiled conversion and stacks
+        cartesianImage = self.ptSettings.convertToCartesianImage(self.polarImage, masked=True, maxMemory=2 ** 16)
+        np.testing.assert_array_equal(cartesianImage, expected)
+
+        images = np.stack((self.polarImage, self.polarImage[::-1]))
+        cartesianImages = self.ptSettings.convertToCartesianStack(images, order=1, masked=True)
+        np.testing.assert_array_equal(cartesianImages, self.ptSettings.convertToCartesianStack(images, order=1))
+
+    def test_border(self):
+        mask = self.ptSettings.getCartesianMask()
+        expected = self.ptSettings.convertToCartesianImage(self.polarImage, border='nearest')
+        cartesianImage = self.ptSettings.convertToCartesianImage(self.polarImage, border='nearest', borderVal=7,
+                                                                 masked=True)
+
+        np.testing.assert_array_equal(cartesianImage[mask], expected[mask])
+        np.testing.assert_array_equal(cartesianImage[~mask], 7)
+
+    def test_matrix(self):
+        plan = self.ptSettings.createCartesianPlan(order=1, masked=True)
+        unmaskedPlan = self.ptSettings.createCartesianPlan(order=1)
+        self.assertEqual(abs(plan.getMatrix() - unmaskedPlan.getMatrix()).max(), 0)
+
+        image = np.asarray(self.polarImage, dtype=np.float64)
+        np.testing.assert_array_equal(plan.executeMatrix(image), unmaskedPlan.executeMatrix(image))
+
+        cartesianImage = np.random.RandomState(0).rand(*plan.outputSize)
+        np.testing.assert_array_equal(plan.executeMatrix(cartesianImage, adjoint=True),
+                                      unmaskedPlan.executeMatrix(cartesianImage, adjoint=True))
+
+        with self.assertRaises(ValueError):
+            polarTransform.TransformPlan(self.ptSettings, 'polar', masked=True)
+
+    def test_releasedCoordinates(self):
+        # Masked plans do not recompute the coordinate map once a backend that does not use it released it
+        plan = self.ptSettings.createCartesianPlan(order=1, masked=True, backend='matrix')
+        expected = plan.execute(self.polarImage).copy()
+
+        plan._releaseTables('matrix')
+        np.testing.assert_array_equal(plan.execute(self.polarImage), expected)
+        self.assertIsNone(plan._coordinates)
+
+
+class TestPatches(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+
+        # Centers inside the image and near or outside its edges
+        randomState = np.random.RandomState(0)
+        self.centers = np.stack((randomState.randint(-10, 810, 20), randomState.randint(-10, 618, 20)), axis=1)
+
+    def test_default(self):
+        patches, settings = polarTransform.convertToPolarPatches(self.shortAxisApexImage, self.centers,
+                                                                 finalRadius=20)
+
+        # One cartesian pixel apart at the final radius
+        self.assertEqual(patches.shape, (20, 20, int(np.ceil(40 * np.pi))))
+        self.assertEqual(len(settings), 20)
+        np.testing.assert_array_equal(settings[3].center, self.centers[3])
+        self.assertEqual(settings[3].polarImageSize, patches.shape[1:3])
+
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarPatches(self.shortAxisApexImage, self.centers)
+
+        with self.assertRaises(ValueError):
+            polarTransform.convertToPolarPatches(self.shortAxisApexImage, self.centers[0], finalRadius=20)
+
+    def test_patches(self):
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+        arguments = dict(initialRadius=5, finalRadius=30, initialAngle=np.pi / 4, finalAngle=np.pi, radiusSize=40,
+                         angleSize=100)
+
+        for centers in (self.centers, self.centers + 0.25):
+            for order in (0, 1, 3):
+                for border in ('constant', 'nearest', 'reflect'):
+                    patches, settings = polarTransform.convertToPolarPatches(image, centers, order=order,
+                                                                             border=border, batchSize=7, **arguments)
+
+                    for patch, center in zip(patches, centers):
+                        polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=center,
+                                                                                    order=order, border=border,
+                                                                                    **arguments)
+                        np.testing.assert_allclose(patch, polarImage, atol=1e-9)
+
+    def test_multiChannel(self):
+        image = np.dstack((self.shortAxisApexImage, self.shortAxisApexImage[::-1],
+                           self.shortAxisApexImage[:, ::-1]))
+        patches, settings = polarTransform.convertToPolarPatches(image, self.centers, finalRadius=20, order=1)
+        self.assertEqual(patches.shape, (20, 20, int(np.ceil(40 * np.pi)), 3))
+        self.assertEqual(patches.dtype, np.uint8)
+
+        for patch, center in zip(patches, self.centers):
+            polarImage, ptSettings = polarTransform.convertToPolarImage(image, center=center, finalRadius=20,
+                                                                        initialRadius=0, radiusSize=20,
+                                                                        angleSize=patches.shape[2], order=1)
+            np.testing.assert_allclose(patch, polarImage, atol=1)
+
+        out = np.empty_like(patches)
+        result, settings = polarTransform.convertToPolarPatches(image, self.centers, finalRadius=20, order=1, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, patches)
+
+    def test_integerOut(self):
+        # Float images are interpolated in floating point and rounded into an integer output
+        image = np.asarray(self.shortAxisApexImage, dtype=np.float64)
+
+        for order in (0, 1, 3):
+            patches, settings = polarTransform.convertToPolarPatches(image, self.centers, finalRadius=20, order=order)
+
+            out = np.empty(patches.shape, dtype=np.uint8)
+            result, settings = polarTransform.convertToPolarPatches(image, self.centers, finalRadius=20, order=order,
+                                                                    out=out)
+            self.assertIs(result, out)
+            np.testing.assert_array_equal(out, np.clip(np.trunc(patches + 0.5), 0, 255))
+
+
+class TestPolarGrid(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        polarTransform.setCacheSize(256 * 1024 ** 2)
+
+    def tearDown(self):
+        polarTransform.setCacheSize(0)
+        polarTransform.clearCache()
+
+    def test_shared(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    finalRadius=200, radiusSize=200)
+        polarImage2, ptSettings2 = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[300.25, 200.5],
+                                                                      finalRadius=200, radiusSize=200)
+
+        # Same grid for any center, including fractional centers
+        grid = polarTransform._getPolarGrid(ptSettings)
+        self.assertIs(polarTransform._getPolarGrid(ptSettings2), grid)
+        self.assertFalse(grid.flags.writeable)
+        self.assertIsNot(polarTransform._getPolarGrid(ptSettings, np.float32), grid)
+
+        coordinates = polarTransform._getPolarImageCoordinates(ptSettings2)
+        np.testing.assert_array_equal(coordinates[0], grid[0] + 200.5)
+        np.testing.assert_array_equal(coordinates[1], grid[1] + 300.25)
+
+        # Other radii, angles or sizes use another grid
+        polarImage3, ptSettings3 = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                      finalRadius=200, radiusSize=200,
+                                                                      finalAngle=np.pi)
+        self.assertIsNot(polarTransform._getPolarGrid(ptSettings3), grid)
+
+        polarTransform.clearCache()
+        self.assertIsNot(polarTransform._getPolarGrid(ptSettings), grid)
+        np.testing.assert_array_equal(polarTransform._getPolarGrid(ptSettings), grid)
+
+    def test_cacheSize(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401, 365],
+                                                                    finalRadius=200, radiusSize=200)
+        grid = polarTransform._getPolarGrid(ptSettings)
+
+        # Grids are not kept while the plan cache is disabled
+        polarTransform.setCacheSize(0)
+        self.assertEqual(polarTransform._gridCache.info().count, 0)
+        grid2 = polarTransform._getPolarGrid(ptSettings)
+        self.assertIsNot(grid2, grid)
+        self.assertIsNot(polarTransform._getPolarGrid(ptSettings), grid2)
+        np.testing.assert_array_equal(grid2, grid)
+
+        # Grids larger than the plan cache are not kept either
+        polarTransform.setCacheSize(grid.nbytes - 1)
+        polarTransform._getPolarGrid(ptSettings)
+        self.assertEqual(polarTransform._gridCache.info().count, 0)
+
+        polarTransform.setCacheSize(grid.nbytes)
+        grid3 = polarTransform._getPolarGrid(ptSettings)
+        self.assertIs(polarTransform._getPolarGrid(ptSettings), grid3)
+        self.assertEqual(polarTransform._gridCache.info().currentBytes, grid.nbytes)
+
+    def test_tiles(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401.5, 365.5])
+
+        # Tiles calculate their part of the grid, which is the same as the part of the entire grid
+        coordinates = polarTransform._getPolarImageCoordinates(ptSettings)
+        tile = polarTransform._getPolarImageCoordinates(ptSettings, slice(10, 50), slice(100, 300))
+        np.testing.assert_array_equal(tile, coordinates[:, 10:50, 100:300])
+
+
+class TestSaveLoad(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempDir.name, 'transform')
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_roundTrip(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, center=[401.5, 365],
+                                                                    finalRadius=300)
+        ptSettings.save(self.path)
+        self.assertEqual(sorted(os.listdir(self.path)),
+                         ['cartesianCoordinates.npy', 'polarCoordinates.npy', 'transform.json'])
+
+        for mmap in (True, False):
+            loadedSettings = polarTransform.ImageTransform.load(self.path, mmap=mmap)
+            np.testing.assert_array_equal(loadedSettings.center, ptSettings.center)
+            self.assertEqual(loadedSettings.finalRadius, ptSettings.finalRadius)
+            self.assertEqual(loadedSettings.polarImageSize, tuple(ptSettings.polarImageSize))
+            self.assertEqual(loadedSettings.cartesianImageSize, tuple(ptSettings.cartesianImageSize))
+
+            for order in (0, 1, 3):
+                np.testing.assert_array_equal(loadedSettings.convertToPolarImage(self.shortAxisApexImage, order=order),
+                                              ptSettings.convertToPolarImage(self.shortAxisApexImage, order=order))
+                np.testing.assert_array_equal(loadedSettings.convertToCartesianImage(polarImage, order=order),
+                                              ptSettings.convertToCartesianImage(polarImage, order=order))
+
+        # Plans that do not offset the coordinates use the memory-mapped maps directly
+        plan = polarTransform.ImageTransform.load(self.path).createCartesianPlan(order=1)
+        plan.execute(polarImage)
+        self.assertIsInstance(plan._coordinates, np.memmap)
+        self.assertFalse(plan._coordinates.flags.writeable)
+
+    def test_precision(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+        ptSettings.save(self.path, precision='float32')
+
+        loadedSettings = polarTransform.ImageTransform.load(self.path)
+        plan = loadedSettings.createPolarPlan(order=0, precision='float32')
+        plan.execute(self.shortAxisApexImage)
+        self.assertIsInstance(plan._coordinates, np.memmap)
+
+        # Other precisions and settings changed in place calculate the coordinates
+        plan = loadedSettings.createPolarPlan(order=0)
+        plan.execute(self.shortAxisApexImage)
+        self.assertNotIsInstance(plan._coordinates, np.memmap)
+
+        loadedSettings.finalRadius = 100
+        plan = loadedSettings.createPolarPlan(order=0, precision='float32')
+        plan.execute(self.shortAxisApexImage)
+        self.assertNotIsInstance(plan._coordinates, np.memmap)
+
+    def test_stale(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage)
+        ptSettings.save(self.path)
+
+        with open(os.path.join(self.path, 'transform.json'), 'r') as file:
+            metadata = json.load(file)
+
+        # Settings that do not match the hash
+        metadata['settings']['finalRadius'] += 1
+        with open(os.path.join(self.path, 'transform.json'), 'w') as file:
+            json.dump(metadata, file)
+
+        with self.assertRaises(ValueError):
+            polarTransform.ImageTransform.load(self.path)
+
+        # Older file format
+        metadata['settings']['finalRadius'] -= 1
+        metadata['format'] = 0
+        with open(os.path.join(self.path, 'transform.json'), 'w') as file:
+            json.dump(metadata, file)
+
+        with self.assertRaises(ValueError):
+            polarTransform.ImageTransform.load(self.path)
+
+        # Map that does not match the settings
+        ptSettings.save(self.path)
+        np.save(os.path.join(self.path, 'polarCoordinates.npy'), np.zeros((2, 3, 4)))
+
+        with self.assertRaises(ValueError):
+            polarTransform.ImageTransform.load(self.path)
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.shortAxisApexImage = loadImage('shortAxisApex.png')
+        self.verticalLinesImage = loadImage('verticalLines.png')
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.inputPath = os.path.join(self.tempDir.name, 'input')
+        self.outputPath = os.path.join(self.tempDir.name, 'output')
+
+        os.makedirs(self.inputPath)
+        np.save(os.path.join(self.inputPath, 'shortAxisApex.npy'), self.shortAxisApexImage)
+        np.save(os.path.join(self.inputPath, 'verticalLines.npy'), self.verticalLinesImage)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def runMain(self, *args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = polarTransform.main(list(args))
+
+        return status, output.getvalue()
+
+    def test_polar(self):
+        status, output = self.runMain(self.inputPath, '-o', self.outputPath, '-j', '2', '--order', '1',
+                                      '--final-radius', '200')
+        self.assertEqual(status, 0)
+        self.assertIn('Converted 2 files (2 images', output)
+        self.assertIn('skipped 0 and failed 0', output)
+
+        for name, image in (('shortAxisApex', self.shortAxisApexImage), ('verticalLines', self.verticalLinesImage)):
+            polarImage, ptSettings = polarTransform.convertToPolarImage(image, finalRadius=200, order=1)
+            np.testing.assert_array_equal(np.load(os.path.join(self.outputPath, name + '.npy')), polarImage)
+
+        # Converted files are skipped when the conversion is run again unless they are overwritten
+        status, output = self.runMain(os.path.join(self.inputPath, '*.npy'), '-o', self.outputPath, '-j', '2')
+        self.assertEqual(status, 0)
+        self.assertIn('Converted 0 files (0 images, 0.0 megapixels)', output)
+        self.assertIn('skipped 2', output)
+
+        os.remove(os.path.join(self.outputPath, 'verticalLines.npy'))
+        status, output = self.runMain(os.path.join(self.inputPath, '*.npy'), '-o', self.outputPath, '-j', '2')
+        self.assertIn('Converted 1 files (1 images', output)
+        self.assertIn('skipped 1', output)
+        self.assertEqual(sorted(os.listdir(self.outputPath)), ['shortAxisApex.npy', 'verticalLines.npy'])
+
+    def test_inputs(self):
+        # Files matched by more than one input are converted once, in the order they are first matched
+        files = polarTransform._findInputFiles([os.path.join(self.inputPath, 'verticalLines.npy'), self.inputPath,
+                                                os.path.join(self.inputPath, '*.npy')])
+        self.assertEqual(files, [os.path.join(self.inputPath, 'verticalLines.npy'),
+                                 os.path.join(self.inputPath, 'shortAxisApex.npy')])
+
+    def test_stack(self):
+        images = np.stack([self.verticalLinesImage[..., 0]] * 3)
+        np.save(os.path.join(self.inputPath, 'stack.npy'), images)
+
+        status, output = self.runMain(os.path.join(self.inputPath, 'stack.npy'), '-o', self.outputPath, '--stack',
+                                      '--center', '200', '150', '--radius-size', '100', '--angle-size', '120')
+        self.assertEqual(status, 0)
+        self.assertIn('Converted 1 files (3 images, 0.0 megapixels)', output)
+
+        polarImages, ptSettings = polarTransform.convertToPolarStack(images, center=[200, 150], radiusSize=100,
+                                                                     angleSize=120)
+        np.testing.assert_array_equal(np.load(os.path.join(self.outputPath, 'stack.npy')), polarImages)
+
+    def test_transform(self):
+        polarImage, ptSettings = polarTransform.convertToPolarImage(self.shortAxisApexImage, finalRadius=200)
+        ptSettings.save(os.path.join(self.tempDir.name, 'transform'))
+        np.save(os.path.join(self.inputPath, 'polar.npy'), polarImage)
+
+        status, output = self.runMain(os.path.join(self.inputPath, 'polar.npy'), '-o', self.outputPath, '-d',
+                                      'cartesian', '--transform', os.path.join(self.tempDir.name, 'transform'))
+        self.assertEqual(status, 0)
+        np.testing.assert_array_equal(np.load(os.path.join(self.outputPath, 'polar.npy')),
+                                      ptSettings.convertToCartesianImage(polarImage))
+
+    def test_failed(self):
+        np.save(os.path.join(self.inputPath, 'empty.npy'), np.zeros((0, 5)))
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            status, output = self.runMain(self.inputPath, '-o', self.outputPath, '-j', '2', '--order', '1')
+
+        self.assertEqual(status, 1)
+        self.assertIn('Failed to convert %s' % os.path.join(self.inputPath, 'empty.npy'), stderr.getvalue())
+        self.assertIn('Converted 2 files (2 images', output)
+        self.assertIn('failed 1', output)
+        self.assertEqual(sorted(os.listdir(self.outputPath)), ['shortAxisApex.npy', 'verticalLines.npy'])
+
+    def test_invalid(self):
+        for args in ([self.inputPath, '-o', self.outputPath, '--image-size', '10', '10'],
+                     [self.inputPath, '-o', self.outputPath, '-d', 'cartesian', '--sizing', 'nyquist'],
+                     [self.inputPath, '-o', self.outputPath, '--transform', self.tempDir.name, '--center', '1', '2'],
+                     [self.inputPath, '-o', self.inputPath],
+                     [os.path.join(self.inputPath, '*.png'), '-o', self.outputPath]):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                polarTransform.main(args)
+
+
 if __name__ == '__main__':
     unittest.main()